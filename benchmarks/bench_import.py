@@ -0,0 +1,61 @@
+"""
+Import time of plisio, measured in fresh interpreters.
+
+Run with `python benchmarks/bench_import.py [runs]`. Prints the median wall time of each import statement minus the
+median start-up time of a bare interpreter.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+STATEMENTS = [
+    "import plisio",
+    "from plisio import Client",
+    "from plisio import AsyncClient",
+    "import requests",
+    "import aiohttp",
+]
+
+
+def measure(statement: str, runs: int) -> float:
+    """
+    Measure the median wall time of a fresh interpreter running a statement.
+
+    Args:
+        statement (str): Statement.
+        runs (int): Number of runs.
+
+    Returns:
+        float: Median time in milliseconds.
+    """
+
+    env = {**os.environ, "PYTHONPATH": SRC}
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], env=env, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    """
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    baseline = measure("pass", runs)
+    print(f"{'interpreter start-up':<36}{baseline:8.1f} ms")
+
+    for statement in STATEMENTS:
+        print(f"{statement:<36}{measure(statement, runs) - baseline:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
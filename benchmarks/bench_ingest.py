@@ -0,0 +1,107 @@
+"""
+Load test of `WebhookIngestor` behind aiohttp, fed by a local stand-in for Plisio.
+
+Run with `python benchmarks/bench_ingest.py [callbacks] [concurrency]`. Sends signed JSON callbacks, 10% of them
+duplicates, over keep-alive connections. The consumer handles batches with a simulated 5 ms write. Prints the
+acknowledgement rate and latency, the time to drain the queue and the ingestor counters.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from aiohttp import ClientSession, TCPConnector, web  # noqa: E402  pylint: disable=wrong-import-position
+
+from plisio.webhooks import WebhookIngestor, WebhookVerifier  # noqa: E402  pylint: disable=wrong-import-position
+
+API_KEY = "k" * 64
+
+
+def build_bodies(count: int) -> list:
+    """
+    Build signed callback bodies, every tenth one a copy of the previous callback.
+
+    Args:
+        count (int): Number of callbacks.
+
+    Returns:
+        list: Bodies.
+    """
+
+    verifier = WebhookVerifier(API_KEY)
+    bodies = []
+    for index in range(count):
+        number = index - 1 if index % 10 == 9 else index
+        payload = {"txn_id": f"{number:024x}", "status": "completed", "amount": "0.001", "currency": "BTC"}
+        payload["verify_hash"] = verifier.sign_json(payload)
+        bodies.append(json.dumps(payload).encode())
+
+    return bodies
+
+
+async def main(count: int, concurrency: int) -> None:
+    """
+    Run the load test.
+
+    Args:
+        count (int): Number of callbacks.
+        concurrency (int): Number of callbacks in flight.
+    """
+
+    ingestor = WebhookIngestor(API_KEY)
+
+    async def handler(batch: list) -> None:
+        await asyncio.sleep(0.005)
+
+    app = web.Application()
+    app.router.add_post("/plisio", ingestor.aiohttp_handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # pylint: disable=protected-access
+
+    consumers = ingestor.start(handler, workers=2, max_batch=200)
+    bodies = iter(build_bodies(count))
+    latencies = []
+    statuses: dict = {}
+
+    async def send(session: ClientSession) -> None:
+        for body in bodies:
+            started = time.perf_counter()
+            async with session.post(
+                f"http://127.0.0.1:{port}/plisio", data=body, headers={"Content-Type": "application/json"}
+            ) as response:
+                await response.read()
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+
+    started = time.perf_counter()
+    async with ClientSession(connector=TCPConnector(limit=concurrency)) as session:
+        await asyncio.gather(*(send(session) for _ in range(concurrency)))
+    sent = time.perf_counter() - started
+    await ingestor.queue.join()
+    drained = time.perf_counter() - started
+
+    for consumer in consumers:
+        consumer.cancel()
+    await runner.cleanup()
+
+    latencies.sort()
+    print(f"callbacks         {count} ({concurrency} in flight)")
+    print(f"acknowledged      {count / sent:,.0f} /s, statuses {statuses}")
+    print(
+        f"ack latency       p50 {statistics.median(latencies) * 1000:.2f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms"
+    )
+    print(f"drained after     {drained:.2f} s")
+    print(f"counters          {ingestor.metrics.snapshot()['counters']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000, int(sys.argv[2]) if len(sys.argv) > 2 else 50))
@@ -0,0 +1,110 @@
+"""
+Per-request overhead of building request kwargs with a percent-encoded query string.
+
+Run with `python benchmarks/bench_query.py [number]`. Compares `BaseClient._get_request_kwargs` with the string
+concatenation loop it replaced (which did not percent-encode at all) on the parameters of a typical invoice and
+transaction list call.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from plisio import Client  # noqa: E402  pylint: disable=wrong-import-position
+from plisio.enums import Currencies, Methods, TransactionStatus  # noqa: E402  pylint: disable=wrong-import-position
+
+API_KEY = "k" * 64
+
+CASES = {
+    "invoice": {
+        "order_name": "Order #1234 & gift wrap",
+        "order_number": "1234",
+        "currency": Currencies.BTC,
+        "amount": "0.00125",
+        "callback_url": "https://shop.example/plisio/callback?json=true",
+        "email": "buyer@example.com",
+        "language": "en_US",
+        "description": "Two items",
+    },
+    "transactions": {
+        "page": 3,
+        "limit": 100,
+        "status": TransactionStatus.COMPLETED,
+        "currency": Currencies.USDT_TRX,
+        "search": "order 1234",
+    },
+}
+
+
+def legacy_request_kwargs(method, force_params=False, requests_params=None, **kwargs):  # type: ignore
+    """
+    Build request kwargs the way the client did before `encode_query`.
+
+    Args:
+        method (Methods): Method.
+        force_params (bool): Force params.
+        requests_params (dict): Client-wide request params.
+        **kwargs: Keyword arguments.
+
+    Returns:
+        dict: Request kwargs.
+    """
+
+    kwargs["timeout"] = 10
+
+    if requests_params:
+        kwargs.update(requests_params)
+
+    data = kwargs.pop("data", None)
+    data.update({"api_key": API_KEY})
+
+    if data and isinstance(data, dict):
+        kwargs["data"] = data
+
+        if "requests_params" in kwargs["data"]:
+            kwargs.update(kwargs["data"]["requests_params"])
+            del kwargs["data"]["requests_params"]
+
+    if data and (str(method).upper() == Methods.GET or force_params):
+        query = ""
+        for item in kwargs["data"].items():
+            value = ",".join(item[1]) if isinstance(item[1], list) else str(item[1])
+            query += f"{item[0]}={value}&"
+
+        kwargs["params"] = query.rstrip("&")
+        del kwargs["data"]
+
+    return kwargs
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    """
+
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    client = Client(API_KEY)
+
+    for name, params in CASES.items():
+        legacy = min(
+            timeit.repeat(lambda: legacy_request_kwargs(Methods.GET, True, data=dict(params)), number=number, repeat=5)
+        )
+        current = min(
+            timeit.repeat(
+                lambda: client._get_request_kwargs(Methods.GET, True, data=params),  # pylint: disable=protected-access
+                number=number,
+                repeat=5,
+            )
+        )
+        print(
+            f"{name:<14}legacy {legacy / number * 1e6:6.2f} us   current {current / number * 1e6:6.2f} us"
+            f"   ({legacy / current:.2f}x)"
+        )
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Throughput of callback verification.
+
+Run with `python benchmarks/bench_webhooks.py [number]`. Verifies a typical invoice callback, parsed and raw, in
+both variants, with a long-lived `WebhookVerifier` and with `verify_callback`, which keys a new HMAC every call.
+"""
+
+import os
+import sys
+import timeit
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from plisio.codecs import default_codec  # noqa: E402  pylint: disable=wrong-import-position
+from plisio.webhooks import WebhookVerifier, verify_callback  # noqa: E402  pylint: disable=wrong-import-position
+
+API_KEY = "k" * 64
+
+PAYLOAD = {
+    "txn_id": "6470c20600b6719c3f063d59",
+    "ipn_type": "invoice",
+    "merchant": "Shop",
+    "merchant_id": "6470c1e400b6719c3f063d4e",
+    "amount": "0.00125000",
+    "currency": "BTC",
+    "order_number": "1234",
+    "order_name": "Order #1234",
+    "confirmations": "2",
+    "status": "completed",
+    "source_currency": "USD",
+    "source_amount": "35.00",
+    "source_rate": "28000.00",
+    "comment": "Plisio API",
+    "psys_cid": "BTC",
+    "expire_utc": 1685177558,
+    "tx_urls": "https://blockchair.com/bitcoin/transaction/0123456789abcdef",
+}
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    """
+
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    verifier = WebhookVerifier(API_KEY, loads=default_codec().loads)
+
+    json_payload = {**PAYLOAD, "verify_hash": verifier.sign_json(PAYLOAD)}
+    form_payload = {key: str(value) for key, value in PAYLOAD.items()}
+    form_payload["verify_hash"] = verifier.sign_form(form_payload)
+    json_body = default_codec().dumps(json_payload)
+    form_body = urlencode(form_payload).encode()
+
+    assert verifier.verify(json_payload) and verifier.verify(form_payload, json=False)
+    assert verifier.parse(json_body, "application/json") and verifier.parse(form_body)
+
+    cases = {
+        "verify JSON (verifier)": lambda: verifier.verify(json_payload),
+        "verify JSON (verify_callback)": lambda: verify_callback(API_KEY, json_payload),
+        "verify form (verifier)": lambda: verifier.verify(form_payload, json=False),
+        "parse raw JSON body": lambda: verifier.parse(json_body, "application/json"),
+        "parse raw form body": lambda: verifier.parse(form_body, "application/x-www-form-urlencoded"),
+    }
+
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{name:<32}{best * 1e6:8.2f} us   {1 / best:10,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
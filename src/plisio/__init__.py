@@ -2,11 +2,50 @@
 Plisio Python SDK.
 """
 
-from .clients import Client, AsyncClient
+from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING
+
 from ._meta import __version__
 
+if _TYPE_CHECKING:
+    from .clients import Client, AsyncClient
+
 __all__ = [
     "Client",
     "AsyncClient",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> _Any:
+    """
+    Import clients on first access, so `from plisio import Client` does not import aiohttp.
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+
+    if name not in ("Client", "AsyncClient"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import clients  # pylint: disable=import-outside-toplevel
+
+    value = getattr(clients, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:  # type: ignore[type-arg]
+    """
+    List module attributes, including the lazily imported ones.
+
+    Returns:
+        list: Attribute names.
+    """
+
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,135 @@
+"""
+Request coalescing for plisio clients.
+
+Concurrent calls sharing a key are collapsed into one: the first caller runs the function,
+the others wait for it and receive the same result or exception.
+"""
+
+import asyncio as _asyncio
+from threading import (
+    Event as _Event,
+    Lock as _Lock,
+)
+from typing import (
+    Any as _Any,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    Dict as _Dict,
+    Hashable as _Hashable,
+    Optional as _Optional,
+)
+
+
+class _Call:
+    """
+    In-flight call shared by the callers of a key.
+    """
+
+    __slots__ = ("event", "result", "exception")
+
+    def __init__(self) -> None:
+        """
+        Initialize call.
+        """
+
+        self.event = _Event()
+        self.result: _Any = None
+        self.exception: _Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe call coalescing.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize group.
+        """
+
+        self._lock = _Lock()
+        self._calls: _Dict[_Hashable, _Call] = {}
+
+    def do(self, key: _Hashable, func: _Callable[[], _Any]) -> _Any:  # pylint: disable=invalid-name
+        """
+        Run `func` unless a call with the same key is already in flight, in which case wait for it.
+
+        Args:
+            key (Hashable): Call key.
+            func (Callable): Function to run.
+
+        Returns:
+            Any: Result of the (shared) call.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.exception = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Call coalescing for coroutines running on one event loop.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize group.
+        """
+
+        self._calls: _Dict[_Hashable, "_asyncio.Future[_Any]"] = {}
+
+    async def do(self, key: _Hashable, func: _Callable[[], _Awaitable[_Any]]) -> _Any:  # pylint: disable=invalid-name
+        """
+        Await `func()` unless a call with the same key is already in flight, in which case wait for it.
+
+        The shared call is shielded, so a cancelled caller does not cancel it for the others.
+
+        Args:
+            key (Hashable): Call key.
+            func (Callable): Coroutine function to run.
+
+        Returns:
+            Any: Result of the (shared) call.
+        """
+
+        future = self._calls.get(key)
+
+        if future is None:
+            future = _asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+
+        return await _asyncio.shield(future)
+
+    def _forget(self, key: _Hashable, future: "_asyncio.Future[_Any]") -> None:
+        """
+        Remove a finished call.
+
+        Args:
+            key (Hashable): Call key.
+            future (Future): Finished call.
+        """
+
+        if self._calls.get(key) is future:
+            del self._calls[key]
@@ -0,0 +1,241 @@
+"""
+Incremental JSON parsing of large arrays in response bodies.
+"""
+
+import re as _re
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    List as _List,
+    Optional as _Optional,
+    Union as _Union,
+)
+
+from . import exceptions as _e
+
+_TOKEN = _re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*("?)|[{}\[\]]', _re.DOTALL)
+"""A whole string (the group is empty if it is not terminated yet) or a bracket."""
+
+_BEFORE, _ARRAY, _AFTER = range(3)
+
+_RUN_ATTEMPTS = 3
+"""Closing braces tried as the end of a run before falling back to scanning."""
+
+
+class ArrayStream:
+    """
+    Incremental parser yielding the objects of one array of a JSON document, e.g. `data.operations`.
+
+    Only the object being received and the document without the array are kept in memory. Inside the array
+    the complete objects of a chunk are decoded at once by the decoder, the rest is scanned by jumping between
+    strings and brackets.
+    """
+
+    def __init__(self, key: str, loads: _Callable[[_Union[bytes, str]], _Any]):
+        """
+        Initialize parser.
+
+        Args:
+            key (str): Key of the array, the first array under this key is streamed.
+            loads (Callable): JSON decoder of the objects and of the rest of the document.
+        """
+
+        self._key = key.encode("utf-8")
+        self._loads = loads
+        self._buf = bytearray()
+        self._pos = 0
+        self._flushed = 0
+        self._depth = 0
+        self._phase = _BEFORE
+        self._array_depth = 0
+        self._candidate = False
+        self._item_start = -1
+        self._rest = bytearray()
+
+    def feed(self, chunk: bytes) -> _List[_Any]:
+        """
+        Parse a chunk of the document.
+
+        Args:
+            chunk (bytes): Chunk.
+
+        Returns:
+            list: Objects of the array completed by this chunk.
+
+        Raises:
+            PlisioRequestException: If an object of the array is invalid.
+        """
+
+        self._buf += chunk
+
+        items = self._decode_run() if self._phase == _ARRAY else []
+        items += self._scan()
+
+        self._compact()
+        return items
+
+    def _decode_run(self) -> _List[_Any]:
+        """
+        Decode the complete objects at the start of the buffer with a single call of the decoder.
+
+        The run is cut at one of the last closing braces of the buffer. The cut is right if and only if the run
+        decodes, since a cut inside a string or a nested object leaves it invalid.
+
+        Returns:
+            list: Decoded objects, empty if no cut decoded.
+        """
+
+        buf = self._buf
+        start = self._item_start if self._item_start >= 0 else self._pos
+        end = len(buf)
+
+        for _ in range(_RUN_ATTEMPTS):
+            end = buf.rfind(b"}", start, end)
+            if end < 0:
+                break
+
+            run = bytes(buf[start : end + 1]).lstrip(b", \t\r\n")  # noqa: E203
+            try:
+                items: _List[_Any] = self._loads(b"[" + run + b"]")
+            except Exception:  # pylint: disable=broad-except
+                continue
+
+            self._pos = end + 1
+            self._depth = self._array_depth
+            self._item_start = -1
+            return items
+
+        return []
+
+    def _scan(self) -> _List[_Any]:
+        """
+        Scan the buffer token by token.
+
+        Returns:
+            list: Objects of the array completed in the scanned part.
+
+        Raises:
+            PlisioRequestException: If an object of the array is invalid.
+        """
+
+        buf = self._buf
+        pos = self._pos
+        first = self._item_start
+        last = -1
+
+        while True:
+            match = _TOKEN.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+
+            index = match.start()
+            char = buf[index]
+
+            if char == 0x22:  # "
+                if not match.group(1):
+                    pos = index
+                    break
+                pos = match.end()
+                if self._phase == _BEFORE:
+                    self._candidate = buf[index + 1 : pos - 1] == self._key  # noqa: E203
+                continue
+
+            pos = index + 1
+            if char in (0x7B, 0x5B):  # { [
+                if self._phase == _BEFORE and char == 0x5B and self._candidate:
+                    self._phase = _ARRAY
+                    self._array_depth = self._depth + 1
+                    self._rest += buf[self._flushed : pos]  # noqa: E203
+                elif self._phase == _ARRAY and char == 0x7B and self._depth == self._array_depth:
+                    if first < 0:
+                        first = index
+                    self._item_start = index
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._phase == _ARRAY:
+                    if char == 0x7D and self._depth == self._array_depth and self._item_start >= 0:
+                        last = pos
+                        self._item_start = -1
+                    elif char == 0x5D and self._depth == self._array_depth - 1:
+                        self._phase = _AFTER
+                        self._flushed = index
+
+            self._candidate = False
+
+        self._pos = pos
+        if last < 0:
+            return []
+
+        try:
+            items: _List[_Any] = self._loads(b"[" + buf[first:last] + b"]")
+        except ValueError as exc:
+            text = bytes(buf[first : first + 200]).decode("utf-8", errors="replace")  # noqa: E203
+            raise _e.PlisioRequestException(f"Invalid JSON response: {text}") from exc
+
+        return items
+
+    def _compact(self) -> None:
+        """
+        Drop the scanned bytes that are no longer needed.
+        """
+
+        if self._phase != _ARRAY:
+            self._rest += self._buf[self._flushed : self._pos]  # noqa: E203
+            self._flushed = self._pos
+
+        keep = self._pos
+        if self._item_start >= 0:
+            keep = min(keep, self._item_start)
+
+        if keep:
+            del self._buf[:keep]
+            self._pos -= keep
+            self._flushed = max(0, self._flushed - keep)
+            if self._item_start >= 0:
+                self._item_start -= keep
+
+    def close(self) -> _Any:
+        """
+        Finish parsing.
+
+        Returns:
+            Any: The document with the streamed array left empty.
+
+        Raises:
+            PlisioRequestException: If the document is incomplete or invalid.
+        """
+
+        if self._phase == _ARRAY or self._depth or self._pos < len(self._buf):
+            raise _e.PlisioRequestException("Incomplete JSON response")
+
+        try:
+            return self._loads(bytes(self._rest))
+        except ValueError as exc:
+            text = bytes(self._rest[:200]).decode("utf-8", errors="replace")
+            raise _e.PlisioRequestException(f"Invalid JSON response: {text}") from exc
+
+    @property
+    def found(self) -> bool:
+        """
+        Whether the array was found.
+
+        Returns:
+            bool: `True` once the array started.
+        """
+
+        return self._phase != _BEFORE
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"<{self.__class__.__name__} key={self._key!r}>"
+
+
+OptionalArrayStream = _Optional[ArrayStream]
@@ -3,29 +3,50 @@ Types for plisio.
 """
 
 from typing import (
+    Any as _Any,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    IO as _IO,
     Union as _Union,
     Dict as _Dict,
     Literal as _Literal,
     Optional as _Optional,
     List as _List,
+    Tuple as _Tuple,
+    FrozenSet as _FrozenSet,
+    Type as _Type,
+    TYPE_CHECKING as _TYPE_CHECKING,
 )
 
-from aiohttp import (
-    ClientSession as AsyncRequestSession,
-    ClientResponse as AsyncRequestResponse,
-)
+from importlib import import_module as _import_module
 
-from requests import (
-    Session as SyncRequestSession,
-    Response as SyncRequestResponse,
-)
+from . import enums as _enums
 
-from pydantic import (  # pylint: disable=no-name-in-module
-    HttpUrl as _HttpUrl,
-    EmailStr as _EmailStr,
-)
+if _TYPE_CHECKING:
+    from aiohttp import (
+        ClientSession as AsyncRequestSession,
+        ClientResponse as AsyncRequestResponse,
+        TCPConnector as AsyncConnector,
+    )
+    from requests import (
+        Session as SyncRequestSession,
+        Response as SyncRequestResponse,
+    )
+    from pydantic import (  # pylint: disable=no-name-in-module
+        HttpUrl as Link,
+        EmailStr as Email,
+    )
 
-from . import enums as _enums
+    from .cache import TTLCache
+    from .codecs import Codec
+    from .circuit import CircuitBreaker
+    from .hedging import HedgePolicy
+    from .idempotency import IdempotencyStore
+    from .metrics import Metrics
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .timeouts import Timeout
+    from .transports import AsyncTransport, Transport, TransportResponse
 
 Text = _Union[str]
 
@@ -35,21 +56,52 @@ ListNumberLike = _List[NumberLike]
 OptionalListNumberLike = _Optional[ListNumberLike]
 
 DictStrAny = _Dict[Text, _Union[Text, int, float, bool, None]]
+DictAny = _Dict[Text, _Any]
+DictStrInt = _Dict[Text, int]
+ListDictAny = _List[DictAny]
+ExportSink = _Union[_Callable[[ListDictAny], _Any], _IO[str]]
 ListStr = _List[Text]
 OptionalListStr = _Optional[ListStr]
+Payout = _Tuple[Text, NumberLike]
 
 OptionalText = _Optional[Text]
 OptionalBool = _Optional[bool]
 OptionalNumber = _Optional[Number]
+OptionalInt = _Optional[int]
 OptionalNumberLike = _Optional[NumberLike]
 
-Session = _Union[AsyncRequestSession, SyncRequestSession]
-Response = _Union[AsyncRequestResponse, SyncRequestResponse]
+Session = _Union["AsyncRequestSession", "SyncRequestSession"]
+OptionalAsyncConnector = _Optional["AsyncConnector"]
+Response = _Union["AsyncRequestResponse", "SyncRequestResponse", "TransportResponse"]
 RequestParams = _Optional[_Dict[str, _Union[Text, Number, DictStrAny]]]
 
 Headers = _Dict[Text, Text]
 
+EndpointMap = _Dict[Text, Number]
+OptionalEndpointMap = _Optional[EndpointMap]
+OptionalTTLCache = _Optional["TTLCache"]
+CacheKey = _Tuple[Text, Text]
+FrozenSetStr = _FrozenSet[Text]
+ExceptionTypes = _Tuple[_Type[BaseException], ...]
+OptionalMetrics = _Optional["Metrics"]
+OptionalRateLimiter = _Optional["RateLimiter"]
+OptionalCircuitBreaker = _Optional["CircuitBreaker"]
+OptionalHedgePolicy = _Optional["HedgePolicy"]
+OptionalIdempotencyStore = _Optional["IdempotencyStore"]
+OptionalBaseException = _Optional[BaseException]
+OptionalRetryPolicy = _Optional["RetryPolicy"]
+OptionalTimeout = _Optional["Timeout"]
+TimeoutLike = _Union["Timeout", float]
+OptionalTimeoutLike = _Optional[TimeoutLike]
+OptionalEndpointTimeouts = _Optional[_Dict[Text, TimeoutLike]]
+OptionalCodec = _Optional["Codec"]
+JSONLoads = _Callable[[_Union[bytes, str]], _Any]
+OptionalTransport = _Optional["Transport"]
+OptionalAsyncTransport = _Optional["AsyncTransport"]
+AnyTransport = _Union["Transport", "AsyncTransport"]
+
 Result = DictStrAny
+AwaitableResult = _Awaitable[Result]
 
 Methods = _Union[
     _Literal["GET"],
@@ -257,11 +309,8 @@ OptionalFiats = _Optional[Fiats]
 PsysCids = _List[Currencies]
 OptionalPsysCids = _Optional[PsysCids]
 
-Link = _HttpUrl
-OptionalLink = _Optional[Link]
-
-Email = _EmailStr
-OptionalEmail = _Optional[Email]
+OptionalLink = _Optional["Link"]
+OptionalEmail = _Optional["Email"]
 
 _TransactionType = _Literal[
     "cash_in",
@@ -291,3 +340,36 @@ _FeePlans = _Literal[
 ]
 FeePlans = _Union[_enums.FeePlans, _FeePlans]
 OptionalFeePlans = _Optional[FeePlans]
+
+_LAZY_ALIASES = {
+    "AsyncRequestSession": ("aiohttp", "ClientSession"),
+    "AsyncRequestResponse": ("aiohttp", "ClientResponse"),
+    "AsyncConnector": ("aiohttp", "TCPConnector"),
+    "SyncRequestSession": ("requests", "Session"),
+    "SyncRequestResponse": ("requests", "Response"),
+    "Link": ("pydantic", "HttpUrl"),
+    "Email": ("pydantic", "EmailStr"),
+}
+
+
+def __getattr__(name: str) -> _Any:
+    """
+    Resolve aliases of third-party types on first access, so importing plisio does not import their packages.
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+
+    if name not in _LAZY_ALIASES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module, attr = _LAZY_ALIASES[name]
+    value = getattr(_import_module(module), attr)
+    globals()[name] = value
+    return value
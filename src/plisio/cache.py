@@ -0,0 +1,157 @@
+"""
+Response cache for plisio clients.
+"""
+
+from collections import OrderedDict as _OrderedDict
+from threading import Lock as _Lock
+from time import monotonic as _monotonic
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Dict as _Dict,
+    Hashable as _Hashable,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+__all__ = ["TTLCache", "MISSING"]
+
+MISSING = object()
+"""Sentinel returned by `TTLCache.get` on a miss."""
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry time-to-live.
+
+    Entries are evicted when they expire or, once `maxsize` is reached, in least recently used order.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0, timer: _Callable[[], float] = _monotonic):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize (int): Maximum number of entries.
+            ttl (float): Default time-to-live in seconds.
+            timer (Callable): Monotonic clock.
+
+        Raises:
+            ValueError: If `maxsize` is lower than 1.
+        """
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._lock = _Lock()
+        self._data: "_OrderedDict[_Hashable, _Tuple[float, _Any]]" = _OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        Get number of entries, including expired ones not yet evicted.
+
+        Returns:
+            int: Number of entries.
+        """
+
+        return len(self._data)
+
+    def get(self, key: _Hashable) -> _Any:
+        """
+        Get a value.
+
+        Args:
+            key (Hashable): Key.
+
+        Returns:
+            Any: Cached value, or `MISSING` if absent or expired.
+        """
+
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None or entry[0] <= self._timer():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: _Hashable, value: _Any, ttl: _Optional[float] = None) -> None:
+        """
+        Set a value.
+
+        Args:
+            key (Hashable): Key.
+            value (Any): Value.
+            ttl (float): Time-to-live in seconds, defaults to the cache TTL.
+        """
+
+        expires = self._timer() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: _Hashable) -> bool:
+        """
+        Remove a single entry.
+
+        Args:
+            key (Hashable): Key.
+
+        Returns:
+            bool: `True` if the entry existed.
+        """
+
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: _Callable[[_Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate (Callable): Called with each key.
+
+        Returns:
+            int: Number of removed entries.
+        """
+
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+        """
+
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> _Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: `hits`, `misses`, `size` and `maxsize`.
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
@@ -0,0 +1,315 @@
+"""
+Circuit breaker for plisio clients.
+"""
+
+from collections import deque as _deque
+from threading import Lock as _Lock
+from time import monotonic as _monotonic
+from typing import (
+    Callable as _Callable,
+    Collection as _Collection,
+    Deque as _Deque,
+    Dict as _Dict,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+)
+
+from .enums import CircuitState as _CircuitState
+from .exceptions import PlisioCircuitOpenException as _PlisioCircuitOpenException
+
+__all__ = ["CircuitBreaker", "GLOBAL_SCOPE", "ENDPOINTS"]
+
+GLOBAL_SCOPE = "*"
+"""Scope of the circuit shared by every endpoint."""
+
+ENDPOINTS = frozenset(
+    {
+        "invoices/new",
+        "operations",
+        "operations/withdraw",
+        "operations/fee",
+        "operations/fee-plan",
+        "operations/plisio-fee",
+        "crypto-coins",
+        "balance",
+    }
+)
+"""Static endpoint paths of the API. Paths below them carry IDs and share the circuit of their template."""
+
+StateChangeHook = _Callable[[str, _CircuitState, _CircuitState], None]
+
+
+class _Circuit:
+    """
+    State of a single circuit.
+    """
+
+    __slots__ = ("state", "outcomes", "opened_at", "trials")
+
+    def __init__(self, window: int) -> None:
+        """
+        Initialize circuit.
+
+        Args:
+            window (int): Number of recent outcomes kept.
+        """
+
+        self.state = _CircuitState.CLOSED
+        self.outcomes: _Deque[bool] = _deque(maxlen=window)
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """
+    Failure-rate circuit breaker.
+
+    The circuit opens when at least `failure_rate` of the last `window` calls failed (once `min_calls` calls were
+    recorded). While open, calls fail fast with `PlisioCircuitOpenException`. After `reset_timeout` seconds the
+    circuit is half-open and lets `half_open_max_calls` trial calls through: a success closes it, a failure opens
+    it again.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        per_endpoint: bool = False,
+        endpoints: _Collection[str] = ENDPOINTS,
+        on_state_change: _Optional[_Iterable[StateChangeHook]] = None,
+        timer: _Callable[[], float] = _monotonic,
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_rate (float): Failure ratio in `(0, 1]` opening the circuit.
+            window (int): Number of recent calls the failure ratio is computed over.
+            min_calls (int): Minimum number of recorded calls before the circuit may open.
+            reset_timeout (float): Seconds the circuit stays open before allowing trial calls.
+            half_open_max_calls (int): Concurrent trial calls allowed while half-open.
+            per_endpoint (bool): Keep one circuit per endpoint template instead of a global one.
+            endpoints (Collection[str]): Static endpoint paths. A path below one of them, e.g. `operations/<id>`,
+                uses the circuit of the template `operations/*`, so IDs never create circuits of their own.
+            on_state_change (Iterable[Callable]): Hooks called with `(scope, old_state, new_state)`.
+            timer (Callable): Monotonic clock.
+
+        Raises:
+            ValueError: If `failure_rate` is not in `(0, 1]`.
+        """
+
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.per_endpoint = per_endpoint
+        self.endpoints = frozenset(path.strip("/") for path in endpoints)
+        self.hooks: _List[StateChangeHook] = list(on_state_change or ())
+        self._timer = timer
+        self._lock = _Lock()
+        self._circuits: _Dict[str, _Circuit] = {}
+
+    def _get_scope(self, endpoint: str) -> str:
+        """
+        Get the circuit scope of an endpoint.
+
+        Paths below a static endpoint map to its template, e.g. `operations/<id>` to `operations/*`, and unknown
+        paths to their first segment, so the number of circuits stays bounded.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            str: Scope.
+        """
+
+        if not self.per_endpoint:
+            return GLOBAL_SCOPE
+
+        path = endpoint.strip("/")
+        if path in self.endpoints:
+            return path
+
+        parent = path
+        while "/" in parent:
+            parent = parent.rsplit("/", 1)[0]
+            if parent in self.endpoints:
+                return f"{parent}/*"
+
+        return f"{parent}/*" if "/" in path else path
+
+    def _get_circuit(self, scope: str) -> _Circuit:
+        """
+        Get or create a circuit. Must be called with the lock held.
+
+        Args:
+            scope (str): Scope.
+
+        Returns:
+            _Circuit: Circuit.
+        """
+
+        circuit = self._circuits.get(scope)
+        if circuit is None:
+            circuit = self._circuits[scope] = _Circuit(self.window)
+        return circuit
+
+    def _transition(self, scope: str, circuit: _Circuit, state: _CircuitState) -> _Optional[_CircuitState]:
+        """
+        Change the state of a circuit. Must be called with the lock held.
+
+        Args:
+            scope (str): Scope.
+            circuit (_Circuit): Circuit.
+            state (CircuitState): New state.
+
+        Returns:
+            CircuitState: Previous state, `None` if unchanged.
+        """
+
+        previous = circuit.state
+        if previous is state:
+            return None
+
+        circuit.state = state
+        circuit.trials = 0
+        if state is _CircuitState.OPEN:
+            circuit.opened_at = self._timer()
+        elif state is _CircuitState.CLOSED:
+            circuit.outcomes.clear()
+
+        return previous
+
+    def _notify(self, scope: str, previous: _Optional[_CircuitState], state: _CircuitState) -> None:
+        """
+        Call the state change hooks.
+
+        Args:
+            scope (str): Scope.
+            previous (CircuitState): Previous state, `None` if unchanged.
+            state (CircuitState): New state.
+        """
+
+        if previous is None:
+            return
+
+        for hook in self.hooks:
+            hook(scope, previous, state)
+
+    def state(self, endpoint: str = GLOBAL_SCOPE) -> _CircuitState:
+        """
+        Get the state of the circuit of an endpoint.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            CircuitState: State.
+        """
+
+        with self._lock:
+            circuit = self._circuits.get(self._get_scope(endpoint))
+            return circuit.state if circuit is not None else _CircuitState.CLOSED
+
+    def before_call(self, endpoint: str) -> None:
+        """
+        Check that a call may be made.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Raises:
+            PlisioCircuitOpenException: If the circuit is open.
+        """
+
+        scope = self._get_scope(endpoint)
+        previous = None
+
+        with self._lock:
+            circuit = self._get_circuit(scope)
+
+            if circuit.state is _CircuitState.OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - self._timer()
+                if remaining > 0:
+                    raise _PlisioCircuitOpenException(scope, remaining)
+                previous = self._transition(scope, circuit, _CircuitState.HALF_OPEN)
+
+            if circuit.state is _CircuitState.HALF_OPEN:
+                if circuit.trials >= self.half_open_max_calls:
+                    raise _PlisioCircuitOpenException(scope, 0.0)
+                circuit.trials += 1
+
+        self._notify(scope, previous, _CircuitState.HALF_OPEN)
+
+    def record_success(self, endpoint: str) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            endpoint (str): Endpoint path.
+        """
+
+        scope = self._get_scope(endpoint)
+
+        with self._lock:
+            circuit = self._get_circuit(scope)
+            if circuit.state is _CircuitState.HALF_OPEN:
+                previous = self._transition(scope, circuit, _CircuitState.CLOSED)
+            else:
+                circuit.outcomes.append(True)
+                previous = None
+
+        self._notify(scope, previous, _CircuitState.CLOSED)
+
+    def record_failure(self, endpoint: str) -> None:
+        """
+        Record a failed call.
+
+        Args:
+            endpoint (str): Endpoint path.
+        """
+
+        scope = self._get_scope(endpoint)
+        previous = None
+
+        with self._lock:
+            circuit = self._get_circuit(scope)
+            circuit.outcomes.append(False)
+
+            if circuit.state is _CircuitState.HALF_OPEN:
+                previous = self._transition(scope, circuit, _CircuitState.OPEN)
+            elif circuit.state is _CircuitState.CLOSED and len(circuit.outcomes) >= self.min_calls:
+                failures = circuit.outcomes.count(False)
+                if failures / len(circuit.outcomes) >= self.failure_rate:
+                    previous = self._transition(scope, circuit, _CircuitState.OPEN)
+
+        self._notify(scope, previous, _CircuitState.OPEN)
+
+    def release(self, endpoint: str) -> None:
+        """
+        Record a call that was abandoned without an outcome, e.g. cancelled.
+
+        Args:
+            endpoint (str): Endpoint path.
+        """
+
+        with self._lock:
+            circuit = self._get_circuit(self._get_scope(endpoint))
+            if circuit.state is _CircuitState.HALF_OPEN and circuit.trials > 0:
+                circuit.trials -= 1
+
+    def reset(self) -> None:
+        """
+        Close every circuit and forget recorded calls.
+        """
+
+        with self._lock:
+            self._circuits.clear()
@@ -5,12 +5,56 @@ See [API Reference](https://plisio.net/documentation) for more information.
 
 [Client](client) - Synchronous client.<br>
 [AsyncClient](async_client) - Asynchronous client.
+
+Clients are imported on first access, so using `Client` never imports aiohttp.
 """
 
-from .client import Client
-from .async_client import AsyncClient
+from importlib import import_module as _import_module
+from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from .client import Client
+    from .async_client import AsyncClient
 
 __all__ = [
     "Client",
     "AsyncClient",
 ]
+
+_MODULES = {
+    "Client": ".client",
+    "AsyncClient": ".async_client",
+}
+
+
+def __getattr__(name: str) -> _Any:
+    """
+    Import a client on first access.
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:  # type: ignore[type-arg]
+    """
+    List module attributes, including the lazily imported ones.
+
+    Returns:
+        list: Attribute names.
+    """
+
+    return sorted(set(globals()) | set(__all__))
@@ -6,32 +6,133 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from contextlib import contextmanager as _contextmanager
+from contextvars import ContextVar as _ContextVar
+from hashlib import sha1 as _sha1
+from time import monotonic as _monotonic
+from typing import (
+    Generic as _Generic,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    List as _List,
+    Mapping as _Mapping,
+    Optional as _Optional,
+    TypeVar as _TypeVar,
+)
 
+from ._batch import (
+    BatchResult as _BatchResult,
+    PayoutCall as _PayoutCall,
+    PayoutResult as _PayoutResult,
+    chunk_payouts as _chunk_payouts,
+)
 from .. import _types as _t
-from ..enums import Methods as _Methods
+from .. import exceptions as _e
+from ..cache import TTLCache as _TTLCache
+from ..codecs import default_codec as _default_codec
+from ..enums import Methods as _Methods, WithdrawType as _WithdrawType
+from ..metrics import Metrics as _Metrics
+from ..retry import RetryPolicy as _RetryPolicy
+from ..timeouts import Timeout as _Timeout
+from ..transports import TransportResponse as _TransportResponse
+from ..utils import encode_query as _encode_query
 
+_T = _TypeVar("_T")
+_R = _TypeVar("_R")
 
-class BaseClient(ABC):
+
+class BaseClient(ABC, _Generic[_R]):
     """
     Base client class.
+
+    Generic over the return type of requests: `Result` for synchronous clients, an awaitable of it for
+    asynchronous ones. Subclasses provide the transport and the request pipeline.
     """
 
+    _transport: _t.AnyTransport
+
     BASE_URL: str = "https://plisio.net/api"
     API_VERSION_V1: str = "v1"
     REQUEST_TIMEOUT: int = 10
-
-    def __init__(self, api_key: _t.Text, requests_params: _t.RequestParams = None):
+    CACHE_TTLS: _t.EndpointMap = {
+        "crypto-coins": 300,
+        "operations/fee-plan": 300,
+        "balance": 10,
+    }
+    UNSAFE_ENDPOINTS: _t.FrozenSetStr = frozenset({"invoices/new", "operations/withdraw"})
+    RETRY_EXCEPTIONS: _t.ExceptionTypes = ()
+    """Exceptions worth retrying on top of the `RETRY_EXCEPTIONS` of the transport."""
+    MASS_WITHDRAW_MAX_PAYOUTS: int = 100
+    """Maximum number of payouts sent in one mass withdrawal request."""
+    IDEMPOTENCY_POLL_INTERVAL: float = 0.05
+    """Initial seconds between two checks of an invoice reserved by another process, doubled up to the maximum."""
+    IDEMPOTENCY_MAX_POLL_INTERVAL: float = 1.0
+    """Maximum seconds between two checks of an invoice reserved by another process."""
+    MAX_URL_LENGTH: int = 8000
+    """Maximum length of a request URL, query string included, kept under common server limits."""
+
+    def __init__(
+        self,
+        api_key: _t.Text,
+        requests_params: _t.RequestParams = None,
+        cache: _t.OptionalTTLCache = None,
+        cache_ttls: _t.OptionalEndpointMap = None,
+        coalesce: bool = True,
+        retry: _t.OptionalRetryPolicy = None,
+        metrics: _t.OptionalMetrics = None,
+        rate_limiter: _t.OptionalRateLimiter = None,
+        circuit_breaker: _t.OptionalCircuitBreaker = None,
+        timeout: _t.OptionalTimeoutLike = None,
+        timeouts: _t.OptionalEndpointTimeouts = None,
+        codec: _t.OptionalCodec = None,
+        idempotency: _t.OptionalIdempotencyStore = None,
+    ):
         """
         Initialize client.
 
         Args:
             api_key (str): API key.
             requests_params (RequestParams): Request params.
+            cache (TTLCache): Cache for read-only endpoint responses, `None` to disable caching.
+                Cached results are shared between callers and must not be mutated.
+            cache_ttls (dict): Time-to-live in seconds per endpoint path, defaults to `CACHE_TTLS`.
+                Only the listed endpoints are cached.
+            coalesce (bool): Share one network call between identical concurrent requests to read-only endpoints.
+                The shared result must not be mutated.
+            retry (RetryPolicy): Retry policy, defaults to `RetryPolicy()`. Pass `NO_RETRY` to disable retries.
+            metrics (Metrics): Metrics sink, may be shared between clients. A new one is created by default.
+            rate_limiter (RateLimiter): Limiter smoothing outgoing requests, may be shared between clients.
+                Waiting time is recorded as the `rate_limit_wait` timing.
+            circuit_breaker (CircuitBreaker): Breaker failing fast with `PlisioCircuitOpenException`
+                while the API is failing, may be shared between clients.
+            timeout (Timeout | float): Default timeout, a number sets connect and read timeouts.
+                Defaults to `REQUEST_TIMEOUT` for both.
+            timeouts (dict): Timeouts keyed by endpoint path, overriding `timeout`. A key also applies to its
+                sub-paths. Use `use_timeout` to override the timeout of individual calls.
+            codec (Codec): JSON codec for response bodies, error bodies and outgoing JSON, defaults to the fastest
+                one installed (orjson, msgspec, ujson, then the standard library).
+            idempotency (IdempotencyStore): Store remembering recent invoices by `order_number`, so a retried
+                `invoice` call returns the first invoice. `None` to only collapse concurrent calls.
         """
 
         self.api_key = api_key
-        self._session = self._init_session()
         self._requests_params = requests_params
+        self._headers = self._get_headers()
+        self.codec = _default_codec() if codec is None else codec
+        self._cache = cache
+        self._cache_ttls = self.CACHE_TTLS if cache_ttls is None else cache_ttls
+        self._coalesce = coalesce
+        self._retry = _RetryPolicy() if retry is None else retry
+        self.metrics = _Metrics() if metrics is None else metrics
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._timeout = _Timeout.coerce(self.REQUEST_TIMEOUT if timeout is None else timeout)
+        self._timeouts = {path.strip("/"): _Timeout.coerce(value) for path, value in (timeouts or {}).items()}
+        self._idempotency = idempotency
+        self._idempotency_prefix = f"invoice:{_sha1(api_key.encode('utf-8')).hexdigest()[:16]}:"
+        self._timeout_override: _ContextVar[_t.OptionalTimeout] = _ContextVar(
+            f"plisio_timeout_{id(self)}", default=None
+        )
 
     def __str__(self) -> _t.Text:
         """
@@ -57,6 +158,386 @@ class BaseClient(ABC):
 
         return f"{self.BASE_URL}/{version}/{path.lstrip('/').rstrip('/')}"
 
+    def _get_endpoint(self, uri: _t.Text) -> _t.Text:
+        """
+        Get the endpoint path of a URI.
+
+        Args:
+            uri (str): URI.
+
+        Returns:
+            str: Path relative to the API version, e.g. `operations/fee-plan/BTC`.
+        """
+
+        path = uri.split(self.BASE_URL, 1)[-1].strip("/")
+        return path.split("/", 1)[-1]
+
+    @staticmethod
+    def _match_endpoint(mapping: _Mapping[_t.Text, _T], endpoint: _t.Text) -> _Optional[_T]:
+        """
+        Look up an endpoint in a per-endpoint mapping.
+
+        The exact path wins, otherwise the longest key that is a parent path of the endpoint is used.
+
+        Args:
+            mapping (dict): Values keyed by endpoint path.
+            endpoint (str): Endpoint path.
+
+        Returns:
+            Any: Matched value, `None` if no key matches.
+        """
+
+        path = endpoint
+        while True:
+            if path in mapping:
+                return mapping[path]
+            if "/" not in path:
+                return None
+            path = path.rsplit("/", 1)[0]
+
+    def _is_safe(self, method: _t.Methods, endpoint: _t.Text) -> bool:
+        """
+        Check whether a request is read-only.
+
+        Plisio uses GET for every endpoint, so endpoints with side effects are listed in `UNSAFE_ENDPOINTS`.
+
+        Args:
+            method (Methods): Method.
+            endpoint (str): Endpoint path.
+
+        Returns:
+            bool: `True` if the request can be repeated or shared without side effects.
+        """
+
+        return str(method).upper() == _Methods.GET.value and endpoint not in self.UNSAFE_ENDPOINTS
+
+    def _get_retry_delay(  # pylint: disable=too-many-arguments
+        self,
+        exc: BaseException,
+        attempt: int,
+        started: float,
+        method: _t.Methods,
+        endpoint: _t.Text,
+        deadline: _t.OptionalNumber = None,
+    ) -> _t.OptionalNumber:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            exc (Exception): Exception raised by the attempt.
+            attempt (int): Number of the attempt that failed, starting at 1.
+            started (float): Monotonic time the first attempt started.
+            method (Methods): Method.
+            endpoint (str): Endpoint path.
+            deadline (float): Monotonic time the total timeout expires at.
+
+        Returns:
+            float: Seconds to wait before the next attempt, `None` to give up.
+        """
+
+        if not self._retry.allows(endpoint, self._is_safe(method, endpoint)):
+            return None
+
+        now = _monotonic()
+        delay = self._retry.get_retry_delay(exc, attempt, now - started, self._retry_exceptions)
+
+        if delay is not None and deadline is not None and now + delay >= deadline:
+            return None
+
+        return delay
+
+    @property
+    def _retry_exceptions(self) -> _t.ExceptionTypes:
+        """
+        Get the exceptions worth retrying.
+
+        Returns:
+            tuple: `RETRY_EXCEPTIONS` of the client and of the transport.
+        """
+
+        return self.RETRY_EXCEPTIONS + self._transport.RETRY_EXCEPTIONS
+
+    @staticmethod
+    def _get_deadline(timeout: _Timeout, started: float) -> _t.OptionalNumber:
+        """
+        Get the monotonic time the total timeout of a call expires at.
+
+        Args:
+            timeout (Timeout): Timeout.
+            started (float): Monotonic time the call started.
+
+        Returns:
+            float: Deadline, `None` without total timeout.
+        """
+
+        return started + timeout.total if timeout.total is not None else None
+
+    @staticmethod
+    def _get_remaining(deadline: _t.OptionalNumber) -> _t.OptionalNumber:
+        """
+        Get the remaining total budget of a call.
+
+        Args:
+            deadline (float): Deadline.
+
+        Returns:
+            float: Remaining seconds (possibly negative), `None` without deadline.
+        """
+
+        return deadline - _monotonic() if deadline is not None else None
+
+    @_contextmanager
+    def use_timeout(self, timeout: _t.TimeoutLike) -> _Iterator[None]:
+        """
+        Override the timeout of calls made within the block.
+
+        The override is local to the current thread or asyncio task.
+
+        Args:
+            timeout (Timeout | float): Timeout, a number sets connect and read timeouts.
+
+        Yields:
+            None
+        """
+
+        token = self._timeout_override.set(_Timeout.coerce(timeout))
+        try:
+            yield
+        finally:
+            self._timeout_override.reset(token)
+
+    def _get_timeout(self, endpoint: _t.Text) -> _Timeout:
+        """
+        Get the timeout of a request.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            Timeout: Call override, else endpoint timeout, else default timeout.
+        """
+
+        return self._timeout_override.get() or self._match_endpoint(self._timeouts, endpoint) or self._timeout
+
+    def _is_transport_failure(self, exc: BaseException) -> bool:
+        """
+        Check whether an exception means the API is unhealthy, as opposed to a rejected request.
+
+        Args:
+            exc (Exception): Exception raised by an attempt.
+
+        Returns:
+            bool: `True` for connection errors, timeouts, invalid responses and `5xx` statuses.
+        """
+
+        if isinstance(exc, _e.PlisioAPIException):
+            return exc.status_code >= 500
+
+        return isinstance(exc, (_e.PlisioRequestException,) + self._retry_exceptions)
+
+    def _check_circuit(self, endpoint: _t.Text) -> None:
+        """
+        Check that the circuit breaker lets a request through.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Raises:
+            PlisioCircuitOpenException: If the circuit is open.
+        """
+
+        if self._circuit_breaker is None:
+            return
+
+        try:
+            self._circuit_breaker.before_call(endpoint)
+        except _e.PlisioCircuitOpenException:
+            self.metrics.incr("circuit_rejected")
+            raise
+
+    def _record_outcome(self, endpoint: _t.Text, exc: _t.OptionalBaseException = None) -> None:
+        """
+        Record the outcome of an attempt in the circuit breaker.
+
+        Args:
+            endpoint (str): Endpoint path.
+            exc (Exception): Exception raised by the attempt, `None` on success.
+        """
+
+        if self._circuit_breaker is None:
+            return
+
+        if exc is None or isinstance(exc, Exception) and not self._is_transport_failure(exc):
+            self._circuit_breaker.record_success(endpoint)
+        elif isinstance(exc, Exception):
+            self._circuit_breaker.record_failure(endpoint)
+        else:
+            self._circuit_breaker.release(endpoint)
+
+    def _get_cache_ttl(self, method: _t.Methods, endpoint: _t.Text) -> _t.OptionalNumber:
+        """
+        Get the cache time-to-live of a request.
+
+        Args:
+            method (Methods): Method.
+            endpoint (str): Endpoint path.
+
+        Returns:
+            Number: Time-to-live in seconds, `None` if the request must not be cached.
+        """
+
+        if self._cache is None or str(method).upper() != _Methods.GET.value:
+            return None
+
+        return self._match_endpoint(self._cache_ttls, endpoint)
+
+    @staticmethod
+    def _get_cache_key(endpoint: _t.Text, requests_kwargs: _t.DictAny) -> _t.CacheKey:
+        """
+        Get the cache and coalescing key of a request.
+
+        Args:
+            endpoint (str): Endpoint path.
+            requests_kwargs (dict): Request kwargs.
+
+        Returns:
+            tuple: Key made of the endpoint path and the query string.
+        """
+
+        return endpoint, str(requests_kwargs.get("params", ""))
+
+    def cache_stats(self) -> _t.DictStrInt:
+        """
+        Get response cache statistics.
+
+        Returns:
+            dict: `hits`, `misses`, `size` and `maxsize`, empty if caching is disabled.
+        """
+
+        return self._cache.stats() if self._cache is not None else {}
+
+    def invalidate_cache(self, endpoint: _t.OptionalText = None) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            endpoint (str): Endpoint path whose entries (including sub-paths) are dropped, `None` for all.
+
+        Returns:
+            int: Number of dropped entries.
+        """
+
+        if self._cache is None:
+            return 0
+
+        if endpoint is None:
+            return self._cache.invalidate_where(lambda key: True)
+
+        prefix = endpoint.strip("/")
+        return self._cache.invalidate_where(
+            lambda key: isinstance(key, tuple) and (key[0] == prefix or str(key[0]).startswith(prefix + "/"))
+        )
+
+    def _get_idempotency_key(self, order_number: _t.NumberLike) -> _t.Text:
+        """
+        Get the idempotency key of an invoice.
+
+        Args:
+            order_number (str): Order number.
+
+        Returns:
+            str: Key made of a fingerprint of the API key and the order number.
+        """
+
+        return f"{self._idempotency_prefix}{order_number}"
+
+    def _get_payout_chunks(  # pylint: disable=too-many-arguments
+        self,
+        payouts: _Iterable[_t.Payout],
+        currency: _t.Currencies,
+        fee_plan: _t.OptionalFeePlans,
+        max_payouts: _t.OptionalInt,
+        estimate_fee: bool,
+    ) -> _List[_PayoutCall]:
+        """
+        Pack payouts into mass withdrawal requests.
+
+        Both the withdrawal and the fee estimation URLs of a chunk stay within `MAX_URL_LENGTH`.
+
+        Args:
+            payouts (Iterable): `(address, amount)` pairs.
+            currency (str): Currency.
+            fee_plan (str): Fee plan.
+            max_payouts (int): Maximum number of payouts per request, defaults to `MASS_WITHDRAW_MAX_PAYOUTS`.
+            estimate_fee (bool): Estimate the fee of each chunk before withdrawing.
+
+        Returns:
+            list: Payout positions and `_withdraw_chunk` keyword arguments of each chunk.
+        """
+
+        base = {"currency": currency, "fee_plan": fee_plan, "api_key": self.api_key}
+        withdraw_query = _encode_query({**base, "type": _WithdrawType.MASS_CASH_OUT, "to": "", "amount": ""})
+        fee_query = _encode_query({**base, "addresses": "", "amounts": ""})
+        overhead = max(
+            len(self._get_uri("operations/withdraw")) + 1 + len(withdraw_query),
+            len(self._get_uri("operations/fee")) + 1 + len(fee_query),
+        )
+
+        chunks = _chunk_payouts(
+            payouts,
+            overhead,
+            self.MASS_WITHDRAW_MAX_PAYOUTS if max_payouts is None else max_payouts,
+            self.MAX_URL_LENGTH,
+        )
+
+        return [
+            (
+                indexes,
+                {
+                    "currency": currency,
+                    "type": _WithdrawType.MASS_CASH_OUT if len(indexes) > 1 else _WithdrawType.CASH_OUT,
+                    "to": addresses,
+                    "amount": amounts,
+                    "fee_plan": fee_plan,
+                    "estimate_fee": estimate_fee,
+                },
+            )
+            for indexes, addresses, amounts in chunks
+        ]
+
+    @staticmethod
+    def _get_payout_results(chunks: _List[_PayoutCall], results: _Iterable[_BatchResult]) -> _List[_PayoutResult]:
+        """
+        Spread the outcomes of mass withdrawal requests over their payouts.
+
+        Args:
+            chunks (list): Chunks, as returned by `_get_payout_chunks`.
+            results (Iterable): Outcome of each chunk, in any order.
+
+        Returns:
+            list: Per-payout outcomes, in input order.
+        """
+
+        payouts: _List[_PayoutResult] = []
+
+        for chunk in results:
+            indexes, kwargs = chunks[chunk.index]
+            response = chunk.result or {}
+            for index, address, amount in zip(indexes, kwargs["to"], kwargs["amount"]):
+                payouts.append(
+                    _PayoutResult(
+                        index,
+                        {"to": address, "amount": amount},
+                        chunk.index,
+                        result=response.get("withdraw"),
+                        exception=chunk.exception,
+                        fee=response.get("fee"),
+                    )
+                )
+
+        payouts.sort(key=lambda payout: payout.index)
+        return payouts
+
     @staticmethod
     def _get_params(locals_: _t.DictStrAny, exclude_unset: bool = True) -> _t.DictStrAny:
         """
@@ -72,6 +553,60 @@ class BaseClient(ABC):
 
         return {key: value for key, value in locals_.items() if key != "self" and not (exclude_unset and value is None)}
 
+    @staticmethod
+    def _get_operations(result: _t.Result) -> _t.ListDictAny:
+        """
+        Get the operations of a transactions response.
+
+        Args:
+            result (dict): Response data.
+
+        Returns:
+            list: Operations.
+        """
+
+        data: _t.DictAny = result.get("data") or {}  # type: ignore[assignment]
+        operations: _t.ListDictAny = data.get("operations") or []
+        return operations
+
+    @staticmethod
+    def _get_page_count(result: _t.Result) -> int:
+        """
+        Get the page count of a paginated response.
+
+        Args:
+            result (dict): Response data.
+
+        Returns:
+            int: Page count.
+        """
+
+        data: _t.DictAny = result.get("data") or {}  # type: ignore[assignment]
+        meta: _t.DictAny = data.get("_meta") or {}
+        return int(meta.get("pageCount", 1))
+
+    @staticmethod
+    def _get_next_page(result: _t.Result) -> _t.OptionalInt:
+        """
+        Get the next page number of a paginated response.
+
+        Args:
+            result (dict): Response data.
+
+        Returns:
+            int: Next page number, `None` on the last page.
+        """
+
+        data: _t.DictAny = result.get("data") or {}  # type: ignore[assignment]
+        if not data.get("operations"):
+            return None
+
+        meta: _t.DictAny = data.get("_meta") or {}
+        current = int(meta.get("currentPage", 1))
+        page_count = int(meta.get("pageCount", current))
+
+        return current + 1 if current < page_count else None
+
     @staticmethod
     def _get_headers() -> _t.Headers:
         """
@@ -88,10 +623,14 @@ class BaseClient(ABC):
 
     def _get_request_kwargs(  # type: ignore[no-untyped-def]
         self, method: _t.Methods, force_params: bool = False, **kwargs
-    ) -> _t.DictStrAny:
+    ) -> _t.DictAny:
         """
         Get request kwargs.
 
+        The caller's `data` is not modified. For GET requests (or with `force_params`) it is sent as a
+        percent-encoded query string, see `encode_query`, which transports append to the URL without encoding it
+        again.
+
         Args:
             method (Methods): Method.
             force_params (bool): Force params.
@@ -101,66 +640,58 @@ class BaseClient(ABC):
             dict: Request kwargs.
         """
 
-        kwargs["timeout"] = self.REQUEST_TIMEOUT
-
         if self._requests_params:
             kwargs.update(self._requests_params)
 
         data = kwargs.pop("data", None)
-        data.update({"api_key": self.api_key})
+        data = {**data, "api_key": self.api_key} if data else {"api_key": self.api_key}
 
-        if data and isinstance(data, dict):
-            kwargs["data"] = data
+        requests_params = data.pop("requests_params", None)
+        if requests_params:
+            kwargs.update(requests_params)
 
-            if "requests_params" in kwargs["data"]:
-                kwargs.update(kwargs["data"]["requests_params"])
-                del kwargs["data"]["requests_params"]
+        headers = kwargs.get("headers")
+        kwargs["headers"] = {**self._headers, **headers} if headers else self._headers
 
-        if data and (str(method).upper() == _Methods.GET or force_params):
-            _ = ""
-            for data in kwargs["data"].items():
-                key = data[0]
-                if isinstance(data[1], list):
-                    value = ",".join(data[1])
-                else:
-                    value = str(data[1])
+        if force_params or method is _Methods.GET or method == _Methods.GET.value:
+            kwargs["params"] = _encode_query(data)
+        else:
+            kwargs["data"] = self.codec.dumps(data)
 
-                _ += f"{key}={value}&"
-
-            kwargs["params"] = _.rstrip("&")
-            del kwargs["data"]
+        if "json" in kwargs:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
 
         return kwargs
 
-    @abstractmethod
-    def _init_session(self) -> _t.Session:
-        """
-        Initialize session.
-
-        Returns:
-            Session: Session.
-        """
-
-        raise NotImplementedError
-
-    @abstractmethod
-    def _handle_response(self, response: _t.Response) -> _t.Result:
+    def _handle_response(self, response: _TransportResponse) -> _t.Result:
         """
         Handle response.
 
         Args:
-            response (Response): Response.
+            response (TransportResponse): Response.
 
         Returns:
-            Response: Response.
+            dict: Response data.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
         """
 
-        raise NotImplementedError
+        if not 200 <= response.status < 300:
+            raise _e.PlisioAPIException(response, response.status, response.text, self.codec.loads)
+
+        try:
+            data: _t.Result = self.codec.loads(response.content)
+        except ValueError as exc:
+            raise _e.PlisioRequestException(f"Invalid JSON response: {response.text}") from exc
+
+        return data
 
     @abstractmethod
     def _request(  # type: ignore[no-untyped-def]
         self, method: _t.Methods, uri: _t.Text, force_params: bool = False, **kwargs  # type: ignore[no-untyped-def]
-    ) -> _t.Result:
+    ) -> _R:
         """
         Make request.
 
@@ -180,82 +711,82 @@ class BaseClient(ABC):
 
         raise NotImplementedError
 
-    @abstractmethod
-    def _get(  # type: ignore[no-untyped-def]
-        self,
-        path: _t.Text,
-        version: _t.Text = API_VERSION_V1,
-        **kwargs,  # type: ignore[no-untyped-def]
-    ) -> _t.Result:
+    def _get(self, path: _t.Text, version: _t.Text = API_VERSION_V1, **kwargs) -> _R:  # type: ignore[no-untyped-def]
         """
         Make GET request.
 
         Args:
             path (str): Path.
             version (str): API version.
+            **kwargs: Arguments.
 
         Returns:
             dict: Response data.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
         """
 
-        raise NotImplementedError
+        uri = self._get_uri(path, version)
+        return self._request(_Methods.GET, uri, **kwargs)
 
-    @abstractmethod
-    def _post(  # type: ignore[no-untyped-def]
-        self,
-        path: _t.Text,
-        version: _t.Text = API_VERSION_V1,
-        **kwargs,  # type: ignore[no-untyped-def]
-    ) -> _t.Result:
+    def _post(self, path: _t.Text, version: _t.Text = API_VERSION_V1, **kwargs) -> _R:  # type: ignore[no-untyped-def]
         """
         Make POST request.
 
         Args:
             path (str): Path.
             version (str): API version.
+            **kwargs: Arguments.
 
         Returns:
             dict: Response data.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
         """
 
-        raise NotImplementedError
+        uri = self._get_uri(path, version)
+        return self._request(_Methods.POST, uri, **kwargs)
 
-    @abstractmethod
-    def _put(  # type: ignore[no-untyped-def]
-        self,
-        path: _t.Text,
-        version: _t.Text = API_VERSION_V1,
-        **kwargs,  # type: ignore[untyped-definition]
-    ) -> _t.Result:
+    def _put(self, path: _t.Text, version: _t.Text = API_VERSION_V1, **kwargs) -> _R:  # type: ignore[no-untyped-def]
         """
         Make PUT request.
 
         Args:
             path (str): Path.
             version (str): API version.
+            **kwargs: Arguments.
 
         Returns:
             dict: Response data.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
         """
 
-        raise NotImplementedError
+        uri = self._get_uri(path, version)
+        return self._request(_Methods.PUT, uri, **kwargs)
 
-    @abstractmethod
-    def _delete(  # type: ignore[no-untyped-def]
-        self,
-        path: _t.Text,
-        version: _t.Text = API_VERSION_V1,
-        **kwargs,  # type: ignore[no-untyped-def]
-    ) -> _t.Result:
+    def _delete(self, path: _t.Text, version: _t.Text = API_VERSION_V1, **kwargs) -> _R:  # type: ignore[no-untyped-def]
         """
         Make DELETE request.
 
         Args:
             path (str): Path.
             version (str): API version.
+            **kwargs: Arguments.
 
         Returns:
             dict: Response data.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
         """
 
-        raise NotImplementedError
+        uri = self._get_uri(path, version)
+        return self._request(_Methods.DELETE, uri, **kwargs)
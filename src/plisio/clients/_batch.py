@@ -0,0 +1,354 @@
+"""
+Batch execution helpers shared by the clients.
+"""
+
+import asyncio as _asyncio
+from collections import deque as _deque
+from concurrent.futures import (
+    FIRST_COMPLETED as _FIRST_COMPLETED,
+    Future as _Future,
+    ThreadPoolExecutor as _ThreadPoolExecutor,
+    wait as _wait,
+)
+from contextvars import copy_context as _copy_context
+from typing import (
+    Any as _Any,
+    AsyncGenerator as _AsyncGenerator,
+    AsyncIterable as _AsyncIterable,
+    AsyncIterator as _AsyncIterator,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    Deque as _Deque,
+    Dict as _Dict,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    List as _List,
+    Optional as _Optional,
+    Set as _Set,
+    Tuple as _Tuple,
+    Union as _Union,
+)
+
+from .. import _types as _t
+from ..utils import encode_query as _encode_query
+
+Kwargs = _Dict[str, _Any]
+KwargsIterable = _Union[_Iterable[Kwargs], _AsyncIterable[Kwargs]]
+PayoutChunk = _Tuple[_List[int], _List[_t.Text], _List[_t.NumberLike]]
+PayoutCall = _Tuple[_List[int], Kwargs]
+
+_PAIR_OVERHEAD = len("to=&amount=")
+"""Length of `encode_query({"to": ..., "amount": ...})` not taken by the address and the amount."""
+
+_SEPARATORS = len(",,")
+"""Length added to the comma-separated address and amount lists by every pair after the first one."""
+
+
+class BatchResult:
+    """
+    Outcome of a single call made as part of a batch.
+    """
+
+    __slots__ = ("index", "kwargs", "result", "exception")
+
+    def __init__(self, index: int, kwargs: Kwargs, result: _Any = None, exception: _Optional[BaseException] = None):
+        """
+        Initialize result.
+
+        Args:
+            index (int): Position of the call in the input.
+            kwargs (dict): Keyword arguments the call was made with.
+            result (Any): Call result, `None` if it failed.
+            exception (Exception): Raised exception, `None` if it succeeded.
+        """
+
+        self.index = index
+        self.kwargs = kwargs
+        self.result = result
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        state = f"exception={self.exception!r}" if self.exception is not None else f"result={self.result!r}"
+        return f"<{self.__class__.__name__} index={self.index} {state}>"
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """
+        Whether the call succeeded.
+
+        Returns:
+            bool: `True` if no exception was raised.
+        """
+
+        return self.exception is None
+
+    def unwrap(self) -> _Any:
+        """
+        Get the result or re-raise the exception.
+
+        Returns:
+            Any: Call result.
+        """
+
+        if self.exception is not None:
+            raise self.exception
+
+        return self.result
+
+
+class PayoutResult(BatchResult):
+    """
+    Outcome of a single payout sent as part of a mass withdrawal.
+
+    `result` and `fee` are the responses of the requests carrying the payout, shared by every payout of the
+    same chunk. A chunk fails or succeeds as a whole.
+    """
+
+    __slots__ = ("chunk", "fee")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        index: int,
+        kwargs: Kwargs,
+        chunk: int,
+        result: _Any = None,
+        exception: _Optional[BaseException] = None,
+        fee: _Any = None,
+    ):
+        """
+        Initialize result.
+
+        Args:
+            index (int): Position of the payout in the input.
+            kwargs (dict): Payout, as `to` and `amount`.
+            chunk (int): Position of the withdrawal request carrying the payout.
+            result (Any): Withdrawal response, `None` if it failed.
+            exception (Exception): Raised exception, `None` if it succeeded.
+            fee (Any): Fee estimation response, `None` if not estimated.
+        """
+
+        super().__init__(index, kwargs, result, exception)
+        self.chunk = chunk
+        self.fee = fee
+
+
+def chunk_payouts(
+    payouts: _Iterable[_Tuple[_t.Text, _t.NumberLike]], overhead: int, max_payouts: int, max_length: int
+) -> _List[PayoutChunk]:
+    """
+    Pack payouts into as few mass withdrawal requests as the limits allow, keeping the input order.
+
+    Args:
+        payouts (Iterable): `(address, amount)` pairs.
+        overhead (int): URL length of a request with empty address and amount lists.
+        max_payouts (int): Maximum number of payouts per request.
+        max_length (int): Maximum URL length. A payout too long for it on its own is sent alone.
+
+    Returns:
+        list: Chunks of payout positions, addresses and amounts.
+
+    Raises:
+        ValueError: If `max_payouts` is lower than 1.
+    """
+
+    if max_payouts < 1:
+        raise ValueError("max_payouts must be at least 1")
+
+    chunks: _List[PayoutChunk] = []
+    indexes: _List[int] = []
+    addresses: _List[_t.Text] = []
+    amounts: _List[_t.NumberLike] = []
+    length = overhead
+
+    for index, (address, amount) in enumerate(payouts):
+        cost = len(_encode_query({"to": address, "amount": amount})) - _PAIR_OVERHEAD
+        if indexes and (len(indexes) >= max_payouts or length + _SEPARATORS + cost > max_length):
+            chunks.append((indexes, addresses, amounts))
+            indexes, addresses, amounts = [], [], []
+            length = overhead
+
+        if indexes:
+            cost += _SEPARATORS
+
+        indexes.append(index)
+        addresses.append(address)
+        amounts.append(amount)
+        length += cost
+
+    if indexes:
+        chunks.append((indexes, addresses, amounts))
+
+    return chunks
+
+
+def bounded_map(
+    func: _Callable[..., _Any],
+    items: _Iterable[Kwargs],
+    max_workers: int,
+    ordered: bool = False,
+) -> _Iterator[BatchResult]:
+    """
+    Call `func(**kwargs)` for each item on a thread pool with at most `max_workers` calls in flight.
+
+    Items are pulled from `items` only when a worker frees up, so the input is never materialized. Each call runs
+    in a copy of the caller's context, so context variables such as `use_timeout` overrides apply to it.
+
+    Args:
+        func (Callable): Blocking function.
+        items (Iterable): Iterable of keyword argument dicts.
+        max_workers (int): Number of worker threads.
+        ordered (bool): Yield in input order instead of completion order.
+
+    Yields:
+        BatchResult: Per-item outcome.
+
+    Raises:
+        ValueError: If `max_workers` is lower than 1.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    def run(index: int, kwargs: Kwargs) -> BatchResult:
+        try:
+            return BatchResult(index, kwargs, result=func(**kwargs))
+        except Exception as exc:  # pylint: disable=broad-except
+            return BatchResult(index, kwargs, exception=exc)
+
+    source = iter(items)
+    queue: _Deque["_Future[BatchResult]"] = _deque()
+    running: _Set["_Future[BatchResult]"] = set()
+    exhausted = False
+    index = 0
+
+    executor = _ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plisio-batch")
+    try:
+        while True:
+            while not exhausted and len(running) < max_workers:
+                try:
+                    kwargs = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                future = executor.submit(_copy_context().run, run, index, kwargs)
+                running.add(future)
+                if ordered:
+                    queue.append(future)
+                index += 1
+
+            if not running:
+                return
+
+            if ordered:
+                head = queue.popleft()
+                result = head.result()
+                running.discard(head)
+                yield result
+            else:
+                done, _ = _wait(running, return_when=_FIRST_COMPLETED)
+                running.difference_update(done)
+                for finished in done:
+                    yield finished.result()
+    finally:
+        for pending in running:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+async def _aiterate(items: KwargsIterable) -> _AsyncIterator[Kwargs]:
+    """
+    Iterate a sync or async iterable asynchronously.
+
+    Args:
+        items (Iterable): Items.
+
+    Yields:
+        dict: Items.
+    """
+
+    if hasattr(items, "__aiter__"):
+        async for item in items:  # type: ignore[union-attr]
+            yield item
+    else:
+        for item in items:  # type: ignore[union-attr]
+            yield item
+
+
+async def abounded_map(
+    func: _Callable[..., _Awaitable[_Any]],
+    items: KwargsIterable,
+    concurrency: int,
+    ordered: bool = False,
+) -> _AsyncGenerator[BatchResult, None]:
+    """
+    Call `func(**kwargs)` for each item with at most `concurrency` calls in flight.
+
+    Items are pulled from `items` only when a slot frees up, so the input is never materialized.
+
+    Args:
+        func (Callable): Coroutine function.
+        items (Iterable): Sync or async iterable of keyword argument dicts.
+        concurrency (int): Maximum number of calls in flight.
+        ordered (bool): Yield in input order instead of completion order.
+
+    Yields:
+        BatchResult: Per-item outcome.
+
+    Raises:
+        ValueError: If `concurrency` is lower than 1.
+    """
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def run(index: int, kwargs: Kwargs) -> BatchResult:
+        try:
+            return BatchResult(index, kwargs, result=await func(**kwargs))
+        except Exception as exc:  # pylint: disable=broad-except
+            return BatchResult(index, kwargs, exception=exc)
+
+    source = _aiterate(items).__aiter__()
+    queue: _Deque["_asyncio.Future[BatchResult]"] = _deque()
+    running: _Set["_asyncio.Future[BatchResult]"] = set()
+    exhausted = False
+    index = 0
+
+    try:
+        while True:
+            while not exhausted and len(running) < concurrency:
+                try:
+                    kwargs = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+
+                task = _asyncio.ensure_future(run(index, kwargs))
+                running.add(task)
+                if ordered:
+                    queue.append(task)
+                index += 1
+
+            if not running:
+                return
+
+            if ordered:
+                head = queue.popleft()
+                result = await head
+                running.discard(head)
+                yield result
+            else:
+                done, _ = await _asyncio.wait(running, return_when=_asyncio.FIRST_COMPLETED)
+                running.difference_update(done)
+                for finished in done:
+                    yield finished.result()
+    finally:
+        for pending in running:
+            pending.cancel()
@@ -4,55 +4,130 @@ Async client for Plisio API.
 
 # pylint: disable=unused-argument
 
-
-from aiohttp import ClientSession as _Session
+import asyncio as _asyncio
+from functools import partial as _partial
+from inspect import isawaitable as _isawaitable
+from time import monotonic as _monotonic
+from typing import (
+    Any as _Any,
+    AsyncGenerator as _AsyncGenerator,
+    AsyncIterator as _AsyncIterator,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+)
+from uuid import uuid4 as _uuid4
 
 from ._base import BaseClient as _BaseClient
+from ._batch import (
+    BatchResult as _BatchResult,
+    KwargsIterable as _KwargsIterable,
+    PayoutResult as _PayoutResult,
+    abounded_map as _abounded_map,
+)
 from .. import _types as _t
 from .. import exceptions as _e
+from .._singleflight import AsyncSingleFlight as _AsyncSingleFlight
+from .._stream import ArrayStream as _ArrayStream
+from ..cache import MISSING as _MISSING
 from ..enums import Methods as _Methods
+from ..transports import (
+    AiohttpTransport as _AiohttpTransport,
+    AsyncTransport as _AsyncTransport,
+    PoolStats as _PoolStats,
+    TransportResponse as _TransportResponse,
+)
+from ..transports._base import CHUNK_SIZE as _CHUNK_SIZE
+from ..utils import encode_value as _encode_value
 
 
-class AsyncClient(_BaseClient):
+class AsyncClient(_BaseClient[_t.AwaitableResult]):
     """
     Async client for Plisio API.
+
+    The HTTP session is created lazily on the first request, inside the running event loop.
+    Use the client as an async context manager or call `aclose` to release it.
     """
 
-    def _init_session(self) -> _t.AsyncRequestSession:
-        headers = self._get_headers()
-        return _Session(
-            headers=headers,
-        )
+    _transport: _AsyncTransport
 
-    async def _handle_response(  # type: ignore[override] # pylint: disable=invalid-overridden-method
-        self, response: _t.AsyncRequestResponse
-    ) -> _t.Result:
+    def __init__(  # type: ignore[no-untyped-def] # pylint: disable=too-many-arguments
+        self,
+        api_key: _t.Text,
+        requests_params: _t.RequestParams = None,
+        connector: _t.OptionalAsyncConnector = None,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        ttl_dns_cache: _t.OptionalInt = 10,
+        hedge: _t.OptionalHedgePolicy = None,
+        transport: _t.OptionalAsyncTransport = None,
+        **kwargs,
+    ):
         """
-        Handle response.
+        Initialize client.
 
         Args:
-            response (Response): Response.
+            api_key (str): API key.
+            requests_params (RequestParams): Request params.
+            connector (TCPConnector): Shared connector, left open when the client is closed.
+            connector_limit (int): Total simultaneous connections of the owned connector.
+            connector_limit_per_host (int): Simultaneous connections per host of the owned connector, 0 for no limit.
+            ttl_dns_cache (int): DNS cache TTL in seconds of the owned connector, `None` to cache forever.
+            hedge (HedgePolicy): Policy hedging slow read-only requests, `None` to disable hedging.
+            transport (AsyncTransport): Transport sending the requests, e.g. `AsyncHttpxTransport` for HTTP/2.
+                Defaults to an `AiohttpTransport` built from the connector options, which are ignored otherwise.
+            **kwargs: Options of `BaseClient`.
+        """
+
+        self._transport = transport or _AiohttpTransport(
+            connector=connector,
+            limit=connector_limit,
+            limit_per_host=connector_limit_per_host,
+            ttl_dns_cache=ttl_dns_cache,
+        )
+        self._flight = _AsyncSingleFlight()
+        self._hedge = hedge
+        super().__init__(api_key, requests_params, **kwargs)
+
+    async def __aenter__(self) -> "AsyncClient":
+        """
+        Enter context.
 
         Returns:
-            Response: Response.
+            AsyncClient: Client.
+        """
 
-        Raises:
-            PlisioRequestException: If request failed.
-            PlisioAPIException: If API returned error.
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:  # type: ignore[no-untyped-def]
+        """
+        Exit context and close the session.
         """
 
-        if not 200 <= response.status < 300:
-            raise _e.PlisioAPIException(response, response.status, await response.text())
+        await self.aclose()
 
-        try:
-            data: _t.Result = await response.json()
-        except ValueError as exc:
-            txt: str = await response.text()
-            raise _e.PlisioRequestException(f"Invalid JSON response: {txt}") from exc
+    async def aclose(self) -> None:
+        """
+        Close the transport.
+
+        Connections are released too, unless the connector or client of the transport was passed in by the caller.
+        """
+
+        await self._transport.aclose()
+
+    def pool_stats(self) -> _PoolStats:
+        """
+        Get connection pool occupancy statistics.
+
+        Returns:
+            dict: Statistics keyed by `scheme://host:port`, empty if the transport does not expose them.
+        """
 
-        return data
+        return self._transport.pool_stats()
 
-    async def _request(  # type: ignore[override, no-untyped-def] # pylint: disable=invalid-overridden-method
+    async def _request(  # type: ignore[no-untyped-def] # pylint: disable=invalid-overridden-method
         self, method: _t.Methods, uri: _t.Text, force_params: bool = False, **kwargs
     ) -> _t.Result:
         """
@@ -73,19 +148,36 @@ class AsyncClient(_BaseClient):
         """
         requests_kwargs = self._get_request_kwargs(method, force_params, **kwargs)
 
-        async with getattr(self._session, str(method).lower())(uri, **requests_kwargs) as response:
-            return await self._handle_response(response)
+        endpoint = self._get_endpoint(uri)
+        key = self._get_cache_key(endpoint, requests_kwargs)
+
+        cache_ttl = self._get_cache_ttl(method, endpoint)
+        if cache_ttl is not None:
+            cached = self._cache.get(key)  # type: ignore[union-attr]
+            if cached is not _MISSING:
+                return cached  # type: ignore[no-any-return]
+
+        if self._coalesce and self._is_safe(method, endpoint):
+            result: _t.Result = await self._flight.do(key, lambda: self._send(method, uri, endpoint, requests_kwargs))
+        else:
+            result = await self._send(method, uri, endpoint, requests_kwargs)
 
-    async def _get(  # type: ignore[override, no-untyped-def] # pylint: disable=invalid-overridden-method
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
+        if cache_ttl is not None:
+            self._cache.set(key, result, cache_ttl)  # type: ignore[union-attr]
+
+        return result
+
+    async def _send(
+        self, method: _t.Methods, uri: _t.Text, endpoint: _t.Text, requests_kwargs: _t.DictAny
     ) -> _t.Result:
         """
-        Make GET request.
+        Send a request, retrying according to the retry policy.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            method (Methods): Method.
+            uri (str): URI.
+            endpoint (str): Endpoint path.
+            requests_kwargs (dict): Request kwargs.
 
         Returns:
             dict: Response data.
@@ -94,19 +186,110 @@ class AsyncClient(_BaseClient):
             PlisioRequestException: If request failed.
             PlisioAPIException: If API returned error.
         """
-        uri = self._get_uri(path, version)
-        return await self._request(_Methods.GET, uri, **kwargs)
 
-    async def _post(  # type: ignore[override, no-untyped-def] # pylint: disable=invalid-overridden-method
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
-    ) -> _t.Result:
+        timeout = self._get_timeout(endpoint)
+        started = _monotonic()
+        deadline = self._get_deadline(timeout, started)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if self._rate_limiter is not None:
+                self.metrics.observe("rate_limit_wait", await self._rate_limiter.acquire_async(endpoint))
+
+            remaining = self._get_remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                self.metrics.incr("errors")
+                raise self._transport.TIMEOUT_EXCEPTION("Total timeout exceeded")
+
+            attempt_kwargs = requests_kwargs
+            if "timeout" not in requests_kwargs:
+                attempt_kwargs = {**requests_kwargs, "timeout": self._transport.get_timeout(timeout, remaining)}
+
+            self._check_circuit(endpoint)
+            self.metrics.incr("requests")
+
+            try:
+                result = await self._attempt(method, uri, endpoint, attempt_kwargs)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._record_outcome(endpoint, exc)
+
+                delay = self._get_retry_delay(exc, attempt, started, method, endpoint, deadline)
+                if delay is None:
+                    self.metrics.incr("errors")
+                    raise
+
+                self.metrics.incr("retries")
+                await _asyncio.sleep(delay)
+            except BaseException as exc:
+                self._record_outcome(endpoint, exc)
+                raise
+            else:
+                self._record_outcome(endpoint)
+                return result
+
+    async def _stream(
+        self, method: _t.Methods, uri: _t.Text, key: _t.Text, requests_kwargs: _t.DictAny, chunk_size: int
+    ) -> _AsyncIterator[_t.DictAny]:
         """
-        Make POST request.
+        Send a request and yield the objects of an array of the response as they arrive.
+
+        The request is neither hedged nor retried, since objects may already have been yielded when it fails.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            method (Methods): Method.
+            uri (str): URI.
+            key (str): Key of the streamed array.
+            requests_kwargs (dict): Request kwargs.
+            chunk_size (int): Size in bytes of the body chunks.
+
+        Yields:
+            dict: Object of the array.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        endpoint = self._get_endpoint(uri)
+        if self._rate_limiter is not None:
+            self.metrics.observe("rate_limit_wait", await self._rate_limiter.acquire_async(endpoint))
+
+        if "timeout" not in requests_kwargs:
+            requests_kwargs = {**requests_kwargs, "timeout": self._transport.get_timeout(self._get_timeout(endpoint))}
+
+        self._check_circuit(endpoint)
+        self.metrics.incr("requests")
+
+        try:
+            async with self._transport.stream(str(method).upper(), uri, chunk_size, **requests_kwargs) as response:
+                if not 200 <= response.status < 300:
+                    content = b"".join([chunk async for chunk in response.chunks])
+                    self._handle_response(_TransportResponse(response.status, response.headers, content, response.raw))
+
+                parser = _ArrayStream(key, self.codec.loads)
+                async for chunk in response.chunks:
+                    for item in parser.feed(chunk):
+                        yield item
+                parser.close()
+        except Exception as exc:
+            self._record_outcome(endpoint, exc)
+            self.metrics.incr("errors")
+            raise
+        except BaseException as exc:
+            self._record_outcome(endpoint, exc)
+            raise
+        else:
+            self._record_outcome(endpoint)
+
+    async def _fetch(self, method: _t.Methods, uri: _t.Text, requests_kwargs: _t.DictAny) -> _t.Result:
+        """
+        Make a single request over the transport.
+
+        Args:
+            method (Methods): Method.
+            uri (str): URI.
+            requests_kwargs (dict): Request kwargs.
 
         Returns:
             dict: Response data.
@@ -116,19 +299,20 @@ class AsyncClient(_BaseClient):
             PlisioAPIException: If API returned error.
         """
 
-        uri = self._get_uri(path, version)
-        return await self._request(_Methods.POST, uri, **kwargs)
+        response = await self._transport.request(str(method).upper(), uri, **requests_kwargs)
+        return self._handle_response(response)
 
-    async def _put(  # type: ignore[override, no-untyped-def] # pylint: disable=invalid-overridden-method
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
+    async def _fetch_hedge(
+        self, method: _t.Methods, uri: _t.Text, endpoint: _t.Text, requests_kwargs: _t.DictAny
     ) -> _t.Result:
         """
-        Make PUT request.
+        Make the hedge request of an attempt, through the rate limiter and counted like any other request.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            method (Methods): Method.
+            uri (str): URI.
+            endpoint (str): Endpoint path.
+            requests_kwargs (dict): Request kwargs.
 
         Returns:
             dict: Response data.
@@ -138,37 +322,143 @@ class AsyncClient(_BaseClient):
             PlisioAPIException: If API returned error.
         """
 
-        uri = self._get_uri(path, version)
-        return await self._request(_Methods.PUT, uri, **kwargs)
+        if self._rate_limiter is not None:
+            self.metrics.observe("rate_limit_wait", await self._rate_limiter.acquire_async(endpoint))
+
+        self.metrics.incr("requests")
+        return await self._fetch(method, uri, requests_kwargs)
 
-    async def _delete(  # type: ignore[override, no-untyped-def] # pylint: disable=invalid-overridden-method
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
+    async def _attempt(
+        self, method: _t.Methods, uri: _t.Text, endpoint: _t.Text, requests_kwargs: _t.DictAny
     ) -> _t.Result:
         """
-        Make DELETE request.
+        Make one attempt of a request, hedging it if the hedge policy applies.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            method (Methods): Method.
+            uri (str): URI.
+            endpoint (str): Endpoint path.
+            requests_kwargs (dict): Request kwargs.
 
         Returns:
-            dict: Response data.
+            dict: Response data of the first successful request.
 
         Raises:
             PlisioRequestException: If request failed.
             PlisioAPIException: If API returned error.
         """
 
-        uri = self._get_uri(path, version)
-        return await self._request(_Methods.DELETE, uri, **kwargs)
+        hedge = self._hedge
+        if hedge is None or not self._is_safe(method, endpoint) or not hedge.applies(endpoint):
+            return await self._fetch(method, uri, requests_kwargs)
+
+        hedge.start()
+        delay = hedge.get_delay(endpoint)
+        first = _asyncio.ensure_future(self._fetch(method, uri, requests_kwargs))
+        started = {first: _monotonic()}
+        pending = {first}
+        error: _Optional[BaseException] = None
+
+        try:
+            done, pending = await _asyncio.wait(pending, timeout=delay)
+
+            if not done and hedge.try_hedge():
+                self.metrics.incr("hedges")
+                second = _asyncio.ensure_future(self._fetch_hedge(method, uri, endpoint, requests_kwargs))
+                started[second] = _monotonic()
+                pending.add(second)
+
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        # Latency of the winning request itself, so hedged tails don't inflate the delay
+                        hedge.record(endpoint, _monotonic() - started[task])
+                        return task.result()  # type: ignore[no-any-return]
+                    error = error or task.exception()
+
+                if not pending:
+                    raise error  # type: ignore[misc]
+
+                done, pending = await _asyncio.wait(pending, return_when=_asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _idempotent(self, order_number: _t.NumberLike, func: _Callable[[], _Awaitable[_t.Result]]) -> _t.Result:
+        """
+        Make an idempotent call keyed by an order number.
+
+        Concurrent calls with the same order number share one request. With an idempotency store, a result
+        remembered from a previous call is returned without sending a request, and a call reserved by another
+        process is waited for.
+
+        Args:
+            order_number (str): Order number.
+            func (Callable): Coroutine function making the request.
+
+        Returns:
+            dict: Response data.
+        """
+
+        key = self._get_idempotency_key(order_number)
+        store = self._idempotency
+
+        async def call() -> _t.Result:
+            if store is None:
+                return await func()
+
+            delay = self.IDEMPOTENCY_POLL_INTERVAL
+            while True:
+                cached: _Any = await self._call_store(store.get, key)
+                if cached is not None:
+                    self.metrics.incr("idempotent_hits")
+                    return cached  # type: ignore[no-any-return]
+                if await self._call_store(store.reserve, key):
+                    break
+
+                self.metrics.incr("idempotent_waits")
+                await _asyncio.sleep(delay)
+                delay = min(delay * 2, self.IDEMPOTENCY_MAX_POLL_INTERVAL)
+
+            try:
+                result = await func()
+            except BaseException:
+                await _asyncio.shield(self._call_store(store.release, key))
+                raise
+
+            await self._call_store(store.set, key, result)
+            return result
+
+        return await self._flight.do(key, call)  # type: ignore[no-any-return]
+
+    async def _call_store(self, method: _Callable[..., _Any], *args: _Any) -> _Any:
+        """
+        Call a method of the idempotency store, in a thread if the store is blocking.
+
+        Args:
+            method (Callable): Store method.
+            *args: Arguments.
+
+        Returns:
+            Any: Result, awaited if the store returned an awaitable.
+        """
+
+        if self._idempotency is not None and self._idempotency.blocking:
+            result = await _asyncio.get_running_loop().run_in_executor(None, _partial(method, *args))
+        else:
+            result = method(*args)
+
+        if _isawaitable(result):
+            result = await result
+
+        return result
 
     async def invoice(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         order_name: _t.Text,
         currency: _t.Currencies,
         amount: _t.NumberLike,
-        order_number: _t.NumberLike,
+        order_number: _t.OptionalNumberLike = None,
         source_currency: _t.OptionalFiats = None,
         source_amount: _t.OptionalNumberLike = None,
         allowed_psys_cids: _t.OptionalPsysCids = None,
@@ -191,7 +481,7 @@ class AsyncClient(_BaseClient):
 
         Args:
             order_name (str): Order name.
-            order_number (int): Order number.
+            order_number (int): Order number, the idempotency key of the invoice. A new UUID by default.
             currency (str): Currency.
             amount (float): Amount.
             source_currency (str): Source currency.
@@ -216,8 +506,11 @@ class AsyncClient(_BaseClient):
             PlisioAPIException: If API returned error.
         """
 
+        if order_number is None:
+            order_number = str(_uuid4())
+
         params = self._get_params(locals())
-        return await self._get("invoices/new", data=params, force_params=True)
+        return await self._idempotent(order_number, lambda: self._get("invoices/new", data=params, force_params=True))
 
     async def transactions(  # pylint: disable=too-many-arguments
         self,
@@ -255,6 +548,211 @@ class AsyncClient(_BaseClient):
         params = self._get_params(locals())
         return await self._get("operations", data=params, force_params=True)
 
+    async def aiter_transactions(  # pylint: disable=too-many-arguments
+        self,
+        limit: _t.OptionalNumberLike = None,
+        shop_id: _t.OptionalNumberLike = None,
+        type: _t.OptionalTransactionStatus = None,  # pylint: disable=redefined-builtin
+        status: _t.OptionalTransactionStatus = None,
+        currency: _t.OptionalCurrencies = None,
+        search: _t.OptionalText = None,
+        prefetch: bool = False,
+    ) -> _AsyncIterator[_t.DictAny]:
+        """
+        Iterate over transactions of all pages.
+
+        Pages are fetched lazily, so only one (two with `prefetch`) page is held in memory at a time.
+
+        Args:
+            limit (int): Page size.
+            shop_id (int): Shop ID.
+            type (str): Type.
+            status (str): Status.
+            currency (str): Currency.
+            search (str): Search.
+            prefetch (bool): Fetch the next page concurrently while the current one is consumed.
+
+        Yields:
+            dict: Operation.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        params: _t.DictAny = dict(self._get_params(locals()))
+        del params["prefetch"]
+
+        upcoming: "_Optional[_asyncio.Future[_t.Result]]" = None
+        try:
+            page: _t.OptionalInt = 1
+            result = await self.transactions(page=page, **params)
+
+            while page is not None:
+                page = self._get_next_page(result)
+                if prefetch and page is not None:
+                    upcoming = _asyncio.ensure_future(self.transactions(page=page, **params))
+
+                for operation in self._get_operations(result):
+                    yield operation
+
+                if page is not None:
+                    result = await upcoming if upcoming else await self.transactions(page=page, **params)
+                    upcoming = None
+        finally:
+            if upcoming is not None:
+                upcoming.cancel()
+
+    def astream_transactions(  # pylint: disable=too-many-arguments
+        self,
+        page: _t.OptionalNumberLike = None,
+        limit: _t.OptionalNumberLike = None,
+        shop_id: _t.OptionalNumberLike = None,
+        type: _t.OptionalTransactionStatus = None,  # pylint: disable=redefined-builtin
+        status: _t.OptionalTransactionStatus = None,
+        currency: _t.OptionalCurrencies = None,
+        search: _t.OptionalText = None,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> _AsyncIterator[_t.DictAny]:
+        """
+        Stream the transactions of one page.
+
+        The `operations` array is parsed incrementally from the response body and each operation is yielded as
+        soon as it is received, so peak memory does not grow with `limit`. Responses are neither cached nor
+        retried.
+
+        Args:
+            page (int): Page.
+            limit (int): Limit.
+            shop_id (int): Shop ID.
+            type (str): Type.
+            status (str): Status.
+            currency (str): Currency.
+            search (str): Search.
+            chunk_size (int): Size in bytes of the body chunks.
+
+        Returns:
+            AsyncIterator[dict]: Operations, the request is sent when iteration starts.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        params: _t.DictAny = dict(self._get_params(locals()))
+        del params["chunk_size"]
+
+        requests_kwargs = self._get_request_kwargs(_Methods.GET, force_params=True, data=params)
+        return self._stream(_Methods.GET, self._get_uri("operations"), "operations", requests_kwargs, chunk_size)
+
+    async def aiter_transaction_pages(  # pylint: disable=too-many-arguments
+        self,
+        limit: _t.OptionalNumberLike = None,
+        shop_id: _t.OptionalNumberLike = None,
+        type: _t.OptionalTransactionStatus = None,  # pylint: disable=redefined-builtin
+        status: _t.OptionalTransactionStatus = None,
+        currency: _t.OptionalCurrencies = None,
+        search: _t.OptionalText = None,
+        concurrency: int = 4,
+    ) -> _AsyncGenerator[_t.ListDictAny, None]:
+        """
+        Iterate over the operations of every page, fetching pages in parallel.
+
+        The first page is fetched alone to learn the page count, the remaining pages are then fetched
+        with at most `concurrency` requests in flight and yielded in page order. Requests still in flight are
+        cancelled when a page fails or the iterator is closed, so stop early with `await pages.aclose()`.
+
+        Args:
+            limit (int): Page size.
+            shop_id (int): Shop ID.
+            type (str): Type.
+            status (str): Status.
+            currency (str): Currency.
+            search (str): Search.
+            concurrency (int): Maximum number of page requests in flight.
+
+        Yields:
+            list: Operations of one page.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        params: _t.DictAny = dict(self._get_params(locals()))
+        del params["concurrency"]
+
+        first = await self.transactions(page=1, **params)
+        yield self._get_operations(first)
+
+        if self._get_next_page(first) is None:
+            return
+
+        pages = ({"page": page, **params} for page in range(2, self._get_page_count(first) + 1))
+        results = _abounded_map(self.transactions, pages, concurrency, ordered=True)
+        try:
+            async for result in results:
+                yield self._get_operations(result.unwrap())
+        finally:
+            await results.aclose()
+
+    async def export_transactions(  # pylint: disable=too-many-arguments
+        self,
+        sink: _t.ExportSink,
+        limit: _t.OptionalNumberLike = None,
+        shop_id: _t.OptionalNumberLike = None,
+        type: _t.OptionalTransactionStatus = None,  # pylint: disable=redefined-builtin
+        status: _t.OptionalTransactionStatus = None,
+        currency: _t.OptionalCurrencies = None,
+        search: _t.OptionalText = None,
+        concurrency: int = 4,
+    ) -> int:
+        """
+        Export every transaction to a sink, fetching pages in parallel.
+
+        Pages are written in order. A callable sink is called with the operations of each page (and awaited
+        if it returns an awaitable), a file-like sink gets one JSON document per line.
+        Use `aiter_transaction_pages` to consume the pages as an async iterator instead.
+
+        Args:
+            sink (Callable | file): Page callback or object with a `write` method.
+            limit (int): Page size.
+            shop_id (int): Shop ID.
+            type (str): Type.
+            status (str): Status.
+            currency (str): Currency.
+            search (str): Search.
+            concurrency (int): Maximum number of page requests in flight.
+
+        Returns:
+            int: Number of exported operations.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        params: _t.DictAny = dict(self._get_params(locals()))
+        del params["sink"]
+
+        count = 0
+        pages = self.aiter_transaction_pages(**params)
+        try:
+            async for operations in pages:
+                if hasattr(sink, "write"):
+                    written = sink.write("".join(self.codec.dumps_str(operation) + "\n" for operation in operations))
+                else:
+                    written = sink(operations)
+
+                if _isawaitable(written):
+                    await written
+
+                count += len(operations)
+        finally:
+            await pages.aclose()
+
+        return count
+
     async def withdraw(  # pylint: disable=too-many-arguments
         self,
         currency: _t.Currencies,
@@ -377,6 +875,76 @@ class AsyncClient(_BaseClient):
         params = self._get_params(locals())
         return await self._get("operations/fee", data=params, force_params=True)
 
+    async def _withdraw_chunk(  # pylint: disable=too-many-arguments
+        self,
+        currency: _t.Currencies,
+        type: _t.WithdrawType,  # pylint: disable=redefined-builtin
+        to: _t.ListStr,  # pylint: disable=invalid-name
+        amount: _t.ListNumberLike,
+        fee_plan: _t.OptionalFeePlans,
+        estimate_fee: bool,
+    ) -> _t.DictAny:
+        """
+        Estimate the fee of a chunk of payouts, then withdraw it.
+
+        Args:
+            currency (str): Currency.
+            type (str): Type.
+            to (list): Addresses.
+            amount (list): Amounts.
+            fee_plan (str): Fee plan.
+            estimate_fee (bool): Estimate the fee before withdrawing.
+
+        Returns:
+            dict: `fee` and `withdraw` responses.
+        """
+
+        fee = await self.fee_estimation(currency, to, amount, fee_plan) if estimate_fee else None
+        result = await self.withdraw(currency, type, _encode_value(to), _encode_value(amount), fee_plan)
+        return {"fee": fee, "withdraw": result}
+
+    async def withdraw_batch(  # pylint: disable=too-many-arguments
+        self,
+        payouts: _Iterable[_t.Payout],
+        currency: _t.Currencies,
+        fee_plan: _t.OptionalFeePlans = None,
+        concurrency: int = 4,
+        max_payouts: _t.OptionalInt = None,
+        estimate_fee: bool = True,
+    ) -> _List[_PayoutResult]:
+        """
+        Send many payouts as few mass withdrawals.
+
+        Payouts are packed in input order into requests of at most `max_payouts` payouts whose URLs stay within
+        `MAX_URL_LENGTH`, then sent with at most `concurrency` requests in flight. With `estimate_fee` each
+        request is preceded by a fee estimation of the same payouts, so a chunk the API rejects (unknown address,
+        insufficient balance) fails before anything is withdrawn.
+
+        Withdrawals are not retried. A chunk failing with a transport error may still have been executed, check
+        the operations before sending its payouts again.
+
+        Args:
+            payouts (Iterable): `(address, amount)` pairs.
+            currency (str): Currency.
+            fee_plan (str): Fee plan.
+            concurrency (int): Number of requests in flight.
+            max_payouts (int): Maximum number of payouts per request, defaults to `MASS_WITHDRAW_MAX_PAYOUTS`.
+            estimate_fee (bool): Estimate the fee of each request before withdrawing.
+
+        Returns:
+            list[PayoutResult]: Per-payout outcomes in input order, failures are returned rather than raised.
+
+        Raises:
+            ValueError: If `concurrency` or `max_payouts` is lower than 1.
+        """
+
+        chunks = self._get_payout_chunks(payouts, currency, fee_plan, max_payouts, estimate_fee)
+        results = [
+            result
+            async for result in _abounded_map(self._withdraw_chunk, [kwargs for _, kwargs in chunks], concurrency)
+        ]
+        return self._get_payout_results(chunks, results)
+
     async def plisio_fee(  # pylint: disable=too-many-arguments
         self,
         currency: _t.OptionalCurrencies = None,
@@ -424,3 +992,38 @@ class AsyncClient(_BaseClient):
         """
 
         return await self._get("crypto-coins")
+
+    def map(
+        self, method_name: _t.Text, items: _KwargsIterable, concurrency: int = 10, ordered: bool = False
+    ) -> _AsyncIterator[_BatchResult]:
+        """
+        Call a client method once per item with bounded concurrency.
+
+        Args:
+            method_name (str): Name of the client method, e.g. `transaction_details`.
+            items (Iterable): Sync or async iterable of keyword argument dicts, consumed lazily.
+            concurrency (int): Maximum number of requests in flight.
+            ordered (bool): Yield results in input order instead of completion order.
+
+        Returns:
+            AsyncIterator[BatchResult]: Per-item results, failures are returned rather than raised.
+        """
+
+        return _abounded_map(getattr(self, method_name), items, concurrency, ordered)
+
+    def invoice_many(
+        self, specs: _KwargsIterable, concurrency: int = 10, ordered: bool = False
+    ) -> _AsyncIterator[_BatchResult]:
+        """
+        Create many invoices with bounded concurrency.
+
+        Args:
+            specs (Iterable): Sync or async iterable of `invoice` keyword argument dicts, consumed lazily.
+            concurrency (int): Maximum number of requests in flight.
+            ordered (bool): Yield results in input order instead of completion order.
+
+        Returns:
+            AsyncIterator[BatchResult]: Per-invoice results, failures are returned rather than raised.
+        """
+
+        return self.map("invoice", specs, concurrency, ordered)
@@ -4,58 +4,138 @@ Async client for Plisio API.
 
 # pylint: disable=unused-argument
 
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from contextvars import copy_context as _copy_context
+from functools import partial as _partial
+from time import monotonic as _monotonic, sleep as _sleep
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Iterable as _Iterable,
+    Iterator as _Iterator,
+    List as _List,
+)
 from uuid import uuid4 as _uuid4
-import requests as _requests
 
 from ._base import BaseClient as _BaseClient
+from ._batch import (
+    BatchResult as _BatchResult,
+    Kwargs as _Kwargs,
+    PayoutResult as _PayoutResult,
+    bounded_map as _bounded_map,
+)
 from .. import _types as _t
 from .. import exceptions as _e
+from .._singleflight import SingleFlight as _SingleFlight
+from .._stream import ArrayStream as _ArrayStream
+from ..cache import MISSING as _MISSING
 from ..enums import Methods as _Methods
+from ..transports import (
+    PoolStats as _PoolStats,
+    RequestsTransport as _RequestsTransport,
+    Transport as _Transport,
+    TransportResponse as _TransportResponse,
+)
+from ..transports._base import CHUNK_SIZE as _CHUNK_SIZE
+from ..utils import encode_value as _encode_value
 
 
-class Client(_BaseClient):
+class Client(_BaseClient[_t.Result]):
     """
     Async client for Plisio API.
     """
 
-    def _init_session(self) -> _t.SyncRequestSession:
-        """
-        Initialize session.
+    _transport: _Transport
+
+    def __init__(  # type: ignore[no-untyped-def] # pylint: disable=too-many-arguments
+        self,
+        api_key: _t.Text,
+        requests_params: _t.RequestParams = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: _t.OptionalInt = None,
+        transport: _t.OptionalTransport = None,
+        **kwargs,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            api_key (str): API key.
+            requests_params (RequestParams): Request params.
+            pool_connections (int): Number of host pools to cache.
+            pool_maxsize (int): Maximum connections kept alive per host, size it to your worker count.
+            pool_block (bool): Wait for a free connection instead of opening a throw-away one when exhausted.
+            keep_alive (int): TCP keep-alive idle time in seconds, `None` to use the OS default.
+            transport (Transport): Transport sending the requests, e.g. `HttpxTransport` for HTTP/2. Defaults to a
+                `RequestsTransport` built from the pool options, which are ignored otherwise.
+            **kwargs: Options of `BaseClient`.
+        """
+
+        self._transport = transport or _RequestsTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self._flight = _SingleFlight()
+        super().__init__(api_key, requests_params, **kwargs)
+
+    def __enter__(self) -> "Client":
+        """
+        Enter context.
 
         Returns:
-            Session: Session.
+            Client: Client.
         """
 
-        session = _requests.Session()
-        headers = self._get_headers()
-        session.headers.update(headers)
-        return session
+        return self
 
-    def _handle_response(self, response: _t.SyncRequestResponse) -> _t.Result:  # type: ignore[override]
+    def __exit__(self, *exc_info) -> None:  # type: ignore[no-untyped-def]
+        """
+        Exit context and close the session.
         """
-        Handle response.
 
-        Args:
-            response (Response): Response.
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the transport and release pooled connections.
+        """
+
+        self._transport.close()
+
+    def pool_stats(self) -> _PoolStats:
+        """
+        Get connection pool occupancy statistics.
 
         Returns:
-            Response: Response.
+            dict: Statistics keyed by `scheme://host:port` with `maxsize`, `in_use`, `available`,
+                `connections_created` and `requests` counters, empty if the transport does not expose them.
+        """
 
-        Raises:
-            PlisioRequestException: If request failed.
-            PlisioAPIException: If API returned error.
+        return self._transport.pool_stats()
+
+    def map(
+        self, method_name: _t.Text, items: _Iterable[_Kwargs], max_workers: int = 10, ordered: bool = False
+    ) -> _Iterator[_BatchResult]:
         """
+        Call a client method once per item on a thread pool.
 
-        if not 200 <= response.status_code < 300:
-            raise _e.PlisioAPIException(response, response.status_code, response.text)
+        All workers share the client session, so keep `pool_maxsize` at least `max_workers`.
 
-        try:
-            data: _t.Result = response.json()
-        except ValueError as exc:
-            txt: str = response.text
-            raise _e.PlisioRequestException(f"Invalid JSON response: {txt}") from exc
+        Args:
+            method_name (str): Name of the client method, e.g. `transaction_details`.
+            items (Iterable): Iterable of keyword argument dicts, consumed lazily.
+            max_workers (int): Number of worker threads.
+            ordered (bool): Yield results in input order instead of completion order.
 
-        return data
+        Returns:
+            Iterator[BatchResult]: Per-item results, failures are returned rather than raised.
+        """
+
+        return _bounded_map(getattr(self, method_name), items, max_workers, ordered)
 
     def _request(  # type: ignore[no-untyped-def]
         self, method: _t.Methods, uri: _t.Text, force_params: bool = False, **kwargs  # type: ignore[no-untyped-def]
@@ -79,40 +159,34 @@ class Client(_BaseClient):
 
         requests_kwargs = self._get_request_kwargs(method, force_params, **kwargs)
 
-        response = getattr(self._session, str(method).lower())(uri, **requests_kwargs)
-        return self._handle_response(response)
+        endpoint = self._get_endpoint(uri)
+        key = self._get_cache_key(endpoint, requests_kwargs)
 
-    def _get(  # type: ignore[no-untyped-def]
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
-    ) -> _t.Result:
-        """
-        Make GET request.
+        cache_ttl = self._get_cache_ttl(method, endpoint)
+        if cache_ttl is not None:
+            cached = self._cache.get(key)  # type: ignore[union-attr]
+            if cached is not _MISSING:
+                return cached  # type: ignore[no-any-return]
 
-        Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+        if self._coalesce and self._is_safe(method, endpoint):
+            result: _t.Result = self._flight.do(key, lambda: self._send(method, uri, endpoint, requests_kwargs))
+        else:
+            result = self._send(method, uri, endpoint, requests_kwargs)
 
-        Returns:
-            dict: Response data.
+        if cache_ttl is not None:
+            self._cache.set(key, result, cache_ttl)  # type: ignore[union-attr]
 
-        Raises:
-            PlisioRequestException: If request failed.
-            PlisioAPIException: If API returned error.
-        """
-        uri = self._get_uri(path, version)
-        return self._request(_Methods.GET, uri, **kwargs)
+        return result
 
-    def _post(  # type: ignore[no-untyped-def]
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
-    ) -> _t.Result:
+    def _send(self, method: _t.Methods, uri: _t.Text, endpoint: _t.Text, requests_kwargs: _t.DictAny) -> _t.Result:
         """
-        Make POST request.
+        Send a request, retrying according to the retry policy.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            method (Methods): Method.
+            uri (str): URI.
+            endpoint (str): Endpoint path.
+            requests_kwargs (dict): Request kwargs.
 
         Returns:
             dict: Response data.
@@ -122,59 +196,154 @@ class Client(_BaseClient):
             PlisioAPIException: If API returned error.
         """
 
-        uri = self._get_uri(path, version)
-        return self._request(_Methods.POST, uri, **kwargs)
+        timeout = self._get_timeout(endpoint)
+        started = _monotonic()
+        deadline = self._get_deadline(timeout, started)
+        attempt = 0
 
-    def _put(  # type: ignore[no-untyped-def]
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
-    ) -> _t.Result:
+        while True:
+            attempt += 1
+            if self._rate_limiter is not None:
+                self.metrics.observe("rate_limit_wait", self._rate_limiter.acquire(endpoint))
+
+            remaining = self._get_remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                self.metrics.incr("errors")
+                raise self._transport.TIMEOUT_EXCEPTION("Total timeout exceeded")
+
+            attempt_kwargs = requests_kwargs
+            if "timeout" not in requests_kwargs:
+                attempt_kwargs = {**requests_kwargs, "timeout": self._transport.get_timeout(timeout, remaining)}
+
+            self._check_circuit(endpoint)
+            self.metrics.incr("requests")
+
+            try:
+                response = self._transport.request(str(method).upper(), uri, **attempt_kwargs)
+                result = self._handle_response(response)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._record_outcome(endpoint, exc)
+
+                delay = self._get_retry_delay(exc, attempt, started, method, endpoint, deadline)
+                if delay is None:
+                    self.metrics.incr("errors")
+                    raise
+
+                self.metrics.incr("retries")
+                _sleep(delay)
+            except BaseException as exc:
+                self._record_outcome(endpoint, exc)
+                raise
+            else:
+                self._record_outcome(endpoint)
+                return result
+
+    def _stream(
+        self, method: _t.Methods, uri: _t.Text, key: _t.Text, requests_kwargs: _t.DictAny, chunk_size: int
+    ) -> _Iterator[_t.DictAny]:
         """
-        Make PUT request.
+        Send a request and yield the objects of an array of the response as they arrive.
+
+        The request is not retried, since objects may already have been yielded when it fails.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            method (Methods): Method.
+            uri (str): URI.
+            key (str): Key of the streamed array.
+            requests_kwargs (dict): Request kwargs.
+            chunk_size (int): Size in bytes of the body chunks.
 
-        Returns:
-            dict: Response data.
+        Yields:
+            dict: Object of the array.
 
         Raises:
             PlisioRequestException: If request failed.
             PlisioAPIException: If API returned error.
         """
 
-        uri = self._get_uri(path, version)
-        return self._request(_Methods.PUT, uri, **kwargs)
+        endpoint = self._get_endpoint(uri)
+        if self._rate_limiter is not None:
+            self.metrics.observe("rate_limit_wait", self._rate_limiter.acquire(endpoint))
 
-    def _delete(  # type: ignore[no-untyped-def]
-        self, path: _t.Text, version: _t.Text = _BaseClient.API_VERSION_V1, **kwargs
-    ) -> _t.Result:
-        """
-        Make DELETE request.
+        if "timeout" not in requests_kwargs:
+            requests_kwargs = {**requests_kwargs, "timeout": self._transport.get_timeout(self._get_timeout(endpoint))}
+
+        self._check_circuit(endpoint)
+        self.metrics.incr("requests")
+
+        try:
+            with self._transport.stream(str(method).upper(), uri, chunk_size, **requests_kwargs) as response:
+                if not 200 <= response.status < 300:
+                    content = b"".join(response.chunks)
+                    self._handle_response(_TransportResponse(response.status, response.headers, content, response.raw))
+
+                parser = _ArrayStream(key, self.codec.loads)
+                for chunk in response.chunks:
+                    yield from parser.feed(chunk)
+                parser.close()
+        except Exception as exc:
+            self._record_outcome(endpoint, exc)
+            self.metrics.incr("errors")
+            raise
+        except BaseException as exc:
+            self._record_outcome(endpoint, exc)
+            raise
+        else:
+            self._record_outcome(endpoint)
+
+    def _idempotent(self, order_number: _t.NumberLike, func: _Callable[[], _t.Result]) -> _t.Result:
+        """
+        Make an idempotent call keyed by an order number.
+
+        Concurrent calls with the same order number share one request. With an idempotency store, a result
+        remembered from a previous call is returned without sending a request, and a call reserved by another
+        process is waited for.
 
         Args:
-            path (str): Path.
-            version (str): API version.
-            **kwargs: Arguments.
+            order_number (str): Order number.
+            func (Callable): Function making the request.
 
         Returns:
             dict: Response data.
-
-        Raises:
-            PlisioRequestException: If request failed.
-            PlisioAPIException: If API returned error.
         """
 
-        uri = self._get_uri(path, version)
-        return self._request(_Methods.DELETE, uri, **kwargs)
+        key = self._get_idempotency_key(order_number)
+        store = self._idempotency
+
+        def call() -> _t.Result:
+            if store is None:
+                return func()
+
+            delay = self.IDEMPOTENCY_POLL_INTERVAL
+            while True:
+                cached: _Any = store.get(key)
+                if cached is not None:
+                    self.metrics.incr("idempotent_hits")
+                    return cached  # type: ignore[no-any-return]
+                if store.reserve(key):
+                    break
+
+                self.metrics.incr("idempotent_waits")
+                _sleep(delay)
+                delay = min(delay * 2, self.IDEMPOTENCY_MAX_POLL_INTERVAL)
+
+            try:
+                result = func()
+            except BaseException:
+                store.release(key)
+                raise
+
+            store.set(key, result)
+            return result
+
+        return self._flight.do(key, call)  # type: ignore[no-any-return]
 
     def invoice(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         order_name: _t.Text,
         currency: _t.Currencies,
         amount: _t.NumberLike,
-        order_number: _t.NumberLike = str(_uuid4()),
+        order_number: _t.OptionalNumberLike = None,
         source_currency: _t.OptionalFiats = None,
         source_amount: _t.OptionalNumberLike = None,
         allowed_psys_cids: _t.OptionalPsysCids = None,
@@ -197,7 +366,7 @@ class Client(_BaseClient):
 
         Args:
             order_name (str): Order name.
-            order_number (int): Order number.
+            order_number (int): Order number, the idempotency key of the invoice. A new UUID by default.
             currency (str): Currency.
             amount (float): Amount.
             source_currency (str): Source currency.
@@ -222,8 +391,11 @@ class Client(_BaseClient):
             PlisioAPIException: If API returned error.
         """
 
+        if order_number is None:
+            order_number = str(_uuid4())
+
         params = self._get_params(locals())
-        return self._get("invoices/new", data=params, force_params=True)
+        return self._idempotent(order_number, lambda: self._get("invoices/new", data=params, force_params=True))
 
     def transactions(  # pylint: disable=too-many-arguments
         self,
@@ -261,6 +433,105 @@ class Client(_BaseClient):
         params = self._get_params(locals())
         return self._get("operations", data=params, force_params=True)
 
+    def iter_transactions(  # pylint: disable=too-many-arguments
+        self,
+        limit: _t.OptionalNumberLike = None,
+        shop_id: _t.OptionalNumberLike = None,
+        type: _t.OptionalTransactionStatus = None,  # pylint: disable=redefined-builtin
+        status: _t.OptionalTransactionStatus = None,
+        currency: _t.OptionalCurrencies = None,
+        search: _t.OptionalText = None,
+        prefetch: bool = False,
+    ) -> _Iterator[_t.DictAny]:
+        """
+        Iterate over transactions of all pages.
+
+        Pages are fetched lazily, so only one (two with `prefetch`) page is held in memory at a time.
+
+        Args:
+            limit (int): Page size.
+            shop_id (int): Shop ID.
+            type (str): Type.
+            status (str): Status.
+            currency (str): Currency.
+            search (str): Search.
+            prefetch (bool): Fetch the next page in a background thread while the current one is consumed. The
+                thread runs in a copy of the current context, so `use_timeout` applies to it.
+
+        Yields:
+            dict: Operation.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        params: _t.DictAny = dict(self._get_params(locals()))
+        del params["prefetch"]
+
+        executor = _ThreadPoolExecutor(max_workers=1, thread_name_prefix="plisio-prefetch") if prefetch else None
+        try:
+            page: _t.OptionalInt = 1
+            result = self.transactions(page=page, **params)
+
+            while page is not None:
+                page = self._get_next_page(result)
+                upcoming = (
+                    executor.submit(_copy_context().run, _partial(self.transactions, page=page, **params))
+                    if executor and page
+                    else None
+                )
+
+                yield from self._get_operations(result)
+
+                if page is not None:
+                    result = upcoming.result() if upcoming else self.transactions(page=page, **params)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def stream_transactions(  # pylint: disable=too-many-arguments
+        self,
+        page: _t.OptionalNumberLike = None,
+        limit: _t.OptionalNumberLike = None,
+        shop_id: _t.OptionalNumberLike = None,
+        type: _t.OptionalTransactionStatus = None,  # pylint: disable=redefined-builtin
+        status: _t.OptionalTransactionStatus = None,
+        currency: _t.OptionalCurrencies = None,
+        search: _t.OptionalText = None,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> _Iterator[_t.DictAny]:
+        """
+        Stream the transactions of one page.
+
+        The `operations` array is parsed incrementally from the response body and each operation is yielded as
+        soon as it is received, so peak memory does not grow with `limit`. Responses are neither cached nor
+        retried.
+
+        Args:
+            page (int): Page.
+            limit (int): Limit.
+            shop_id (int): Shop ID.
+            type (str): Type.
+            status (str): Status.
+            currency (str): Currency.
+            search (str): Search.
+            chunk_size (int): Size in bytes of the body chunks.
+
+        Returns:
+            Iterator[dict]: Operations, the request is sent when iteration starts.
+
+        Raises:
+            PlisioRequestException: If request failed.
+            PlisioAPIException: If API returned error.
+        """
+
+        params: _t.DictAny = dict(self._get_params(locals()))
+        del params["chunk_size"]
+
+        requests_kwargs = self._get_request_kwargs(_Methods.GET, force_params=True, data=params)
+        return self._stream(_Methods.GET, self._get_uri("operations"), "operations", requests_kwargs, chunk_size)
+
     def withdraw(  # pylint: disable=too-many-arguments
         self,
         currency: _t.Currencies,
@@ -353,7 +624,7 @@ class Client(_BaseClient):
 
         return self._get("operations/fee-plan", data={"psys_cid": psys_cid}, force_params=True)
 
-    async def fee_estimation(
+    def fee_estimation(
         self,
         currency: _t.OptionalCurrencies = None,
         addresses: _t.OptionalListStr = None,
@@ -383,6 +654,73 @@ class Client(_BaseClient):
         params = self._get_params(locals())
         return self._get("operations/fee", data=params, force_params=True)
 
+    def _withdraw_chunk(  # pylint: disable=too-many-arguments
+        self,
+        currency: _t.Currencies,
+        type: _t.WithdrawType,  # pylint: disable=redefined-builtin
+        to: _t.ListStr,  # pylint: disable=invalid-name
+        amount: _t.ListNumberLike,
+        fee_plan: _t.OptionalFeePlans,
+        estimate_fee: bool,
+    ) -> _t.DictAny:
+        """
+        Estimate the fee of a chunk of payouts, then withdraw it.
+
+        Args:
+            currency (str): Currency.
+            type (str): Type.
+            to (list): Addresses.
+            amount (list): Amounts.
+            fee_plan (str): Fee plan.
+            estimate_fee (bool): Estimate the fee before withdrawing.
+
+        Returns:
+            dict: `fee` and `withdraw` responses.
+        """
+
+        fee = self.fee_estimation(currency, to, amount, fee_plan) if estimate_fee else None
+        result = self.withdraw(currency, type, _encode_value(to), _encode_value(amount), fee_plan)
+        return {"fee": fee, "withdraw": result}
+
+    def withdraw_batch(  # pylint: disable=too-many-arguments
+        self,
+        payouts: _Iterable[_t.Payout],
+        currency: _t.Currencies,
+        fee_plan: _t.OptionalFeePlans = None,
+        max_workers: int = 4,
+        max_payouts: _t.OptionalInt = None,
+        estimate_fee: bool = True,
+    ) -> _List[_PayoutResult]:
+        """
+        Send many payouts as few mass withdrawals.
+
+        Payouts are packed in input order into requests of at most `max_payouts` payouts whose URLs stay within
+        `MAX_URL_LENGTH`, then sent on a thread pool. With `estimate_fee` each request is preceded by a fee
+        estimation of the same payouts, so a chunk the API rejects (unknown address, insufficient balance) fails
+        before anything is withdrawn.
+
+        Withdrawals are not retried. A chunk failing with a transport error may still have been executed, check
+        the operations before sending its payouts again.
+
+        Args:
+            payouts (Iterable): `(address, amount)` pairs.
+            currency (str): Currency.
+            fee_plan (str): Fee plan.
+            max_workers (int): Number of requests in flight.
+            max_payouts (int): Maximum number of payouts per request, defaults to `MASS_WITHDRAW_MAX_PAYOUTS`.
+            estimate_fee (bool): Estimate the fee of each request before withdrawing.
+
+        Returns:
+            list[PayoutResult]: Per-payout outcomes in input order, failures are returned rather than raised.
+
+        Raises:
+            ValueError: If `max_workers` or `max_payouts` is lower than 1.
+        """
+
+        chunks = self._get_payout_chunks(payouts, currency, fee_plan, max_payouts, estimate_fee)
+        results = _bounded_map(self._withdraw_chunk, [kwargs for _, kwargs in chunks], max_workers)
+        return self._get_payout_results(chunks, results)
+
     def plisio_fee(  # pylint: disable=too-many-arguments
         self,
         currency: _t.OptionalCurrencies = None,
@@ -0,0 +1,212 @@
+"""
+JSON codecs for plisio.
+
+The default codec is the fastest one installed: orjson, then msgspec, then ujson, then the standard library.
+"""
+
+import json as _json
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Optional as _Optional,
+    Type as _Type,
+    Union as _Union,
+)
+
+__all__ = ["Codec", "JSON_CODEC", "get_codec", "default_codec"]
+
+Loads = _Callable[[_Union[bytes, str]], _Any]
+Dumps = _Callable[[_Any], bytes]
+ErrorType = _Type[BaseException]
+
+
+class Codec:
+    """
+    JSON codec: a decoder accepting `bytes` or `str` and an encoder returning `bytes`.
+
+    The decoder raises `ValueError` on invalid input, which clients turn into `PlisioAPIException` or
+    `PlisioRequestException`.
+    """
+
+    __slots__ = ("name", "loads", "dumps")
+
+    def __init__(self, name: str, loads: Loads, dumps: Dumps):
+        """
+        Initialize codec.
+
+        Args:
+            name (str): Name.
+            loads (Callable): Decoder, must accept `bytes` and `str` and raise `ValueError` on invalid input.
+            dumps (Callable): Encoder returning UTF-8 `bytes`.
+        """
+
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"{self.__class__.__name__}({self.name!r})"
+
+    def dumps_str(self, obj: _Any) -> str:
+        """
+        Encode an object to a JSON string.
+
+        Args:
+            obj (Any): Object.
+
+        Returns:
+            str: JSON.
+        """
+
+        return self.dumps(obj).decode("utf-8")
+
+
+def _json_dumps(obj: _Any) -> bytes:
+    """
+    Encode an object with the standard library, compactly.
+
+    Args:
+        obj (Any): Object.
+
+    Returns:
+        bytes: JSON.
+    """
+
+    return _json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+JSON_CODEC = Codec("json", _json.loads, _json_dumps)
+"""Standard library codec."""
+
+
+def _raising_value_error(loads: Loads, error: ErrorType) -> Loads:
+    """
+    Make a decoder raise `ValueError` on invalid input.
+
+    Returns the decoder itself when its error is already a `ValueError`, as in recent versions of the libraries.
+
+    Args:
+        loads (Callable): Decoder.
+        error (type): Exception the decoder raises on invalid input.
+
+    Returns:
+        Callable: Decoder.
+    """
+
+    if issubclass(error, ValueError):
+        return loads
+
+    def checked_loads(data: _Union[bytes, str]) -> _Any:
+        try:
+            return loads(data)
+        except error as exc:
+            raise ValueError(str(exc)) from exc
+
+    return checked_loads
+
+
+def _orjson() -> Codec:
+    """
+    Build the orjson codec.
+
+    Returns:
+        Codec: Codec.
+    """
+
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    def dumps(obj: _Any) -> bytes:
+        return orjson.dumps(obj, default=str)  # pylint: disable=no-member
+
+    return Codec(
+        "orjson", _raising_value_error(orjson.loads, orjson.JSONDecodeError), dumps  # pylint: disable=no-member
+    )
+
+
+def _msgspec() -> Codec:
+    """
+    Build the msgspec codec.
+
+    Returns:
+        Codec: Codec.
+    """
+
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    return Codec("msgspec", _raising_value_error(msgspec.json.decode, msgspec.DecodeError), encoder.encode)
+
+
+def _ujson() -> Codec:
+    """
+    Build the ujson codec.
+
+    Returns:
+        Codec: Codec.
+    """
+
+    import ujson  # pylint: disable=import-outside-toplevel
+
+    def dumps(obj: _Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")  # type: ignore[no-any-return]
+
+    return Codec("ujson", _raising_value_error(ujson.loads, getattr(ujson, "JSONDecodeError", ValueError)), dumps)
+
+
+_FACTORIES = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "ujson": _ujson,
+    "json": lambda: JSON_CODEC,
+}
+
+_default: _Optional[Codec] = None
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Get a codec by name.
+
+    Args:
+        name (str): `orjson`, `msgspec`, `ujson` or `json`.
+
+    Returns:
+        Codec: Codec.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the library of the codec is not installed.
+    """
+
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown codec {name!r}, expected one of {', '.join(_FACTORIES)}")
+
+    return _FACTORIES[name]()
+
+
+def default_codec() -> Codec:
+    """
+    Get the fastest codec installed.
+
+    Returns:
+        Codec: Codec.
+    """
+
+    global _default  # pylint: disable=global-statement
+
+    if _default is None:
+        for name in _FACTORIES:
+            try:
+                _default = get_codec(name)
+            except ImportError:
+                continue
+            break
+
+    return _default  # type: ignore[return-value]
@@ -322,3 +322,13 @@ class FeePlans(Enum):
 
     NORMAL = "normal"
     PRIORITY = "priority"
+
+
+class CircuitState(Enum):
+    """
+    Circuit Breaker States.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
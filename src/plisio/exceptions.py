@@ -6,7 +6,13 @@ from json import loads as _loads
 from . import _types as _t
 
 
-__all__ = ["PlisioException", "PlisioAPIException", "PlisioRequestException"]
+__all__ = [
+    "PlisioException",
+    "PlisioAPIException",
+    "PlisioRequestException",
+    "PlisioCircuitOpenException",
+    "PlisioWebhookException",
+]
 
 
 class PlisioException(Exception):
@@ -20,7 +26,7 @@ class PlisioAPIException(PlisioException):
     Plisio Exception.
     """
 
-    def __init__(self, response: _t.Response, status_code: int, text: str):
+    def __init__(self, response: _t.Response, status_code: int, text: str, loads: _t.JSONLoads = _loads):
         """
         Constructor.
 
@@ -28,12 +34,13 @@ class PlisioAPIException(PlisioException):
             response (Response): Response.
             status_code (int): Status code.
             text (str): Text.
+            loads (Callable): JSON decoder of the error body.
         """
         self.code = 0
         self.name = ""
 
         try:
-            json_res = _loads(text)
+            json_res = loads(text)
         except ValueError:
             self.message = f"Invalid JSON error message from Plisio: {response.text}"
         else:
@@ -81,3 +88,61 @@ class PlisioRequestException(PlisioException):
         """
 
         return f"PlisioRequestException: {self.message}"
+
+
+class PlisioCircuitOpenException(PlisioException):
+    """
+    Plisio Circuit Open Exception.
+
+    Raised without sending a request while the circuit breaker is open.
+    """
+
+    def __init__(self, scope: str, retry_after: float):
+        """
+        Constructor.
+
+        Args:
+            scope (str): Circuit scope, an endpoint template or `*` for the global circuit.
+            retry_after (float): Seconds until the circuit lets a trial request through.
+        """
+
+        self.scope = scope
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        """
+        String representation.
+
+        Returns:
+            str: String representation.
+        """
+
+        return f"PlisioCircuitOpenException: circuit {self.scope} is open, retry in {self.retry_after:.1f}s"
+
+
+class PlisioWebhookException(PlisioException):
+    """
+    Plisio Webhook Exception.
+
+    Raised when a callback is malformed or its `verify_hash` does not match.
+    """
+
+    def __init__(self, message: str):
+        """
+        Constructor.
+
+        Args:
+            message (str): Message.
+        """
+
+        self.message = message
+
+    def __str__(self) -> str:
+        """
+        String representation.
+
+        Returns:
+            str: String representation.
+        """
+
+        return f"PlisioWebhookException: {self.message}"
@@ -0,0 +1,163 @@
+"""
+Hedged requests policy for the async client.
+"""
+
+from collections import deque as _deque
+from threading import Lock as _Lock
+from typing import (
+    Collection as _Collection,
+    Deque as _Deque,
+    Dict as _Dict,
+    Optional as _Optional,
+)
+
+__all__ = ["HedgePolicy"]
+
+
+class HedgePolicy:  # pylint: disable=too-many-instance-attributes
+    """
+    Policy for hedging read-only requests.
+
+    When a request has not answered after the hedge delay, a second identical request is sent and whichever
+    answers first wins. The delay is either fixed or the `percentile` of recently observed latencies of the
+    endpoint. At most `max_ratio` of the requests are hedged.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        delay: _Optional[float] = None,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 200,
+        max_ratio: float = 0.1,
+        endpoints: _Optional[_Collection[str]] = ("operations", "crypto-coins"),
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            delay (float): Fixed hedge delay in seconds, `None` to derive it from observed latencies.
+            percentile (float): Latency percentile in `(0, 1)` used as the hedge delay.
+            min_delay (float): Lower bound of the derived delay in seconds.
+            min_samples (int): Latency samples needed before hedging with a derived delay.
+            window (int): Number of recent latency samples kept per endpoint.
+            max_ratio (float): Maximum fraction of recent requests that may be hedged.
+            endpoints (Collection[str]): Endpoint paths (including sub-paths) to hedge, `None` for every
+                read-only endpoint.
+
+        Raises:
+            ValueError: If `percentile` is not in `(0, 1)`.
+        """
+
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_ratio = max_ratio
+        self.endpoints = None if endpoints is None else frozenset(path.strip("/") for path in endpoints)
+        self.requests = 0
+        self.hedges = 0
+        self._lock = _Lock()
+        self._samples: _Dict[str, _Deque[float]] = {}
+
+    def applies(self, endpoint: str) -> bool:
+        """
+        Check whether an endpoint is hedged.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            bool: `True` if requests to the endpoint may be hedged.
+        """
+
+        return self.endpoints is None or self._get_key(endpoint) in self.endpoints
+
+    def _get_key(self, endpoint: str) -> str:
+        """
+        Get the key latency samples of an endpoint are grouped under.
+
+        Paths with identifiers, e.g. `operations/<id>`, are grouped under their first segment.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            str: Key.
+        """
+
+        if self.endpoints is not None and endpoint in self.endpoints:
+            return endpoint
+
+        return endpoint.split("/", 1)[0]
+
+    def get_delay(self, endpoint: str) -> _Optional[float]:
+        """
+        Get the hedge delay of an endpoint.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            float: Seconds to wait before hedging, `None` if there are not enough samples yet.
+        """
+
+        if self.delay is not None:
+            return self.delay
+
+        with self._lock:
+            samples = sorted(self._samples.get(self._get_key(endpoint), ()))
+
+        if len(samples) < self.min_samples:
+            return None
+
+        index = min(len(samples) - 1, int(len(samples) * self.percentile))
+        return max(self.min_delay, samples[index])
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """
+        Record the latency of a successful request.
+
+        Args:
+            endpoint (str): Endpoint path.
+            latency (float): Latency in seconds.
+        """
+
+        key = self._get_key(endpoint)
+
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = _deque(maxlen=self.window)
+            samples.append(latency)
+
+    def start(self) -> None:
+        """
+        Count a request subject to hedging.
+        """
+
+        with self._lock:
+            self.requests += 1
+
+            if self.requests > 10 * self.window:
+                self.requests //= 2
+                self.hedges //= 2
+
+    def try_hedge(self) -> bool:
+        """
+        Reserve a hedge if the hedge rate allows it.
+
+        Returns:
+            bool: `True` if a hedge may be sent.
+        """
+
+        with self._lock:
+            if self.hedges + 1 > self.max_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
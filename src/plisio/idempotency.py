@@ -0,0 +1,491 @@
+"""
+Idempotency stores for invoice creation.
+
+Clients key invoices by `order_number`. Concurrent calls sharing an order number are always collapsed into one
+request. With a store, the results of recent calls are remembered too, so a retried call returns the first
+invoice instead of creating another one.
+
+Before calling the API a client reserves the key in the store. Calls from other processes or hosts sharing the
+store wait for the reservation to turn into a result instead of creating a second invoice. A reservation is
+released when the call fails and expires after `reserve_ttl` seconds if its holder dies.
+"""
+
+import sqlite3 as _sqlite3
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from inspect import isawaitable as _isawaitable, iscoroutinefunction as _iscoroutinefunction
+from threading import Lock as _Lock
+from time import time as _time
+from typing import (
+    Any as _Any,
+    Awaitable as _Awaitable,
+    Optional as _Optional,
+    Union as _Union,
+)
+
+from . import _types as _t
+from .cache import MISSING as _MISSING, TTLCache as _TTLCache
+from .codecs import Codec as _Codec, default_codec as _default_codec
+
+__all__ = ["IdempotencyStore", "MemoryStore", "SQLiteStore", "RedisStore"]
+
+MaybeAwaitable = _Union[_Any, _Awaitable[_Any]]
+
+_RESERVED = object()
+"""Value of a reserved key in `MemoryStore`."""
+
+
+class IdempotencyStore(ABC):
+    """
+    Store of the results of recent idempotent calls.
+
+    Every method may return an awaitable, e.g. when backed by an async Redis client. Only `AsyncClient` awaits
+    them. `AsyncClient` runs the methods of a `blocking` store in a thread, off the event loop.
+
+    `reserve` and `release` protect invoice creation across processes. The defaults do not reserve anything, so
+    stores without them only remember results.
+    """
+
+    blocking = False
+    """Whether the methods block on I/O."""
+
+    @abstractmethod
+    def get(self, key: str) -> MaybeAwaitable:
+        """
+        Get the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            dict: Result, `None` if unknown or expired.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: _t.Result) -> MaybeAwaitable:
+        """
+        Remember the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+            value (dict): Result.
+        """
+
+        raise NotImplementedError
+
+    def reserve(self, key: str) -> MaybeAwaitable:
+        """
+        Reserve a key before calling the API, unless it is reserved or has a result.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            bool: `True` if the key was reserved by this call.
+        """
+
+        return True
+
+    def release(self, key: str) -> MaybeAwaitable:
+        """
+        Release a reservation after a failed call, so the call can be made again.
+
+        Args:
+            key (str): Idempotency key.
+        """
+
+        return None
+
+
+class MemoryStore(IdempotencyStore):
+    """
+    In-process LRU store, for a single client process.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 86400.0, reserve_ttl: float = 60.0):
+        """
+        Initialize store.
+
+        Args:
+            maxsize (int): Maximum number of remembered results.
+            ttl (float): Seconds a result is remembered.
+            reserve_ttl (float): Seconds a reservation is kept if never released, longer than an invoice call.
+        """
+
+        self.reserve_ttl = reserve_ttl
+        self._cache = _TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = _Lock()
+
+    def get(self, key: str) -> _Optional[_t.Result]:
+        """
+        Get the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            dict: Result, `None` if unknown or expired.
+        """
+
+        value = self._cache.get(key)
+        return None if value is _MISSING or value is _RESERVED else value  # type: ignore[no-any-return]
+
+    def set(self, key: str, value: _t.Result) -> None:
+        """
+        Remember the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+            value (dict): Result.
+        """
+
+        self._cache.set(key, value)
+
+    def reserve(self, key: str) -> bool:
+        """
+        Reserve a key before calling the API, unless it is reserved or has a result.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            bool: `True` if the key was reserved by this call.
+        """
+
+        with self._lock:
+            if self._cache.get(key) is not _MISSING:
+                return False
+            self._cache.set(key, _RESERVED, self.reserve_ttl)
+            return True
+
+    def release(self, key: str) -> None:
+        """
+        Release a reservation after a failed call, so the call can be made again.
+
+        Args:
+            key (str): Idempotency key.
+        """
+
+        with self._lock:
+            if self._cache.get(key) is _RESERVED:
+                self._cache.invalidate(key)
+
+    def __len__(self) -> int:
+        """
+        Get number of remembered results and reservations, including expired ones not yet evicted.
+
+        Returns:
+            int: Number of results.
+        """
+
+        return len(self._cache)
+
+
+class SQLiteStore(IdempotencyStore):
+    """
+    SQLite store, shared by the processes of a host and kept across restarts.
+
+    Reservations are rows without a value, inserted with `INSERT OR IGNORE` so only one process gets them.
+    """
+
+    blocking = True
+    PURGE_EVERY = 1000
+    """Number of writes between two purges of the expired rows."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: float = 86400.0,
+        table: str = "plisio_idempotency",
+        codec: _Optional[_Codec] = None,
+        reserve_ttl: float = 60.0,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            path (str): Database path.
+            ttl (float): Seconds a result is remembered.
+            table (str): Table name, created if missing.
+            codec (Codec): JSON codec of the stored results, defaults to the fastest one installed.
+            reserve_ttl (float): Seconds a reservation is kept if never released, longer than an invoice call.
+
+        Raises:
+            ValueError: If the table name is not an identifier.
+        """
+
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name {table!r}")
+
+        self.ttl = ttl
+        self.reserve_ttl = reserve_ttl
+        self.codec = _default_codec() if codec is None else codec
+        self._lock = _Lock()
+        self._writes = 0
+        self._connection = _sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value BLOB, expires REAL NOT NULL)"
+        )
+        self._select = f"SELECT value FROM {table} WHERE key = ? AND expires > ? AND value IS NOT NULL"
+        self._upsert = f"INSERT OR REPLACE INTO {table} (key, value, expires) VALUES (?, ?, ?)"
+        self._expire = f"DELETE FROM {table} WHERE key = ? AND expires <= ?"
+        self._reserve = f"INSERT OR IGNORE INTO {table} (key, value, expires) VALUES (?, NULL, ?)"
+        self._release = f"DELETE FROM {table} WHERE key = ? AND value IS NULL"
+        self._purge = f"DELETE FROM {table} WHERE expires <= ?"
+
+    def get(self, key: str) -> _Optional[_t.Result]:
+        """
+        Get the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            dict: Result, `None` if unknown or expired.
+        """
+
+        with self._lock:
+            row = self._connection.execute(self._select, (key, _time())).fetchone()
+
+        return None if row is None else self.codec.loads(row[0])  # type: ignore[no-any-return]
+
+    def set(self, key: str, value: _t.Result) -> None:
+        """
+        Remember the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+            value (dict): Result.
+        """
+
+        now = _time()
+        data = self.codec.dumps(value)
+
+        with self._lock:
+            self._connection.execute(self._upsert, (key, data, now + self.ttl))
+
+            self._writes += 1
+            if self._writes >= self.PURGE_EVERY:
+                self._writes = 0
+                self._connection.execute(self._purge, (now,))
+
+    def reserve(self, key: str) -> bool:
+        """
+        Reserve a key before calling the API, unless it is reserved or has a result.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            bool: `True` if the key was reserved by this call.
+        """
+
+        now = _time()
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(self._expire, (key, now))
+                reserved = self._connection.execute(self._reserve, (key, now + self.reserve_ttl)).rowcount == 1
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+        return reserved
+
+    def release(self, key: str) -> None:
+        """
+        Release a reservation after a failed call, so the call can be made again.
+
+        Args:
+            key (str): Idempotency key.
+        """
+
+        with self._lock:
+            self._connection.execute(self._release, (key,))
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+
+        with self._lock:
+            self._connection.close()
+
+
+class RedisStore(IdempotencyStore):
+    """
+    Store backed by a Redis-compatible client, shared by every process.
+
+    Works with any client exposing `get(key)`, `set(key, value, ex=seconds, nx=bool)` and `delete(key)`, e.g.
+    `redis.Redis`. With an async client (`redis.asyncio.Redis`) the store returns awaitables and must be used with
+    `AsyncClient`. Reservations are set with `SET NX`, so only one process gets them.
+    """
+
+    RESERVED = b"\x00reserved"
+    """Value of a reserved key, never valid JSON."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client: _Any,
+        ttl: int = 86400,
+        prefix: str = "plisio:idempotency:",
+        codec: _Optional[_Codec] = None,
+        reserve_ttl: int = 60,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            client (Any): Redis-compatible client.
+            ttl (int): Seconds a result is remembered.
+            prefix (str): Prefix of the keys.
+            codec (Codec): JSON codec of the stored results, defaults to the fastest one installed.
+            reserve_ttl (int): Seconds a reservation is kept if never released, longer than an invoice call.
+        """
+
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.codec = _default_codec() if codec is None else codec
+        self.reserve_ttl = reserve_ttl
+        self.blocking = not _iscoroutinefunction(getattr(client, "execute_command", None))
+
+    def get(self, key: str) -> MaybeAwaitable:
+        """
+        Get the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            dict: Result, `None` if unknown or expired. An awaitable of it with an async client.
+        """
+
+        value = self.client.get(self.prefix + key)
+        if _isawaitable(value):
+            return self._decode_async(value)
+
+        return self._decode(value)
+
+    def set(self, key: str, value: _t.Result) -> MaybeAwaitable:
+        """
+        Remember the result of a call.
+
+        Args:
+            key (str): Idempotency key.
+            value (dict): Result.
+
+        Returns:
+            Any: Reply of the client, an awaitable with an async client.
+        """
+
+        return self.client.set(self.prefix + key, self.codec.dumps(value), ex=self.ttl)
+
+    def reserve(self, key: str) -> MaybeAwaitable:
+        """
+        Reserve a key before calling the API, unless it is reserved or has a result.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            bool: `True` if the key was reserved by this call. An awaitable of it with an async client.
+        """
+
+        reply = self.client.set(self.prefix + key, self.RESERVED, ex=self.reserve_ttl, nx=True)
+        if _isawaitable(reply):
+            return self._is_set_async(reply)
+
+        return bool(reply)
+
+    def release(self, key: str) -> MaybeAwaitable:
+        """
+        Release a reservation after a failed call, so the call can be made again.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            Any: Reply of the client, an awaitable with an async client.
+        """
+
+        value = self.client.get(self.prefix + key)
+        if _isawaitable(value):
+            return self._release_async(key, value)
+
+        return self.client.delete(self.prefix + key) if self._is_reserved(value) else None
+
+    def _is_reserved(self, value: _Optional[_Union[bytes, str]]) -> bool:
+        """
+        Check whether a stored value is a reservation.
+
+        Args:
+            value (bytes): Stored value.
+
+        Returns:
+            bool: `True` for a reservation.
+        """
+
+        return value == self.RESERVED or value == self.RESERVED.decode("latin-1")
+
+    @staticmethod
+    async def _is_set_async(reply: _Awaitable[_Any]) -> bool:
+        """
+        Await the reply of a `SET NX`.
+
+        Args:
+            reply (Awaitable): Pending reply of the client.
+
+        Returns:
+            bool: `True` if the key was set.
+        """
+
+        return bool(await reply)
+
+    async def _release_async(self, key: str, value: _Awaitable[_Optional[_Union[bytes, str]]]) -> None:
+        """
+        Await a stored value and delete it if it is a reservation.
+
+        Args:
+            key (str): Idempotency key.
+            value (Awaitable): Pending reply of the client.
+        """
+
+        if self._is_reserved(await value):
+            await self.client.delete(self.prefix + key)
+
+    def _decode(self, value: _Optional[_Union[bytes, str]]) -> _Optional[_t.Result]:
+        """
+        Decode a stored result.
+
+        Args:
+            value (bytes): Stored value.
+
+        Returns:
+            dict: Result, `None` if missing or reserved.
+        """
+
+        if value is None or self._is_reserved(value):
+            return None
+
+        return self.codec.loads(value)  # type: ignore[no-any-return]
+
+    async def _decode_async(self, value: _Awaitable[_Optional[_Union[bytes, str]]]) -> _Optional[_t.Result]:
+        """
+        Await and decode a stored result.
+
+        Args:
+            value (Awaitable): Pending reply of the client.
+
+        Returns:
+            dict: Result, `None` if missing.
+        """
+
+        return self._decode(await value)
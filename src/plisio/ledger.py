@@ -0,0 +1,463 @@
+"""
+Local SQLite mirror of the shop operations, synced incrementally and queried without calling the API.
+"""
+
+import asyncio as _asyncio
+import sqlite3 as _sqlite3
+from functools import partial as _partial
+from threading import Lock as _Lock
+from typing import (
+    TYPE_CHECKING as _TYPE_CHECKING,
+    Any as _Any,
+    Callable as _Callable,
+    Iterable as _Iterable,
+    List as _List,
+    Mapping as _Mapping,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+from . import _types as _t
+from .codecs import Codec as _Codec, default_codec as _default_codec
+from .utils import encode_query as _encode_query, encode_value as _encode_value
+
+if _TYPE_CHECKING:
+    from .clients import AsyncClient, Client
+
+__all__ = ["Ledger"]
+
+_COLUMNS = ("status", "currency", "type", "shop_id")
+"""Indexed columns usable as `query` filters, besides time."""
+
+
+class Ledger:
+    """
+    Mirror of the shop operations in SQLite.
+
+    Operations are stored as received, next to indexed `status`, `currency`, `type`, `shop_id` and
+    `created_at_utc` columns. `sync` fetches pages from the newest one and stops at the first page older than
+    the sync mark minus `overlap`, so only new operations and recent status changes are fetched.
+
+    The sync mark is the creation time of the newest operation fetched by the last completed `sync` with the same
+    filters, or without filters, whichever is newer. It is only written once a `sync` reaches its last page, so
+    an interrupted `sync` is started over by the next one.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        table: str = "plisio_operations",
+        overlap: int = 86400,
+        codec: _Optional[_Codec] = None,
+    ):
+        """
+        Initialize ledger.
+
+        Args:
+            path (str): Database path.
+            table (str): Table name, created with its indexes if missing.
+            overlap (int): Seconds before the sync mark re-fetched by `sync`, to pick up status changes.
+                Make it at least the lifetime of an invoice.
+            codec (Codec): JSON codec of the stored operations, defaults to the fastest one installed.
+
+        Raises:
+            ValueError: If the table name is not an identifier.
+        """
+
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name {table!r}")
+
+        self.table = table
+        self.overlap = overlap
+        self.codec = _default_codec() if codec is None else codec
+        self._lock = _Lock()
+        self._connection = _sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "id TEXT PRIMARY KEY, status TEXT, currency TEXT, type TEXT, shop_id TEXT, "
+            "created_at_utc INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self._connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_created ON {table} (created_at_utc)")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}_syncs (filters TEXT PRIMARY KEY, mark INTEGER NOT NULL)"
+        )
+        for column in _COLUMNS:
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column}, created_at_utc)"
+            )
+
+    def __len__(self) -> int:
+        """
+        Get number of stored operations.
+
+        Returns:
+            int: Number of operations.
+        """
+
+        return self.count()
+
+    @property
+    def high_water_mark(self) -> _t.OptionalInt:
+        """
+        Creation time of the newest stored operation.
+
+        Returns:
+            int: Unix time, `None` if the ledger is empty.
+        """
+
+        with self._lock:
+            row = self._connection.execute(f"SELECT MAX(created_at_utc) FROM {self.table}").fetchone()
+
+        return row[0]  # type: ignore[no-any-return]
+
+    def upsert(self, operations: _Iterable[_Mapping[str, _Any]]) -> int:
+        """
+        Insert or update operations.
+
+        Args:
+            operations (Iterable): Operation payloads, as returned by `transactions`.
+
+        Returns:
+            int: Number of written operations.
+        """
+
+        dumps = self.codec.dumps
+        rows = [
+            (
+                str(operation["id"]),
+                operation.get("status"),
+                operation.get("currency"),
+                operation.get("type"),
+                None if operation.get("shop_id") is None else str(operation["shop_id"]),
+                int(operation.get("created_at_utc") or 0),
+                dumps(operation),
+            )
+            for operation in operations
+        ]
+
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+        return len(rows)
+
+    @staticmethod
+    def _get_scope(filters: _Mapping[str, _Any]) -> str:
+        """
+        Get the key of the sync mark of a filter set.
+
+        Args:
+            filters (Mapping): Filters of `transactions`.
+
+        Returns:
+            str: Filters as a sorted query string, empty without filters.
+        """
+
+        return _encode_query({key: filters[key] for key in sorted(filters)})
+
+    def get_sync_mark(self, **filters: _Any) -> _t.OptionalInt:
+        """
+        Get the sync mark of a filter set.
+
+        Args:
+            **filters: Filters of `transactions`, e.g. `shop_id`.
+
+        Returns:
+            int: Unix time, `None` if no `sync` with these filters or without filters completed.
+        """
+
+        scopes = {self._get_scope(filters), ""}
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT MAX(mark) FROM {self.table}_syncs WHERE filters IN ({', '.join('?' * len(scopes))})",
+                list(scopes),
+            ).fetchone()
+
+        return row[0]  # type: ignore[no-any-return]
+
+    def _set_sync_mark(self, filters: _Mapping[str, _Any], mark: int) -> None:
+        """
+        Record a completed sync.
+
+        Args:
+            filters (Mapping): Filters of `transactions`.
+            mark (int): Creation time of the newest operation fetched.
+        """
+
+        with self._lock:
+            self._connection.execute(
+                f"INSERT INTO {self.table}_syncs VALUES (?, ?) "
+                "ON CONFLICT (filters) DO UPDATE SET mark = MAX(mark, excluded.mark)",
+                (self._get_scope(filters), mark),
+            )
+
+    def _get_threshold(self, full: bool, filters: _Mapping[str, _Any]) -> _t.OptionalInt:
+        """
+        Get the creation time below which `sync` stops fetching pages.
+
+        Args:
+            full (bool): Whether every page is fetched.
+            filters (Mapping): Filters of `transactions`.
+
+        Returns:
+            int: Unix time, `None` to fetch every page.
+        """
+
+        mark = None if full else self.get_sync_mark(**filters)
+        return None if mark is None else mark - self.overlap
+
+    @staticmethod
+    def _read_page(
+        result: _t.Result, threshold: _t.OptionalInt, client: _Any
+    ) -> _Tuple[_List[_t.DictAny], _t.OptionalInt, bool]:
+        """
+        Get the operations of a page, the newest creation time and whether `sync` can stop after it.
+
+        Args:
+            result (dict): `transactions` response.
+            threshold (int): Creation time below which `sync` stops, `None` to fetch every page.
+            client (BaseClient): Client that fetched the page.
+
+        Returns:
+            tuple: Operations, creation time of the newest one (`None` if empty) and whether this is the last page
+                to fetch.
+        """
+
+        operations = client._get_operations(result)  # pylint: disable=protected-access
+        created = [int(operation.get("created_at_utc") or 0) for operation in operations]
+        newest = max(created, default=None)
+
+        if client._get_next_page(result) is None:  # pylint: disable=protected-access
+            return operations, newest, True
+
+        return operations, newest, threshold is not None and min(created, default=0) < threshold
+
+    def sync(self, client: "Client", limit: int = 100, full: bool = False, **filters: _Any) -> int:
+        """
+        Fetch new and recently changed operations.
+
+        Args:
+            client (Client): Client.
+            limit (int): Page size.
+            full (bool): Fetch every page instead of stopping at the sync mark.
+            **filters: Filters of `transactions`, e.g. `shop_id`.
+
+        Returns:
+            int: Number of written operations.
+        """
+
+        threshold = self._get_threshold(full, filters)
+        mark: _t.OptionalInt = None
+        written = 0
+        page = 1
+
+        while True:
+            operations, newest, done = self._read_page(
+                client.transactions(page=page, limit=limit, **filters), threshold, client
+            )
+            written += self.upsert(operations)
+            mark = max(mark, newest) if mark is not None and newest is not None else mark or newest
+            if done:
+                break
+            page += 1
+
+        if mark is not None:
+            self._set_sync_mark(filters, mark)
+
+        return written
+
+    async def async_sync(self, client: "AsyncClient", limit: int = 100, full: bool = False, **filters: _Any) -> int:
+        """
+        Fetch new and recently changed operations with an async client, writing to SQLite in a thread.
+
+        Args:
+            client (AsyncClient): Client.
+            limit (int): Page size.
+            full (bool): Fetch every page instead of stopping at the sync mark.
+            **filters: Filters of `transactions`, e.g. `shop_id`.
+
+        Returns:
+            int: Number of written operations.
+        """
+
+        threshold = await self._run(self._get_threshold, full, filters)
+        mark: _t.OptionalInt = None
+        written: int = 0
+        page = 1
+
+        while True:
+            result = await client.transactions(page=page, limit=limit, **filters)
+            operations, newest, done = self._read_page(result, threshold, client)
+            written += await self._run(self.upsert, operations)
+            mark = max(mark, newest) if mark is not None and newest is not None else mark or newest
+            if done:
+                break
+            page += 1
+
+        if mark is not None:
+            await self._run(self._set_sync_mark, filters, mark)
+
+        return written
+
+    @staticmethod
+    async def _run(method: _Callable[..., _Any], *args: _Any) -> _Any:
+        """
+        Call a blocking method in a thread, keeping the event loop free.
+
+        Args:
+            method (Callable): Method.
+            *args: Arguments.
+
+        Returns:
+            Any: Result.
+        """
+
+        return await _asyncio.get_running_loop().run_in_executor(None, _partial(method, *args))
+
+    def _get_where(  # pylint: disable=too-many-arguments
+        self,
+        status: _Any,
+        currency: _Any,
+        type: _Any,  # pylint: disable=redefined-builtin
+        shop_id: _Any,
+        since: _t.OptionalInt,
+        until: _t.OptionalInt,
+    ) -> _Tuple[str, _List[_Any]]:
+        """
+        Build the `WHERE` clause of a query.
+
+        Args:
+            status (str | list): Status or statuses.
+            currency (str | list): Currency or currencies.
+            type (str | list): Type or types.
+            shop_id (str | list): Shop ID or IDs.
+            since (int): Minimum creation time, inclusive.
+            until (int): Maximum creation time, exclusive.
+
+        Returns:
+            tuple: Clause and its parameters.
+        """
+
+        clauses: _List[str] = []
+        params: _List[_Any] = []
+
+        for column, value in zip(_COLUMNS, (status, currency, type, shop_id)):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set, frozenset)):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(_encode_value(item) for item in value)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(_encode_value(value))
+
+        if since is not None:
+            clauses.append("created_at_utc >= ?")
+            params.append(int(since))
+        if until is not None:
+            clauses.append("created_at_utc < ?")
+            params.append(int(until))
+
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        status: _Any = None,
+        currency: _Any = None,
+        type: _Any = None,  # pylint: disable=redefined-builtin
+        shop_id: _Any = None,
+        since: _t.OptionalInt = None,
+        until: _t.OptionalInt = None,
+        limit: _t.OptionalInt = None,
+        offset: int = 0,
+        newest_first: bool = True,
+    ) -> _t.ListDictAny:
+        """
+        Query stored operations.
+
+        Args:
+            status (str | list): Status or statuses.
+            currency (str | list): Currency or currencies.
+            type (str | list): Type or types.
+            shop_id (str | list): Shop ID or IDs.
+            since (int): Minimum creation time (Unix time), inclusive.
+            until (int): Maximum creation time (Unix time), exclusive.
+            limit (int): Maximum number of operations, `None` for all.
+            offset (int): Number of operations skipped.
+            newest_first (bool): Order by creation time, newest first.
+
+        Returns:
+            list: Operations, as received from the API.
+        """
+
+        where, params = self._get_where(status, currency, type, shop_id, since, until)
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT data FROM {self.table}{where} ORDER BY created_at_utc {order} LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        loads = self.codec.loads
+        return [loads(row[0]) for row in rows]
+
+    def count(  # pylint: disable=too-many-arguments
+        self,
+        status: _Any = None,
+        currency: _Any = None,
+        type: _Any = None,  # pylint: disable=redefined-builtin
+        shop_id: _Any = None,
+        since: _t.OptionalInt = None,
+        until: _t.OptionalInt = None,
+    ) -> int:
+        """
+        Count stored operations.
+
+        Args:
+            status (str | list): Status or statuses.
+            currency (str | list): Currency or currencies.
+            type (str | list): Type or types.
+            shop_id (str | list): Shop ID or IDs.
+            since (int): Minimum creation time (Unix time), inclusive.
+            until (int): Maximum creation time (Unix time), exclusive.
+
+        Returns:
+            int: Number of operations.
+        """
+
+        where, params = self._get_where(status, currency, type, shop_id, since, until)
+
+        with self._lock:
+            row = self._connection.execute(f"SELECT COUNT(*) FROM {self.table}{where}", params).fetchone()
+
+        return row[0]  # type: ignore[no-any-return]
+
+    def get(self, id: str) -> _Optional[_t.DictAny]:  # pylint: disable=invalid-name, redefined-builtin
+        """
+        Get a stored operation.
+
+        Args:
+            id (str): Operation ID.
+
+        Returns:
+            dict: Operation, `None` if not stored.
+        """
+
+        with self._lock:
+            row = self._connection.execute(f"SELECT data FROM {self.table} WHERE id = ?", (id,)).fetchone()
+
+        return None if row is None else self.codec.loads(row[0])  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+
+        with self._lock:
+            self._connection.close()
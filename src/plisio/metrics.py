@@ -0,0 +1,87 @@
+"""
+Client metrics for plisio.
+"""
+
+from threading import Lock as _Lock
+from typing import (
+    Dict as _Dict,
+    List as _List,
+    Union as _Union,
+)
+
+__all__ = ["Metrics"]
+
+Snapshot = _Dict[str, _Dict[str, _Union[int, float]]]
+
+
+class Metrics:
+    """
+    Thread-safe counters and timings.
+
+    Counters are plain integers, timings keep the count, sum and maximum of observed values.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize metrics.
+        """
+
+        self._lock = _Lock()
+        self._counters: _Dict[str, int] = {}
+        self._timings: _Dict[str, _List[float]] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name (str): Counter name.
+            value (int): Increment.
+        """
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Record a timing.
+
+        Args:
+            name (str): Timing name.
+            value (float): Observed value in seconds.
+        """
+
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                self._timings[name] = [1, value, value]
+            else:
+                timing[0] += 1
+                timing[1] += value
+                timing[2] = max(timing[2], value)
+
+    def snapshot(self) -> Snapshot:
+        """
+        Get a copy of the current values.
+
+        Returns:
+            dict: `counters` by name, and `timings` as `<name>.count`, `<name>.sum` and `<name>.max`.
+        """
+
+        with self._lock:
+            timings: _Dict[str, _Union[int, float]] = {}
+            for name, (count, total, maximum) in self._timings.items():
+                timings[f"{name}.count"] = int(count)
+                timings[f"{name}.sum"] = total
+                timings[f"{name}.max"] = maximum
+
+            return {"counters": dict(self._counters), "timings": timings}
+
+    def reset(self) -> None:
+        """
+        Reset every counter and timing.
+        """
+
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
@@ -0,0 +1,628 @@
+"""
+Typed response models for plisio.
+
+Models are `__slots__` objects wrapping the `data` payload of a response. Fields are converted on first access:
+amounts to `Decimal`, timestamps to `int`, enums when the value is known (strings otherwise). The original payload
+stays available as `raw`.
+
+```python
+invoice = Invoice.from_result(client.invoice(...))
+page = OperationsPage.from_json(body)  # bytes, parsed with the default codec
+```
+"""
+
+from decimal import Decimal as _Decimal, InvalidOperation as _InvalidOperation
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Dict as _Dict,
+    Generic as _Generic,
+    Iterator as _Iterator,
+    List as _List,
+    Mapping as _Mapping,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
+    Type as _Type,
+    TypeVar as _TypeVar,
+    Union as _Union,
+    overload as _overload,
+)
+
+from . import enums as _enums
+from .codecs import default_codec as _default_codec
+
+__all__ = [
+    "Field",
+    "Model",
+    "Invoice",
+    "Operation",
+    "OperationsPage",
+    "Balance",
+    "Fee",
+    "FeePlan",
+    "Coin",
+    "loads",
+]
+
+_M = _TypeVar("_M", bound="Model")
+_T = _TypeVar("_T")
+_E = _TypeVar("_E", bound=_enums.Enum)
+
+Key = _Union[str, _Tuple[str, ...]]
+
+
+def loads(body: _Union[bytes, str]) -> _Any:
+    """
+    Decode JSON with the default codec.
+
+    Args:
+        body (bytes | str): JSON.
+
+    Returns:
+        Any: Decoded value.
+    """
+
+    return _default_codec().loads(body)
+
+
+def _decimal(value: _Any) -> _Optional[_Decimal]:
+    """
+    Convert an amount to `Decimal`.
+
+    Floats are converted through `str` so `0.1` stays `Decimal("0.1")`.
+
+    Args:
+        value (Any): Amount.
+
+    Returns:
+        Decimal: Amount, `None` for empty or invalid values.
+    """
+
+    if value == "":
+        return None
+
+    try:
+        return _Decimal(value if isinstance(value, (str, int)) else str(value))
+    except _InvalidOperation:
+        return None
+
+
+def _text(value: _Any) -> str:
+    """
+    Convert a value to `str`.
+
+    Args:
+        value (Any): Value.
+
+    Returns:
+        str: Value.
+    """
+
+    return value if isinstance(value, str) else str(value)
+
+
+def _any(value: _Any) -> _Any:
+    """
+    Keep a value as is.
+
+    Args:
+        value (Any): Value.
+
+    Returns:
+        Any: Value.
+    """
+
+    return value
+
+
+def _int(value: _Any) -> _Optional[int]:
+    """
+    Convert a value to `int`.
+
+    Args:
+        value (Any): Value.
+
+    Returns:
+        int: Value, `None` for empty or invalid values.
+    """
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bool(value: _Any) -> bool:
+    """
+    Convert a flag to `bool`, accepting `0`/`1` and their string forms.
+
+    Args:
+        value (Any): Flag.
+
+    Returns:
+        bool: Flag.
+    """
+
+    if isinstance(value, str):
+        return value.lower() not in ("", "0", "false")
+    return bool(value)
+
+
+def _enum(enum: _Type[_E]) -> _Callable[[_Any], _Union[_E, str]]:
+    """
+    Build a converter to an enum, by value.
+
+    Args:
+        enum (type): Enum.
+
+    Returns:
+        Callable: Converter returning the member, or the value as `str` if it is not a member.
+    """
+
+    members = {member.value: member for member in enum.__members__.values()}
+
+    def convert(value: _Any) -> _Union[_E, str]:
+        return members.get(value) or _text(value)
+
+    return convert
+
+
+class Field(_Generic[_T]):
+    """
+    Model field, converted from the payload on first access and cached.
+    """
+
+    __slots__ = ("key", "convert", "name")
+
+    def __init__(self, convert: _Callable[[_Any], _T], key: _Optional[Key] = None):
+        """
+        Initialize field.
+
+        Args:
+            convert (Callable): Converter applied to non-null payload values.
+            key (str | tuple): Payload key, or path of keys for nested values. Defaults to the attribute name.
+        """
+
+        self.convert = convert
+        self.key = key
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """
+        Bind the field to its attribute name.
+
+        Args:
+            owner (type): Model class.
+            name (str): Attribute name.
+        """
+
+        self.name = name
+        if self.key is None:
+            self.key = name
+
+    @_overload
+    def __get__(self, obj: None, owner: type) -> "Field[_T]":
+        ...
+
+    @_overload
+    def __get__(self, obj: "Model", owner: type) -> _Optional[_T]:
+        ...
+
+    def __get__(self, obj: _Optional["Model"], owner: type) -> _Union["Field[_T]", _Optional[_T]]:
+        """
+        Get the converted value.
+
+        Args:
+            obj (Model): Model, `None` for class access.
+            owner (type): Model class.
+
+        Returns:
+            Any: Value, `None` if missing from the payload.
+        """
+
+        if obj is None:
+            return self
+
+        values = obj._values  # pylint: disable=protected-access
+        if values is None:
+            values = obj._values = {}  # pylint: disable=protected-access
+        elif self.name in values:
+            return values[self.name]  # type: ignore[no-any-return]
+
+        value: _Any = obj.raw
+        for key in (self.key,) if isinstance(self.key, str) else self.key or ():
+            value = value.get(key) if isinstance(value, _Mapping) else None
+
+        converted = None if value is None else self.convert(value)
+        values[self.name] = converted
+        return converted
+
+
+class Model:
+    """
+    Base response model.
+
+    Building a model only keeps a reference to the payload, fields are converted when first read.
+    """
+
+    __slots__ = ("raw", "_values")
+
+    FIELDS: _Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: _Any) -> None:
+        """
+        Collect the fields of a model class.
+
+        Args:
+            **kwargs: Class keyword arguments.
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = tuple(
+            name for klass in reversed(cls.__mro__) for name, attr in vars(klass).items() if isinstance(attr, Field)
+        )
+
+    def __init__(self, raw: _Mapping[str, _Any]):
+        """
+        Initialize model.
+
+        Args:
+            raw (Mapping): Payload.
+        """
+
+        self.raw = raw
+        self._values: _Optional[_Dict[str, _Any]] = None
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS[:3])
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare models by payload.
+
+        Args:
+            other (object): Other object.
+
+        Returns:
+            bool: `True` for models of the same type with equal payloads.
+        """
+
+        if not isinstance(other, Model):
+            return NotImplemented
+
+        return type(self) is type(other) and self.raw == other.raw
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @classmethod
+    def from_result(cls: _Type[_M], result: _Mapping[str, _Any]) -> _M:
+        """
+        Build a model from response data.
+
+        Args:
+            result (Mapping): Response data, with the payload under `data`.
+
+        Returns:
+            Model: Model.
+        """
+
+        return cls(result.get("data") or {})
+
+    @classmethod
+    def from_json(cls: _Type[_M], body: _Union[bytes, str]) -> _M:
+        """
+        Build a model from a raw response body.
+
+        Args:
+            body (bytes | str): Response body.
+
+        Returns:
+            Model: Model.
+        """
+
+        return cls.from_result(loads(body))
+
+    def to_dict(self) -> _Dict[str, _Any]:
+        """
+        Get the converted fields.
+
+        Returns:
+            dict: Fields keyed by attribute name.
+        """
+
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+class Invoice(Model):
+    """
+    Created invoice. White-label fields are `None` unless white-label invoices are enabled for the shop.
+    """
+
+    __slots__ = ()
+
+    txn_id = Field(_text)
+    invoice_url = Field(_text)
+    amount = Field(_decimal)
+    pending_amount = Field(_decimal)
+    wallet_hash = Field(_text)
+    psys_cid = Field(_text)
+    currency = Field(_text)
+    status = Field(_enum(_enums.TransactionStatus))
+    source_currency = Field(_text)
+    source_rate = Field(_decimal)
+    expire_utc = Field(_int)
+    expected_confirmations = Field(_int)
+    qr_code = Field(_text)
+    verify_hash = Field(_text)
+    invoice_commission = Field(_decimal)
+    invoice_sum = Field(_decimal)
+    invoice_total_sum = Field(_decimal)
+
+
+class Operation(Model):
+    """
+    Transaction (operation) of the shop.
+    """
+
+    __slots__ = ()
+
+    id = Field(_text)
+    type = Field(_enum(_enums.TransactionType))
+    status = Field(_enum(_enums.TransactionStatus))
+    psys_cid = Field(_text)
+    currency = Field(_text)
+    amount = Field(_decimal)
+    sum = Field(_decimal)
+    pending_sum = Field(_decimal)
+    fee = Field(_decimal)
+    commission = Field(_decimal)
+    actual_sum = Field(_decimal)
+    actual_commission = Field(_decimal)
+    actual_fee = Field(_decimal)
+    actual_invoice_sum = Field(_decimal)
+    source_currency = Field(_text)
+    source_rate = Field(_decimal)
+    shop_id = Field(_text)
+    user_id = Field(_any)
+    parent_id = Field(_any)
+    wallet_hash = Field(_text)
+    tx_id = Field(_any)
+    tx_url = Field(_any)
+    confirmations = Field(_int)
+    status_code = Field(_int)
+    created_at_utc = Field(_int)
+    expire_at_utc = Field(_int)
+    params = Field(_any)
+
+
+class Operations(_Sequence[Operation]):
+    """
+    Read-only sequence of operations, building each `Operation` on first access.
+    """
+
+    __slots__ = ("_raw", "_items")
+
+    def __init__(self, raw: _List[_Mapping[str, _Any]]):
+        """
+        Initialize sequence.
+
+        Args:
+            raw (list): Operation payloads.
+        """
+
+        self._raw = raw
+        self._items: _List[_Optional[Operation]] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        """
+        Get the number of operations.
+
+        Returns:
+            int: Length.
+        """
+
+        return len(self._raw)
+
+    @_overload
+    def __getitem__(self, index: int) -> Operation:
+        ...
+
+    @_overload
+    def __getitem__(self, index: slice) -> _List[Operation]:
+        ...
+
+    def __getitem__(self, index: _Union[int, slice]) -> _Union[Operation, _List[Operation]]:
+        """
+        Get an operation, or a list of operations for a slice.
+
+        Args:
+            index (int | slice): Index.
+
+        Returns:
+            Operation | list: Operation(s).
+        """
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = Operation(self._raw[index])
+        return item
+
+    def __iter__(self) -> _Iterator[Operation]:
+        """
+        Iterate over operations.
+
+        Returns:
+            Iterator[Operation]: Operations.
+        """
+
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"<{self.__class__.__name__} [{len(self)}]>"
+
+
+class OperationsPage(Model):
+    """
+    Page of the transactions endpoint.
+    """
+
+    __slots__ = ("_operations",)
+
+    total_count = Field(_int, ("_meta", "totalCount"))
+    page_count = Field(_int, ("_meta", "pageCount"))
+    current_page = Field(_int, ("_meta", "currentPage"))
+    per_page = Field(_int, ("_meta", "perPage"))
+
+    def __init__(self, raw: _Mapping[str, _Any]):
+        """
+        Initialize page.
+
+        Args:
+            raw (Mapping): Payload.
+        """
+
+        super().__init__(raw)
+        self._operations: _Optional[Operations] = None
+
+    @property
+    def operations(self) -> Operations:
+        """
+        Operations of the page, each built on first access.
+
+        Returns:
+            Operations: Operations.
+        """
+
+        if self._operations is None:
+            self._operations = Operations(self.raw.get("operations") or [])
+        return self._operations
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return (
+            f"{self.__class__.__name__}(page={self.current_page}/{self.page_count}, operations={len(self.operations)})"
+        )
+
+    def to_dict(self) -> _Dict[str, _Any]:
+        """
+        Get the converted fields.
+
+        Returns:
+            dict: Fields keyed by attribute name, operations as dicts.
+        """
+
+        return {**super().to_dict(), "operations": [operation.to_dict() for operation in self.operations]}
+
+
+class Balance(Model):
+    """
+    Balance of a currency.
+    """
+
+    __slots__ = ()
+
+    psys_cid = Field(_text)
+    currency = Field(_text)
+    balance = Field(_decimal)
+
+
+class Fee(Model):
+    """
+    Estimated or Plisio fee of a withdrawal.
+    """
+
+    __slots__ = ()
+
+    psys_cid = Field(_text)
+    currency = Field(_text)
+    fee = Field(_decimal)
+    plan = Field(_enum(_enums.FeePlans))
+
+
+class FeePlan(Model):
+    """
+    Fee plan of a currency.
+    """
+
+    __slots__ = ()
+
+    name = Field(_enum(_enums.FeePlans))
+    conf_target = Field(_int)
+    value = Field(_decimal)
+    unit_fee = Field(_decimal, "unitFee")
+    limit = Field(_decimal)
+
+    @classmethod
+    def plans_from_result(cls, result: _Mapping[str, _Any]) -> _Dict[str, "FeePlan"]:
+        """
+        Build the fee plans of a fee plans response.
+
+        Args:
+            result (Mapping): Response data, with plans keyed by name under `data`.
+
+        Returns:
+            dict: Fee plans keyed by name.
+        """
+
+        data = result.get("data") or {}
+        return {name: cls({"name": name, **plan}) for name, plan in data.items() if isinstance(plan, _Mapping)}
+
+
+class Coin(Model):
+    """
+    Supported cryptocurrency.
+    """
+
+    __slots__ = ()
+
+    cid = Field(_text)
+    name = Field(_text)
+    currency = Field(_text)
+    icon = Field(_text)
+    rate_usd = Field(_decimal)
+    price_usd = Field(_decimal)
+    precision = Field(_int)
+    fiat = Field(_text)
+    min_sum_in = Field(_decimal)
+    invoice_commission_percentage = Field(_decimal)
+    hidden = Field(_bool)
+    maintenance = Field(_bool)
+
+    @classmethod
+    def list_from_result(cls, result: _Mapping[str, _Any]) -> _List["Coin"]:
+        """
+        Build the coins of a crypto coins response.
+
+        Args:
+            result (Mapping): Response data, with a list of coins under `data`.
+
+        Returns:
+            list: Coins.
+        """
+
+        return [cls(coin) for coin in result.get("data") or []]
@@ -0,0 +1,183 @@
+"""
+Client-side rate limiting for plisio clients.
+"""
+
+import asyncio as _asyncio
+from threading import Lock as _Lock
+from time import (
+    monotonic as _monotonic,
+    sleep as _sleep,
+)
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Union as _Union,
+)
+
+__all__ = ["TokenBucket", "RateLimiter"]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it, so waiting callers queue up in arrival order
+    instead of failing. The same bucket can be shared by threads and by tasks of an event loop.
+    """
+
+    def __init__(self, rate: float, capacity: _Optional[float] = None, timer: _Callable[[], float] = _monotonic):
+        """
+        Initialize bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum burst size, defaults to `rate` (one second worth of tokens).
+            timer (Callable): Monotonic clock.
+
+        Raises:
+            ValueError: If `rate` or `capacity` is not positive.
+        """
+
+        capacity = rate if capacity is None else capacity
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._timer = timer
+        self._lock = _Lock()
+        self._tokens = capacity
+        self._updated = timer()
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"{self.__class__.__name__}(rate={self.rate}, capacity={self.capacity})"
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, possibly from the future.
+
+        Args:
+            tokens (float): Number of tokens.
+
+        Returns:
+            float: Seconds to wait before the reserved tokens are available.
+        """
+
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+BucketLike = _Union[TokenBucket, float]
+
+
+class RateLimiter:
+    """
+    Rate limiter made of an optional global bucket and per-endpoint buckets.
+
+    A request waits for a token of the global bucket and of the bucket of its endpoint.
+    """
+
+    def __init__(
+        self,
+        rate: _Optional[float] = None,
+        capacity: _Optional[float] = None,
+        per_endpoint: _Optional[_Dict[str, BucketLike]] = None,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            rate (float): Requests per second across all endpoints, `None` for no global limit.
+            capacity (float): Global burst size, defaults to `rate`.
+            per_endpoint (dict): Bucket or requests per second keyed by endpoint path, e.g. `{"invoices/new": 5}`.
+                A key also applies to its sub-paths.
+        """
+
+        self.bucket = TokenBucket(rate, capacity) if rate is not None else None
+        self.per_endpoint: _Dict[str, TokenBucket] = {
+            path.strip("/"): bucket if isinstance(bucket, TokenBucket) else TokenBucket(bucket)
+            for path, bucket in (per_endpoint or {}).items()
+        }
+
+    def get_buckets(self, endpoint: str) -> _List[TokenBucket]:
+        """
+        Get the buckets a request to an endpoint draws from.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            list: Buckets.
+        """
+
+        buckets = [self.bucket] if self.bucket is not None else []
+
+        path = endpoint
+        while True:
+            if path in self.per_endpoint:
+                buckets.append(self.per_endpoint[path])
+                break
+            if "/" not in path:
+                break
+            path = path.rsplit("/", 1)[0]
+
+        return buckets
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve a token for a request.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+
+        return max((bucket.reserve() for bucket in self.get_buckets(endpoint)), default=0.0)
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Block until a request may be sent.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            float: Seconds waited.
+        """
+
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            _sleep(wait)
+        return wait
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """
+        Wait until a request may be sent.
+
+        Args:
+            endpoint (str): Endpoint path.
+
+        Returns:
+            float: Seconds waited.
+        """
+
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            await _asyncio.sleep(wait)
+        return wait
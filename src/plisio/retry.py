@@ -0,0 +1,181 @@
+"""
+Retry policy for plisio clients.
+"""
+
+from email.utils import parsedate_to_datetime as _parsedate_to_datetime
+from datetime import datetime as _datetime, timezone as _timezone
+from random import random as _random
+from typing import (
+    Callable as _Callable,
+    Collection as _Collection,
+    Optional as _Optional,
+)
+
+from . import _types as _t
+from .exceptions import PlisioAPIException as _PlisioAPIException
+
+__all__ = ["RetryPolicy", "NO_RETRY"]
+
+
+class RetryPolicy:  # pylint: disable=too-many-instance-attributes
+    """
+    Retry policy with exponential backoff and full jitter.
+
+    Read-only endpoints are retried by default. Endpoints with side effects (see `BaseClient.UNSAFE_ENDPOINTS`)
+    are only retried when listed in `retry_unsafe`, since a request that timed out may still have been executed.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: _Collection[int] = (429, 500, 502, 503, 504),
+        retry_exceptions: _Optional[_t.ExceptionTypes] = None,
+        respect_retry_after: bool = True,
+        deadline: _Optional[float] = None,
+        retry_unsafe: _Collection[str] = (),
+        random: _Callable[[], float] = _random,
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            max_attempts (int): Maximum number of attempts, including the first one.
+            backoff_base (float): Backoff ceiling of the first retry in seconds, doubled on each retry.
+            backoff_max (float): Maximum backoff ceiling in seconds.
+            retry_statuses (Collection[int]): HTTP status codes worth retrying.
+            retry_exceptions (tuple): Transport exceptions worth retrying, defaults to the client's connection
+                and timeout errors.
+            respect_retry_after (bool): Wait at least as long as the `Retry-After` response header asks.
+            deadline (float): Total time budget in seconds across all attempts, `None` for no limit.
+            retry_unsafe (Collection[str]): Endpoint paths with side effects to retry anyway,
+                e.g. `{"operations/withdraw"}`.
+            random (Callable): Source of uniform random numbers in `[0, 1)`.
+
+        Raises:
+            ValueError: If `max_attempts` is lower than 1.
+        """
+
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.retry_unsafe = frozenset(retry_unsafe)
+        self._random = random
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"{self.__class__.__name__}(max_attempts={self.max_attempts}, deadline={self.deadline})"
+
+    def allows(self, endpoint: str, safe: bool) -> bool:
+        """
+        Check whether an endpoint may be retried at all.
+
+        Args:
+            endpoint (str): Endpoint path.
+            safe (bool): Whether the request is read-only.
+
+        Returns:
+            bool: `True` if the endpoint may be retried.
+        """
+
+        return self.max_attempts > 1 and (safe or endpoint in self.retry_unsafe)
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Get a jittered backoff.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 1.
+
+        Returns:
+            float: Seconds to wait, uniform in `[0, min(backoff_max, backoff_base * 2 ** (attempt - 1))]`.
+        """
+
+        ceiling: float = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return ceiling * self._random()
+
+    def get_retry_delay(
+        self, exc: BaseException, attempt: int, elapsed: float, retry_exceptions: _t.ExceptionTypes = ()
+    ) -> _Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            exc (Exception): Exception raised by the attempt.
+            attempt (int): Number of the attempt that failed, starting at 1.
+            elapsed (float): Seconds spent since the first attempt started.
+            retry_exceptions (tuple): Client default for `retry_exceptions`.
+
+        Returns:
+            float: Seconds to wait before the next attempt, `None` to give up.
+        """
+
+        if attempt >= self.max_attempts:
+            return None
+
+        retry_after = None
+        if isinstance(exc, _PlisioAPIException):
+            if exc.status_code not in self.retry_statuses:
+                return None
+            if self.respect_retry_after:
+                headers = getattr(exc.response, "headers", None) or {}
+                retry_after = self.parse_retry_after(headers.get("Retry-After"))
+        elif not isinstance(exc, self.retry_exceptions or retry_exceptions):
+            return None
+
+        delay = self.get_backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: _Optional[str]) -> _Optional[float]:
+        """
+        Parse a `Retry-After` header.
+
+        Args:
+            value (str): Header value, delay in seconds or HTTP date.
+
+        Returns:
+            float: Seconds to wait, `None` if absent or invalid.
+        """
+
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            when = _parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=_timezone.utc)
+
+        return max(0.0, (when - _datetime.now(_timezone.utc)).total_seconds())
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+"""Policy making a single attempt."""
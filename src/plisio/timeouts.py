@@ -0,0 +1,168 @@
+"""
+Timeout policy for plisio clients.
+"""
+
+from typing import (
+    Any as _Any,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Union as _Union,
+)
+
+__all__ = ["Timeout"]
+
+Seconds = _Optional[float]
+
+
+class Timeout:
+    """
+    Request timeouts split by phase.
+
+    `connect` bounds establishing a connection, `read` bounds waiting for response data, `pool` bounds waiting
+    for a free connection in the pool and `total` bounds a whole call, retries and backoff included.
+    `None` means no limit.
+    """
+
+    __slots__ = ("connect", "read", "total", "pool")
+
+    def __init__(self, connect: Seconds = None, read: Seconds = None, total: Seconds = None, pool: Seconds = None):
+        """
+        Initialize timeout.
+
+        Args:
+            connect (float): Connection timeout in seconds.
+            read (float): Read timeout in seconds.
+            total (float): Total timeout in seconds.
+            pool (float): Pool acquisition timeout in seconds. Not supported by the `requests` transport. With
+                `aiohttp` it also covers connecting.
+        """
+
+        self.connect = connect
+        self.read = read
+        self.total = total
+        self.pool = pool
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return (
+            f"{self.__class__.__name__}(connect={self.connect}, read={self.read}, total={self.total}, pool={self.pool})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare timeouts.
+
+        Args:
+            other (object): Other object.
+
+        Returns:
+            bool: `True` if every phase matches.
+        """
+
+        if not isinstance(other, Timeout):
+            return NotImplemented
+
+        return (self.connect, self.read, self.total, self.pool) == (other.connect, other.read, other.total, other.pool)
+
+    def __hash__(self) -> int:
+        """
+        Hash timeout.
+
+        Returns:
+            int: Hash.
+        """
+
+        return hash((self.connect, self.read, self.total, self.pool))
+
+    @classmethod
+    def coerce(cls, value: "TimeoutLike") -> "Timeout":
+        """
+        Build a timeout from a number or a `Timeout`.
+
+        Args:
+            value (Timeout | float): A number sets both `connect` and `read`.
+
+        Returns:
+            Timeout: Timeout.
+        """
+
+        if isinstance(value, Timeout):
+            return value
+
+        return cls(connect=value, read=value)
+
+    @staticmethod
+    def _cap(value: Seconds, remaining: Seconds) -> Seconds:
+        """
+        Cap a phase timeout with the remaining total budget.
+
+        Args:
+            value (float): Phase timeout.
+            remaining (float): Remaining budget.
+
+        Returns:
+            float: Capped timeout.
+        """
+
+        if remaining is None:
+            return value
+        if value is None:
+            return remaining
+        return min(value, remaining)
+
+    def to_requests(self, remaining: Seconds = None) -> _Tuple[Seconds, Seconds]:
+        """
+        Get the `requests` timeout of one attempt.
+
+        Args:
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            tuple: `(connect, read)`.
+        """
+
+        return self._cap(self.connect, remaining), self._cap(self.read, remaining)
+
+    def to_aiohttp(self, remaining: Seconds = None) -> _Any:
+        """
+        Get the `aiohttp` timeout of one attempt.
+
+        Args:
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            ClientTimeout: Timeout.
+        """
+
+        from aiohttp import ClientTimeout  # pylint: disable=import-outside-toplevel
+
+        return ClientTimeout(total=remaining, connect=self.pool, sock_connect=self.connect, sock_read=self.read)
+
+    def to_httpx(self, remaining: Seconds = None) -> _Any:
+        """
+        Get the `httpx` timeout of one attempt.
+
+        httpx has no total timeout, so every phase is capped by the remaining budget. Writes share the read timeout.
+
+        Args:
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            httpx.Timeout: Timeout.
+        """
+
+        from httpx import Timeout as _HttpxTimeout  # pylint: disable=import-outside-toplevel
+
+        read = self._cap(self.read, remaining)
+        return _HttpxTimeout(
+            connect=self._cap(self.connect, remaining), read=read, write=read, pool=self._cap(self.pool, remaining)
+        )
+
+
+TimeoutLike = _Union[Timeout, float]
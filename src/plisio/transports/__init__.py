@@ -0,0 +1,79 @@
+"""
+HTTP transports for plisio clients.
+
+[RequestsTransport](_requests) - Default transport of `Client`.<br>
+[AiohttpTransport](_aiohttp) - Default transport of `AsyncClient`.<br>
+[HttpxTransport, AsyncHttpxTransport](_httpx) - HTTP/2 capable transports, require `httpx[http2]`.
+
+Transports are imported on first access.
+"""
+
+from importlib import import_module as _import_module
+from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING
+
+from ._base import Transport, AsyncTransport, TransportResponse, StreamResponse, PoolStats
+
+if _TYPE_CHECKING:
+    from ._requests import RequestsTransport
+    from ._aiohttp import AiohttpTransport
+    from ._httpx import HttpxTransport, AsyncHttpxTransport
+
+__all__ = [
+    "Transport",
+    "AsyncTransport",
+    "TransportResponse",
+    "StreamResponse",
+    "PoolStats",
+    "RequestsTransport",
+    "AiohttpTransport",
+    "HttpxTransport",
+    "AsyncHttpxTransport",
+]
+
+_MODULES = {
+    "RequestsTransport": "._requests",
+    "AiohttpTransport": "._aiohttp",
+    "HttpxTransport": "._httpx",
+    "AsyncHttpxTransport": "._httpx",
+}
+
+
+def __getattr__(name: str) -> _Any:
+    """
+    Import a transport on first access, so only the HTTP library in use is imported and httpx stays optional.
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute.
+
+    Raises:
+        ImportError: If httpx is required but not installed.
+        AttributeError: If the attribute does not exist.
+    """
+
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = _import_module(_MODULES[name], __name__)
+    except ImportError as exc:
+        if _MODULES[name] != "._httpx":
+            raise
+        raise ImportError(f"{name} requires httpx, install it with `pip install httpx[http2]`") from exc
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:  # type: ignore[type-arg]
+    """
+    List module attributes, including the lazily imported ones.
+
+    Returns:
+        list: Attribute names.
+    """
+
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,151 @@
+"""
+Transport backed by aiohttp.
+"""
+
+import asyncio as _asyncio
+from contextlib import asynccontextmanager as _asynccontextmanager
+from typing import (
+    Any as _Any,
+    AsyncIterator as _AsyncIterator,
+    Optional as _Optional,
+)
+
+from aiohttp import (
+    ClientConnectionError as _ClientConnectionError,
+    ClientSession as _Session,
+    TCPConnector as _TCPConnector,
+)
+from yarl import URL as _URL
+
+from ._base import (
+    CHUNK_SIZE as _CHUNK_SIZE,
+    AsyncTransport,
+    StreamResponse as _StreamResponse,
+    TransportResponse as _TransportResponse,
+    join_query as _join_query,
+)
+from ..timeouts import Timeout as _Timeout
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Asynchronous transport backed by an `aiohttp` session.
+
+    The session is created lazily on the first request, inside the running event loop.
+    """
+
+    RETRY_EXCEPTIONS = (_ClientConnectionError, _asyncio.TimeoutError)
+    TIMEOUT_EXCEPTION = _asyncio.TimeoutError
+
+    def __init__(
+        self,
+        connector: _Optional[_TCPConnector] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: _Optional[int] = 10,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            connector (TCPConnector): Shared connector, left open when the transport is closed.
+            limit (int): Total simultaneous connections of the owned connector.
+            limit_per_host (int): Simultaneous connections per host of the owned connector, 0 for no limit.
+            ttl_dns_cache (int): DNS cache TTL in seconds of the owned connector, `None` to cache forever.
+        """
+
+        self.connector = connector
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self._session: _Optional[_Session] = None
+
+    def get_session(self) -> _Session:
+        """
+        Get session, creating it on first use.
+
+        Must be called from within a running event loop.
+
+        Returns:
+            ClientSession: Session.
+        """
+
+        if self._session is None or self._session.closed:
+            owned = self.connector is None
+            connector = self.connector or _TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+            )
+            self._session = _Session(connector=connector, connector_owner=owned)
+
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs: _Any) -> _TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            **kwargs: Keyword arguments of `aiohttp.ClientSession.request`.
+
+        Returns:
+            TransportResponse: Response.
+        """
+
+        async with self.get_session().request(
+            method, _URL(_join_query(url, kwargs), encoded=True), **kwargs
+        ) as response:
+            content = await response.read()
+            return _TransportResponse(response.status, response.headers, content, response)
+
+    @_asynccontextmanager
+    async def stream(
+        self, method: str, url: str, chunk_size: int = _CHUNK_SIZE, **kwargs: _Any
+    ) -> _AsyncIterator[_StreamResponse]:
+        """
+        Send a request and stream the response body.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            chunk_size (int): Size in bytes of the body chunks.
+            **kwargs: Keyword arguments of `aiohttp.ClientSession.request`.
+
+        Yields:
+            StreamResponse: Response with an async iterator of chunks, released when the context exits.
+        """
+
+        async with self.get_session().request(
+            method, _URL(_join_query(url, kwargs), encoded=True), **kwargs
+        ) as response:
+            yield _StreamResponse(
+                response.status, response.headers, response.content.iter_chunked(chunk_size), response
+            )
+
+    def get_timeout(self, timeout: _Timeout, remaining: _Optional[float] = None) -> _Any:
+        """
+        Convert a timeout to an `aiohttp` timeout.
+
+        Args:
+            timeout (Timeout): Timeout.
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            ClientTimeout: Timeout.
+        """
+
+        return timeout.to_aiohttp(remaining)
+
+    async def aclose(self) -> None:
+        """
+        Close the session.
+
+        The connector is closed too, unless it was passed in by the caller.
+        """
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
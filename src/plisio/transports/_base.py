@@ -0,0 +1,339 @@
+"""
+Base transport classes.
+"""
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from contextlib import asynccontextmanager as _asynccontextmanager, contextmanager as _contextmanager
+from typing import (
+    Any as _Any,
+    AsyncIterator as _AsyncIterator,
+    Dict as _Dict,
+    Iterator as _Iterator,
+    Mapping as _Mapping,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Type as _Type,
+)
+
+from ..timeouts import Timeout as _Timeout
+
+PoolStats = _Dict[str, _Dict[str, int]]
+
+CHUNK_SIZE = 64 * 1024
+"""Default size in bytes of the chunks of a streamed response body."""
+
+
+def join_query(url: str, kwargs: _Dict[str, _Any]) -> str:
+    """
+    Move a query string passed as `params` into the URL.
+
+    Clients pass `params` percent-encoded by `encode_query`. HTTP libraries encoding `params` themselves would
+    encode it a second time, so transports send it as part of an already encoded URL instead.
+
+    Args:
+        url (str): URL without query.
+        kwargs (dict): Request kwargs, `params` is removed when it is a string.
+
+    Returns:
+        str: URL with the query string.
+    """
+
+    params = kwargs.get("params")
+    if not isinstance(params, str):
+        return url
+
+    del kwargs["params"]
+    if not params:
+        return url
+
+    return f"{url}{'&' if '?' in url else '?'}{params}"
+
+
+class TransportResponse:
+    """
+    HTTP response returned by a transport, with the body already read.
+    """
+
+    __slots__ = ("status", "headers", "content", "raw")
+
+    def __init__(self, status: int, headers: _Mapping[str, str], content: bytes, raw: _Any = None):
+        """
+        Initialize response.
+
+        Args:
+            status (int): Status code.
+            headers (Mapping): Response headers.
+            content (bytes): Response body.
+            raw (Any): Response object of the underlying HTTP library.
+        """
+
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"<{self.__class__.__name__} [{self.status}]>"
+
+    @property
+    def status_code(self) -> int:
+        """
+        Status code, alias of `status`.
+
+        Returns:
+            int: Status code.
+        """
+
+        return self.status
+
+    @property
+    def text(self) -> str:
+        """
+        Response body decoded as UTF-8.
+
+        Returns:
+            str: Body.
+        """
+
+        return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def request(self) -> _Any:
+        """
+        Request object of the underlying HTTP library, if it exposes one.
+
+        Returns:
+            Any: Request.
+        """
+
+        return getattr(self.raw, "request", None)
+
+
+class StreamResponse:
+    """
+    HTTP response returned by a transport stream, with the body not read yet.
+
+    `chunks` is an iterator of `bytes` (an async iterator for async transports), valid until the stream closes.
+    """
+
+    __slots__ = ("status", "headers", "chunks", "raw")
+
+    def __init__(self, status: int, headers: _Mapping[str, str], chunks: _Any, raw: _Any = None):
+        """
+        Initialize response.
+
+        Args:
+            status (int): Status code.
+            headers (Mapping): Response headers.
+            chunks (Iterator): Chunks of the response body.
+            raw (Any): Response object of the underlying HTTP library.
+        """
+
+        self.status = status
+        self.headers = headers
+        self.chunks = chunks
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"<{self.__class__.__name__} [{self.status}]>"
+
+
+async def _aiter_once(content: bytes) -> _AsyncIterator[bytes]:
+    """
+    Yield a whole body as a single chunk.
+
+    Args:
+        content (bytes): Body.
+
+    Yields:
+        bytes: Body.
+    """
+
+    yield content
+
+
+class Transport(ABC):
+    """
+    Synchronous HTTP transport.
+
+    A transport sends one HTTP request and returns its response. Retries, timeouts budgets, rate limiting and
+    caching are handled by the client.
+    """
+
+    RETRY_EXCEPTIONS: _Tuple[_Type[BaseException], ...] = ()
+    """Exceptions of the HTTP library that are worth retrying, e.g. connection errors and timeouts."""
+    TIMEOUT_EXCEPTION: _Type[BaseException] = TimeoutError
+    """Exception raised when the total timeout of a call is exhausted."""
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs: _Any) -> TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            **kwargs: Keyword arguments of the HTTP library, e.g. `params`, `headers` and `timeout`.
+
+        Returns:
+            TransportResponse: Response.
+        """
+
+        raise NotImplementedError
+
+    @_contextmanager
+    def stream(self, method: str, url: str, chunk_size: int = CHUNK_SIZE, **kwargs: _Any) -> _Iterator[StreamResponse]:
+        """
+        Send a request and stream the response body.
+
+        The default implementation reads the whole body with `request` and yields it as a single chunk,
+        transports able to stream override it.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            chunk_size (int): Size in bytes of the body chunks.
+            **kwargs: Keyword arguments of the HTTP library, e.g. `params`, `headers` and `timeout`.
+
+        Yields:
+            StreamResponse: Response, the connection is released when the context exits.
+        """
+
+        response = self.request(method, url, **kwargs)
+        yield StreamResponse(response.status, response.headers, iter((response.content,)), response.raw)
+
+    @abstractmethod
+    def get_timeout(self, timeout: _Timeout, remaining: _Optional[float] = None) -> _Any:
+        """
+        Convert a timeout to the timeout of the HTTP library.
+
+        Args:
+            timeout (Timeout): Timeout.
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            Any: Timeout understood by `request`.
+        """
+
+        raise NotImplementedError
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Get connection pool occupancy statistics.
+
+        Returns:
+            dict: Statistics keyed by `scheme://host:port`, empty if the transport does not expose them.
+        """
+
+        return {}
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Close the transport and release its connections.
+        """
+
+        raise NotImplementedError
+
+
+class AsyncTransport(ABC):
+    """
+    Asynchronous HTTP transport.
+
+    Resources bound to the event loop must be created lazily, on the first request.
+    """
+
+    RETRY_EXCEPTIONS: _Tuple[_Type[BaseException], ...] = ()
+    """Exceptions of the HTTP library that are worth retrying, e.g. connection errors and timeouts."""
+    TIMEOUT_EXCEPTION: _Type[BaseException] = TimeoutError
+    """Exception raised when the total timeout of a call is exhausted."""
+
+    @abstractmethod
+    async def request(self, method: str, url: str, **kwargs: _Any) -> TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            **kwargs: Keyword arguments of the HTTP library, e.g. `params`, `headers` and `timeout`.
+
+        Returns:
+            TransportResponse: Response.
+        """
+
+        raise NotImplementedError
+
+    @_asynccontextmanager
+    async def stream(
+        self, method: str, url: str, chunk_size: int = CHUNK_SIZE, **kwargs: _Any
+    ) -> _AsyncIterator[StreamResponse]:
+        """
+        Send a request and stream the response body.
+
+        The default implementation reads the whole body with `request` and yields it as a single chunk,
+        transports able to stream override it.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            chunk_size (int): Size in bytes of the body chunks.
+            **kwargs: Keyword arguments of the HTTP library, e.g. `params`, `headers` and `timeout`.
+
+        Yields:
+            StreamResponse: Response with an async iterator of chunks, the connection is released when the
+                context exits.
+        """
+
+        response = await self.request(method, url, **kwargs)
+        yield StreamResponse(response.status, response.headers, _aiter_once(response.content), response.raw)
+
+    @abstractmethod
+    def get_timeout(self, timeout: _Timeout, remaining: _Optional[float] = None) -> _Any:
+        """
+        Convert a timeout to the timeout of the HTTP library.
+
+        Args:
+            timeout (Timeout): Timeout.
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            Any: Timeout understood by `request`.
+        """
+
+        raise NotImplementedError
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Get connection pool occupancy statistics.
+
+        Returns:
+            dict: Statistics keyed by `scheme://host:port`, empty if the transport does not expose them.
+        """
+
+        return {}
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """
+        Close the transport and release its connections.
+        """
+
+        raise NotImplementedError
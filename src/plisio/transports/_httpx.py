@@ -0,0 +1,249 @@
+"""
+Transports backed by httpx, with HTTP/2 support.
+
+Requires httpx with HTTP/2 support: `pip install httpx[http2]`.
+"""
+
+from contextlib import asynccontextmanager as _asynccontextmanager, contextmanager as _contextmanager
+from typing import (
+    Any as _Any,
+    AsyncIterator as _AsyncIterator,
+    Iterator as _Iterator,
+    Optional as _Optional,
+)
+
+import httpx as _httpx
+
+from ._base import (
+    CHUNK_SIZE as _CHUNK_SIZE,
+    AsyncTransport,
+    StreamResponse as _StreamResponse,
+    Transport,
+    TransportResponse as _TransportResponse,
+    join_query as _join_query,
+)
+from ..timeouts import Timeout as _Timeout
+
+
+def _get_limits(
+    max_connections: _Optional[int], max_keepalive_connections: _Optional[int], keepalive_expiry: float
+) -> _httpx.Limits:
+    """
+    Build connection pool limits.
+
+    Args:
+        max_connections (int): Maximum simultaneous connections, `None` for no limit.
+        max_keepalive_connections (int): Maximum idle connections kept alive, `None` for no limit.
+        keepalive_expiry (float): Seconds an idle connection is kept alive.
+
+    Returns:
+        httpx.Limits: Limits.
+    """
+
+    return _httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class HttpxTransport(Transport):
+    """
+    Synchronous transport backed by an `httpx` client.
+
+    With HTTP/2 concurrent requests from several threads are multiplexed over a single connection.
+    """
+
+    RETRY_EXCEPTIONS = (_httpx.TransportError,)
+    TIMEOUT_EXCEPTION = _httpx.TimeoutException
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: _Optional[int] = 10,
+        max_keepalive_connections: _Optional[int] = 10,
+        keepalive_expiry: float = 5.0,
+        client: _Optional[_httpx.Client] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            http2 (bool): Negotiate HTTP/2, falling back to HTTP/1.1 if the server does not support it.
+            max_connections (int): Maximum simultaneous connections, `None` for no limit.
+            max_keepalive_connections (int): Maximum idle connections kept alive, `None` for no limit.
+            keepalive_expiry (float): Seconds an idle connection is kept alive.
+            client (httpx.Client): Client to use instead of a new one, the other options are then ignored.
+        """
+
+        self.client = client or _httpx.Client(
+            http2=http2, limits=_get_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        )
+
+    def request(self, method: str, url: str, **kwargs: _Any) -> _TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            **kwargs: Keyword arguments of `httpx.Client.request`.
+
+        Returns:
+            TransportResponse: Response.
+        """
+
+        response = self.client.request(method, _join_query(url, kwargs), **kwargs)
+        return _TransportResponse(response.status_code, response.headers, response.content, response)
+
+    @_contextmanager
+    def stream(
+        self, method: str, url: str, chunk_size: int = _CHUNK_SIZE, **kwargs: _Any
+    ) -> _Iterator[_StreamResponse]:
+        """
+        Send a request and stream the response body.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            chunk_size (int): Size in bytes of the body chunks.
+            **kwargs: Keyword arguments of `httpx.Client.stream`.
+
+        Yields:
+            StreamResponse: Response, released when the context exits.
+        """
+
+        with self.client.stream(method, _join_query(url, kwargs), **kwargs) as response:
+            yield _StreamResponse(response.status_code, response.headers, response.iter_bytes(chunk_size), response)
+
+    def get_timeout(self, timeout: _Timeout, remaining: _Optional[float] = None) -> _Any:
+        """
+        Convert a timeout to an `httpx` timeout.
+
+        Args:
+            timeout (Timeout): Timeout.
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            httpx.Timeout: Timeout.
+        """
+
+        return timeout.to_httpx(remaining)
+
+    def close(self) -> None:
+        """
+        Close the client and release its connections.
+        """
+
+        self.client.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """
+    Asynchronous transport backed by an `httpx` async client.
+
+    With HTTP/2 concurrent requests are multiplexed over a single connection instead of one socket each.
+    The client is created lazily on the first request, inside the running event loop.
+    """
+
+    RETRY_EXCEPTIONS = (_httpx.TransportError,)
+    TIMEOUT_EXCEPTION = _httpx.TimeoutException
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: _Optional[int] = 100,
+        max_keepalive_connections: _Optional[int] = 20,
+        keepalive_expiry: float = 5.0,
+        client: _Optional[_httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            http2 (bool): Negotiate HTTP/2, falling back to HTTP/1.1 if the server does not support it.
+            max_connections (int): Maximum simultaneous connections, `None` for no limit.
+            max_keepalive_connections (int): Maximum idle connections kept alive, `None` for no limit.
+            keepalive_expiry (float): Seconds an idle connection is kept alive.
+            client (httpx.AsyncClient): Client to use instead of a new one, left open when the transport is closed.
+        """
+
+        self.http2 = http2
+        self.limits = _get_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        self._owned = client is None
+        self._client = client
+
+    def get_client(self) -> _httpx.AsyncClient:
+        """
+        Get client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: Client.
+        """
+
+        if self._client is None or self._client.is_closed:
+            self._client = _httpx.AsyncClient(http2=self.http2, limits=self.limits)
+            self._owned = True
+
+        return self._client
+
+    async def request(self, method: str, url: str, **kwargs: _Any) -> _TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            **kwargs: Keyword arguments of `httpx.AsyncClient.request`.
+
+        Returns:
+            TransportResponse: Response.
+        """
+
+        response = await self.get_client().request(method, _join_query(url, kwargs), **kwargs)
+        return _TransportResponse(response.status_code, response.headers, response.content, response)
+
+    @_asynccontextmanager
+    async def stream(
+        self, method: str, url: str, chunk_size: int = _CHUNK_SIZE, **kwargs: _Any
+    ) -> _AsyncIterator[_StreamResponse]:
+        """
+        Send a request and stream the response body.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            chunk_size (int): Size in bytes of the body chunks.
+            **kwargs: Keyword arguments of `httpx.AsyncClient.stream`.
+
+        Yields:
+            StreamResponse: Response with an async iterator of chunks, released when the context exits.
+        """
+
+        async with self.get_client().stream(method, _join_query(url, kwargs), **kwargs) as response:
+            yield _StreamResponse(response.status_code, response.headers, response.aiter_bytes(chunk_size), response)
+
+    def get_timeout(self, timeout: _Timeout, remaining: _Optional[float] = None) -> _Any:
+        """
+        Convert a timeout to an `httpx` timeout.
+
+        Args:
+            timeout (Timeout): Timeout.
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            httpx.Timeout: Timeout.
+        """
+
+        return timeout.to_httpx(remaining)
+
+    async def aclose(self) -> None:
+        """
+        Close the client, unless it was passed in by the caller.
+        """
+
+        if self._owned and self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+        if self._owned:
+            self._client = None
@@ -0,0 +1,127 @@
+"""
+Connection pool helpers for the requests transport.
+"""
+
+import socket as _socket
+from typing import (
+    Any as _Any,
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+
+from ._base import PoolStats
+
+
+def keep_alive_socket_options(idle: _Optional[int]) -> _List[_Tuple[int, int, int]]:
+    """
+    Build socket options enabling TCP keep-alive.
+
+    Args:
+        idle (int): Seconds a connection may stay idle before keep-alive probes are sent.
+
+    Returns:
+        list: Socket options understood by urllib3.
+    """
+
+    if idle is None:
+        return []
+
+    options = [(_socket.SOL_SOCKET, _socket.SO_KEEPALIVE, 1)]
+
+    if hasattr(_socket, "TCP_KEEPIDLE"):
+        options.append((_socket.IPPROTO_TCP, _socket.TCP_KEEPIDLE, idle))
+    elif hasattr(_socket, "TCP_KEEPALIVE"):  # macOS
+        options.append((_socket.IPPROTO_TCP, _socket.TCP_KEEPALIVE, idle))
+
+    if hasattr(_socket, "TCP_KEEPINTVL"):
+        options.append((_socket.IPPROTO_TCP, _socket.TCP_KEEPINTVL, max(1, idle // 3)))
+
+    return options
+
+
+class PoolAdapter(_HTTPAdapter):
+    """
+    HTTP adapter with a tunable connection pool and occupancy statistics.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: _Optional[int] = None,
+    ):
+        """
+        Initialize adapter.
+
+        Args:
+            pool_connections (int): Number of host pools to cache.
+            pool_maxsize (int): Maximum connections kept per host pool.
+            pool_block (bool): Block when the pool is exhausted instead of opening throw-away connections.
+            keep_alive (int): TCP keep-alive idle time in seconds, `None` to use the OS default.
+        """
+
+        self._socket_options = keep_alive_socket_options(keep_alive)
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(  # type: ignore[no-untyped-def]
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: _Any
+    ):
+        """
+        Initialize pool manager.
+
+        Args:
+            connections (int): Number of host pools to cache.
+            maxsize (int): Maximum connections kept per host pool.
+            block (bool): Block when the pool is exhausted.
+            **pool_kwargs: Extra pool keyword arguments.
+        """
+
+        if self._socket_options:
+            pool_kwargs.setdefault("socket_options", self._default_socket_options() + self._socket_options)
+
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    @staticmethod
+    def _default_socket_options() -> _List[_Tuple[int, int, int]]:
+        """
+        Get urllib3 default socket options.
+
+        Returns:
+            list: Socket options.
+        """
+
+        from urllib3.connection import HTTPConnection  # pylint: disable=import-outside-toplevel
+
+        return list(HTTPConnection.default_socket_options)
+
+    def stats(self) -> PoolStats:
+        """
+        Get pool occupancy statistics.
+
+        Returns:
+            dict: Statistics keyed by `scheme://host:port`.
+        """
+
+        result: PoolStats = {}
+        pools = self.poolmanager.pools
+
+        with pools.lock:
+            entries = list(pools._container.items())  # pylint: disable=protected-access
+
+        for key, pool in entries:
+            maxsize = pool.pool.maxsize if pool.pool is not None else 0
+            available = pool.pool.qsize() if pool.pool is not None else 0
+            result[f"{key.key_scheme}://{key.key_host}:{key.key_port}"] = {
+                "maxsize": maxsize,
+                "in_use": maxsize - available,
+                "available": available,
+                "connections_created": pool.num_connections,
+                "requests": pool.num_requests,
+            }
+
+        return result
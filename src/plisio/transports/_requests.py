@@ -0,0 +1,131 @@
+"""
+Transport backed by requests.
+"""
+
+from contextlib import contextmanager as _contextmanager
+from typing import (
+    Any as _Any,
+    Iterator as _Iterator,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+import requests as _requests
+
+from ._base import (
+    CHUNK_SIZE as _CHUNK_SIZE,
+    PoolStats as _PoolStats,
+    StreamResponse as _StreamResponse,
+    Transport,
+    TransportResponse as _TransportResponse,
+)
+from ._pool import PoolAdapter as _PoolAdapter
+from ..timeouts import Timeout as _Timeout
+
+
+class RequestsTransport(Transport):
+    """
+    Synchronous transport backed by a `requests` session with a tunable connection pool.
+    """
+
+    RETRY_EXCEPTIONS = (_requests.ConnectionError, _requests.Timeout)
+    TIMEOUT_EXCEPTION = _requests.Timeout
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: _Optional[int] = None,
+        session: _Optional[_requests.Session] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            pool_connections (int): Number of host pools to cache.
+            pool_maxsize (int): Maximum connections kept alive per host, size it to your worker count.
+            pool_block (bool): Wait for a free connection instead of opening a throw-away one when exhausted.
+            keep_alive (int): TCP keep-alive idle time in seconds, `None` to use the OS default.
+            session (Session): Session to use instead of a new one, the pool adapter is mounted on it.
+        """
+
+        self.adapter = _PoolAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self.session = session or _requests.Session()
+        self.session.mount("https://", self.adapter)
+
+    def request(self, method: str, url: str, **kwargs: _Any) -> _TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            **kwargs: Keyword arguments of `requests.Session.request`.
+
+        Returns:
+            TransportResponse: Response.
+        """
+
+        response = self.session.request(method, url, **kwargs)
+        return _TransportResponse(response.status_code, response.headers, response.content, response)
+
+    @_contextmanager
+    def stream(
+        self, method: str, url: str, chunk_size: int = _CHUNK_SIZE, **kwargs: _Any
+    ) -> _Iterator[_StreamResponse]:
+        """
+        Send a request and stream the response body.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            chunk_size (int): Size in bytes of the body chunks.
+            **kwargs: Keyword arguments of `requests.Session.request`.
+
+        Yields:
+            StreamResponse: Response, the connection is returned to the pool when the context exits.
+        """
+
+        response = self.session.request(method, url, stream=True, **kwargs)
+        try:
+            yield _StreamResponse(response.status_code, response.headers, response.iter_content(chunk_size), response)
+        finally:
+            response.close()
+
+    def get_timeout(self, timeout: _Timeout, remaining: _Optional[float] = None) -> _Tuple[_Any, _Any]:
+        """
+        Convert a timeout to a `requests` timeout.
+
+        Args:
+            timeout (Timeout): Timeout.
+            remaining (float): Remaining total budget in seconds.
+
+        Returns:
+            tuple: `(connect, read)`.
+        """
+
+        return timeout.to_requests(remaining)
+
+    def pool_stats(self) -> _PoolStats:
+        """
+        Get connection pool occupancy statistics.
+
+        Returns:
+            dict: Statistics keyed by `scheme://host:port` with `maxsize`, `in_use`, `available`,
+                `connections_created` and `requests` counters.
+        """
+
+        return self.adapter.stats()
+
+    def close(self) -> None:
+        """
+        Close the session and release pooled connections.
+        """
+
+        self.session.close()
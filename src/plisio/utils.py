@@ -2,6 +2,24 @@
 Utils module for plisio.
 """
 
+import re as _re
+from decimal import Decimal as _Decimal
+from enum import Enum as _Enum
+from typing import (
+    Any as _Any,
+    Dict as _Dict,
+    Mapping as _Mapping,
+)
+from urllib.parse import quote as _quote
+
+from . import enums as _enums
+
+_BY_NAME = (_enums.Currencies, _enums.FiatCurrency)
+_SAFE = ","
+_PLAIN = _re.compile(r"[A-Za-z0-9_.,~-]*").fullmatch
+_ENCODED: _Dict[_Any, str] = {}
+_ENCODED_MAXSIZE = 4096
+
 
 def to_camel_case(snake_str: str) -> str:
     """
@@ -9,3 +27,101 @@ def to_camel_case(snake_str: str) -> str:
     """
     components = snake_str.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
+
+
+def encode_value(value: _Any) -> str:
+    """
+    Convert a parameter value to its query string form, before percent-encoding.
+
+    Currencies are sent by code (`Currencies.BTC` as `BTC`), other enums by value, booleans as `1`/`0`,
+    decimals in fixed-point notation and lists, tuples and sets as comma-separated values.
+
+    Args:
+        value (Any): Value.
+
+    Returns:
+        str: Value.
+    """
+
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, _Enum):
+        return value.name if isinstance(value, _BY_NAME) else str(value.value)
+    if isinstance(value, _Decimal):
+        return format(value, "f")
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(encode_value(item) for item in value)
+    return str(value)
+
+
+def _quote_text(text: str) -> str:
+    """
+    Percent-encode a string, keeping commas.
+
+    Args:
+        text (str): Text.
+
+    Returns:
+        str: Percent-encoded text.
+    """
+
+    return text if _PLAIN(text) else _quote(text, safe=_SAFE)
+
+
+def _encode_pair(key: str, value: _Any) -> str:
+    """
+    Percent-encode a `key=value` pair of a query string.
+
+    Pairs of hashable values are memoized by key, value type and value, since names, currencies, statuses, page
+    sizes, callback URLs and the API key repeat across requests. The type keeps `1`, `1.0` and `True` apart.
+
+    Args:
+        key (str): Parameter name.
+        value (Any): Parameter value.
+
+    Returns:
+        str: Percent-encoded pair.
+    """
+
+    try:
+        memo_key = (key, value.__class__, value)
+        encoded = _ENCODED.get(memo_key)
+    except TypeError:
+        return f"{_quote_text(key)}={_quote_text(encode_value(value))}"
+
+    if encoded is None:
+        encoded = f"{_quote_text(key)}={_quote_text(encode_value(value))}"
+        if len(_ENCODED) >= _ENCODED_MAXSIZE:
+            _ENCODED.clear()
+        _ENCODED[memo_key] = encoded
+
+    return encoded
+
+
+def encode_query(params: _Mapping[str, _Any]) -> str:
+    """
+    Build a percent-encoded query string.
+
+    `None` values are skipped. Commas are kept as is, they separate list items.
+
+    Args:
+        params (Mapping): Parameters.
+
+    Returns:
+        str: Query string without the leading `?`.
+    """
+
+    get = _ENCODED.get
+    parts = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        try:
+            encoded = get((key, value.__class__, value))
+        except TypeError:
+            encoded = None
+        parts.append(encoded or _encode_pair(key, value))
+
+    return "&".join(parts)
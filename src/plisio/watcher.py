@@ -0,0 +1,481 @@
+"""
+Status polling of many open transactions, for integrations that cannot receive callbacks.
+"""
+
+import asyncio as _asyncio
+import heapq as _heapq
+from inspect import isawaitable as _isawaitable
+from itertools import count as _count
+from random import uniform as _uniform
+from typing import (
+    TYPE_CHECKING as _TYPE_CHECKING,
+    Any as _Any,
+    Callable as _Callable,
+    Dict as _Dict,
+    List as _List,
+    Mapping as _Mapping,
+    Optional as _Optional,
+    Set as _Set,
+    Tuple as _Tuple,
+)
+
+from . import _types as _t
+from .enums import TransactionStatus as _TransactionStatus
+
+if _TYPE_CHECKING:
+    from .clients import AsyncClient
+
+__all__ = ["InvoiceWatcher", "StatusChange", "TERMINAL_STATUSES", "DEFAULT_INTERVALS"]
+
+TERMINAL_STATUSES = frozenset(
+    status.value
+    for status in (
+        _TransactionStatus.COMPLETED,
+        _TransactionStatus.EXPIRED,
+        _TransactionStatus.ERROR,
+        _TransactionStatus.CANCELLED,
+    )
+)
+"""Statuses a transaction does not leave, watching stops once one is reached."""
+
+DEFAULT_INTERVALS: _Mapping[str, _Tuple[float, float]] = {
+    _TransactionStatus.NEW.value: (30.0, 300.0),
+    _TransactionStatus.PENDING.value: (10.0, 60.0),
+    _TransactionStatus.PENDING_INTERNAL.value: (15.0, 120.0),
+    _TransactionStatus.MISMATCH.value: (60.0, 600.0),
+}
+"""Initial and maximum polling interval in seconds per status."""
+
+OnChange = _Callable[["StatusChange"], _Any]
+
+
+class StatusChange:
+    """
+    Status change of a watched transaction.
+    """
+
+    __slots__ = ("txn_id", "previous", "status", "result")
+
+    def __init__(self, txn_id: str, previous: _t.OptionalText, status: str, result: _t.Result):
+        """
+        Initialize event.
+
+        Args:
+            txn_id (str): Transaction ID.
+            previous (str): Previous status, `None` on the first poll without a known status.
+            status (str): New status.
+            result (dict): `transaction_details` response.
+        """
+
+        self.txn_id = txn_id
+        self.previous = previous
+        self.status = status
+        self.result = result
+
+    @property
+    def terminal(self) -> bool:
+        """
+        Whether the new status is final.
+
+        Returns:
+            bool: `True` if the status is in `TERMINAL_STATUSES`.
+        """
+
+        return self.status in TERMINAL_STATUSES
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"<{self.__class__.__name__} {self.txn_id}: {self.previous} -> {self.status}>"
+
+
+class _Watch:
+    """
+    State of a watched transaction.
+    """
+
+    __slots__ = ("txn_id", "status", "interval", "seq", "failures", "future")
+
+    def __init__(self, txn_id: str, status: _t.OptionalText, interval: float, future: "_asyncio.Future[_t.Result]"):
+        """
+        Initialize state.
+
+        Args:
+            txn_id (str): Transaction ID.
+            status (str): Last known status.
+            interval (float): Current polling interval in seconds.
+            future (Future): Future resolved with the terminal response.
+        """
+
+        self.txn_id = txn_id
+        self.status = status
+        self.interval = interval
+        self.seq = -1
+        self.failures = 0
+        self.future = future
+
+
+class InvoiceWatcher:
+    """
+    Poll `transaction_details` of many open transactions until they reach a terminal status.
+
+    Polls are scheduled on a heap ordered by due time, so the cost of waiting does not grow with the number of
+    watched transactions. The interval of a transaction starts at the initial interval of its status and is
+    multiplied by `backoff` after every poll without change, up to the maximum of the status. A status change
+    resets it. Due polls run concurrently within the `concurrency` budget, on top of the client rate limiter.
+
+    Metrics counters, on the client metrics: `watch_polls`, `watch_changes` and `watch_errors`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client: "AsyncClient",
+        on_change: _Optional[OnChange] = None,
+        intervals: _Optional[_Mapping[str, _Tuple[float, float]]] = None,
+        backoff: float = 1.5,
+        jitter: float = 0.1,
+        concurrency: int = 10,
+        max_failures: int = 5,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            client (AsyncClient): Client.
+            on_change (Callable): Function or coroutine function called with every `StatusChange`.
+            intervals (dict): Initial and maximum interval in seconds per status, merged over `DEFAULT_INTERVALS`.
+                Unknown statuses use the intervals of `new`.
+            backoff (float): Interval multiplier after a poll without change.
+            jitter (float): Random spread of the intervals, e.g. `0.1` for +/- 10%.
+            concurrency (int): Maximum number of polls in flight.
+            max_failures (int): Consecutive failed polls after which a transaction is dropped and its future
+                fails with the last error.
+
+        Raises:
+            ValueError: If `backoff` is lower than 1 or `concurrency` lower than 1.
+        """
+
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.client = client
+        self.on_change = on_change
+        self.intervals = {**DEFAULT_INTERVALS, **(intervals or {})}
+        self.backoff = backoff
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.max_failures = max_failures
+        self._watches: _Dict[str, _Watch] = {}
+        self._heap: _List[_Tuple[float, int, str]] = []
+        self._seq = _count()
+        self._wakeup: _Optional[_asyncio.Event] = None
+        self._budget: _Optional[_asyncio.Semaphore] = None
+        self._task: "_Optional[_asyncio.Future[None]]" = None
+        self._polls: "_Set[_asyncio.Future[None]]" = set()
+
+    def __len__(self) -> int:
+        """
+        Get number of watched transactions.
+
+        Returns:
+            int: Number of transactions.
+        """
+
+        return len(self._watches)
+
+    def __contains__(self, txn_id: object) -> bool:
+        """
+        Check whether a transaction is watched.
+
+        Args:
+            txn_id (str): Transaction ID.
+
+        Returns:
+            bool: `True` if watched.
+        """
+
+        return txn_id in self._watches
+
+    def _get_interval(self, status: _t.OptionalText) -> _Tuple[float, float]:
+        """
+        Get the initial and maximum interval of a status.
+
+        Args:
+            status (str): Status.
+
+        Returns:
+            tuple: `(initial, maximum)` in seconds.
+        """
+
+        return self.intervals.get(status or "", self.intervals[_TransactionStatus.NEW.value])
+
+    def _get_wakeup(self) -> _asyncio.Event:
+        """
+        Get the event waking the scheduler, created inside the running event loop.
+
+        Returns:
+            asyncio.Event: Event.
+        """
+
+        if self._wakeup is None:
+            self._wakeup = _asyncio.Event()
+
+        return self._wakeup
+
+    def _schedule(self, watch: _Watch, delay: float) -> None:
+        """
+        Schedule the next poll of a transaction.
+
+        Args:
+            watch (_Watch): Transaction state.
+            delay (float): Seconds until the poll, before jitter.
+        """
+
+        if self._watches.get(watch.txn_id) is not watch:
+            return
+
+        if self.jitter:
+            delay *= _uniform(1 - self.jitter, 1 + self.jitter)
+
+        watch.seq = next(self._seq)
+        due = _asyncio.get_running_loop().time() + delay
+        _heapq.heappush(self._heap, (due, watch.seq, watch.txn_id))
+
+        if self._heap[0][1] == watch.seq:
+            self._get_wakeup().set()
+
+    def watch(self, txn_id: str, status: _t.OptionalText = None) -> "_asyncio.Future[_t.Result]":
+        """
+        Start watching a transaction.
+
+        Must be called from within a running event loop.
+
+        Args:
+            txn_id (str): Transaction ID.
+            status (str): Known status, e.g. `new` right after `invoice`. The first poll then waits for the
+                interval of the status instead of running right away.
+
+        Returns:
+            asyncio.Future: Future resolved with the `transaction_details` response of the terminal status.
+                The same future is returned if the transaction is already watched.
+        """
+
+        existing = self._watches.get(txn_id)
+        if existing is not None:
+            return existing.future
+
+        future: "_asyncio.Future[_t.Result]" = _asyncio.get_running_loop().create_future()
+        watch = _Watch(txn_id, status, self._get_interval(status)[0], future)
+        self._watches[txn_id] = watch
+        self._schedule(watch, 0.0 if status is None else watch.interval)
+
+        return future
+
+    def unwatch(self, txn_id: str) -> bool:
+        """
+        Stop watching a transaction, cancelling its future.
+
+        Args:
+            txn_id (str): Transaction ID.
+
+        Returns:
+            bool: `True` if the transaction was watched.
+        """
+
+        watch = self._watches.pop(txn_id, None)
+        if watch is None:
+            return False
+
+        watch.future.cancel()
+        return True
+
+    async def _next_due(self) -> _Watch:
+        """
+        Wait for the next due poll.
+
+        Returns:
+            _Watch: Transaction to poll.
+        """
+
+        wakeup = self._get_wakeup()
+        loop = _asyncio.get_running_loop()
+
+        while True:
+            wakeup.clear()
+
+            while self._heap:
+                _, seq, txn_id = self._heap[0]
+                watch = self._watches.get(txn_id)
+                if watch is not None and watch.seq == seq:
+                    break
+                _heapq.heappop(self._heap)
+
+            if not self._heap:
+                await wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - loop.time()
+            if delay <= 0:
+                _, _, txn_id = _heapq.heappop(self._heap)
+                due = self._watches[txn_id]
+                due.seq = -1
+                return due
+
+            try:
+                await _asyncio.wait_for(wakeup.wait(), delay)
+            except _asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, watch: _Watch) -> None:
+        """
+        Poll a transaction and schedule its next poll.
+
+        Args:
+            watch (_Watch): Transaction state.
+        """
+
+        try:
+            self.client.metrics.incr("watch_polls")
+            try:
+                result = await self.client.transaction_details(watch.txn_id)
+                data: _t.DictAny = result.get("data") or {}  # type: ignore[assignment]
+                status = str(data.get("status", ""))
+            except _asyncio.CancelledError:
+                self._schedule(watch, 0.0)
+                raise
+            except Exception as exc:  # pylint: disable=broad-except
+                self._fail(watch, exc)
+                return
+
+            watch.failures = 0
+            if status != watch.status:
+                change = StatusChange(watch.txn_id, watch.status, status, result)
+                watch.status = status
+                watch.interval = self._get_interval(status)[0]
+                self.client.metrics.incr("watch_changes")
+                await self._emit(change)
+            else:
+                watch.interval = min(watch.interval * self.backoff, self._get_interval(status)[1])
+
+            if status in TERMINAL_STATUSES:
+                if self._watches.get(watch.txn_id) is watch:
+                    del self._watches[watch.txn_id]
+                if not watch.future.done():
+                    watch.future.set_result(result)
+            else:
+                self._schedule(watch, watch.interval)
+        finally:
+            self._budget.release()  # type: ignore[union-attr]
+
+    def _fail(self, watch: _Watch, exc: Exception) -> None:
+        """
+        Handle a failed poll: back off, or drop the transaction after `max_failures` consecutive failures.
+
+        Args:
+            watch (_Watch): Transaction state.
+            exc (Exception): Error of the poll.
+        """
+
+        self.client.metrics.incr("watch_errors")
+        watch.failures += 1
+
+        if watch.failures < self.max_failures:
+            watch.interval = min(watch.interval * self.backoff, self._get_interval(watch.status)[1])
+            self._schedule(watch, watch.interval)
+            return
+
+        if self._watches.get(watch.txn_id) is watch:
+            del self._watches[watch.txn_id]
+        if not watch.future.done():
+            watch.future.set_exception(exc)
+
+    async def _emit(self, change: StatusChange) -> None:
+        """
+        Call `on_change`, errors are counted in `watch_errors` and otherwise ignored.
+
+        Args:
+            change (StatusChange): Event.
+        """
+
+        if self.on_change is None:
+            return
+
+        try:
+            result = self.on_change(change)
+            if _isawaitable(result):
+                await result
+        except Exception:  # pylint: disable=broad-except
+            self.client.metrics.incr("watch_errors")
+
+    async def run(self) -> None:
+        """
+        Run the scheduler until cancelled.
+        """
+
+        if self._budget is None:
+            self._budget = _asyncio.Semaphore(self.concurrency)
+
+        while True:
+            await self._budget.acquire()
+            try:
+                watch = await self._next_due()
+            except BaseException:
+                self._budget.release()
+                raise
+
+            task = _asyncio.ensure_future(self._poll(watch))
+            self._polls.add(task)
+            task.add_done_callback(self._polls.discard)
+
+    def start(self) -> "_asyncio.Future[None]":
+        """
+        Start the scheduler in the background.
+
+        Returns:
+            asyncio.Future: Scheduler task.
+        """
+
+        if self._task is None or self._task.done():
+            self._task = _asyncio.ensure_future(self.run())
+
+        return self._task
+
+    async def stop(self) -> None:
+        """
+        Stop the scheduler and cancel the polls in flight. Watched transactions are kept.
+        """
+
+        tasks = [task for task in (self._task, *self._polls) if task is not None]
+        for task in tasks:
+            task.cancel()
+
+        await _asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def __aenter__(self) -> "InvoiceWatcher":
+        """
+        Start the scheduler.
+
+        Returns:
+            InvoiceWatcher: Watcher.
+        """
+
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: _Any) -> None:
+        """
+        Stop the scheduler.
+
+        Args:
+            *args: Exception info.
+        """
+
+        await self.stop()
@@ -0,0 +1,11 @@
+"""
+Receiving side of Plisio callbacks (webhooks).
+
+[WebhookVerifier, verify_callback](_verify) - `verify_hash` checks of JSON and form-encoded callbacks.<br>
+[WebhookIngestor](_ingest) - ASGI app and aiohttp handler queueing verified callbacks for batch processing.
+"""
+
+from ._verify import WebhookVerifier, verify_callback, php_serialize
+from ._ingest import WebhookEvent, WebhookIngestor
+
+__all__ = ["WebhookVerifier", "verify_callback", "php_serialize", "WebhookEvent", "WebhookIngestor"]
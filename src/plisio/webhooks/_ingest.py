@@ -0,0 +1,432 @@
+"""
+Ingestion of Plisio callbacks: verify, deduplicate, acknowledge and process asynchronously in batches.
+"""
+
+import asyncio as _asyncio
+from collections import deque as _deque
+from time import time as _time
+from typing import (
+    Any as _Any,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    Deque as _Deque,
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Set as _Set,
+    Tuple as _Tuple,
+    Union as _Union,
+)
+
+from ._verify import Body as _Body, WebhookVerifier
+from .. import _types as _t
+from .. import exceptions as _e
+from ..cache import MISSING as _MISSING, TTLCache as _TTLCache
+from ..metrics import Metrics as _Metrics
+
+__all__ = ["WebhookEvent", "WebhookIngestor"]
+
+BatchHandler = _Callable[[_List["WebhookEvent"]], _Awaitable[None]]
+ASGIReceive = _Callable[[], _Awaitable[_Dict[str, _Any]]]
+ASGISend = _Callable[[_Dict[str, _Any]], _Awaitable[None]]
+
+_HEADERS = [(b"content-type", b"text/plain; charset=utf-8")]
+_REASONS = {
+    200: b"OK",
+    400: b"Bad Request",
+    405: b"Method Not Allowed",
+    413: b"Payload Too Large",
+    503: b"Service Unavailable",
+}
+
+
+class WebhookEvent:
+    """
+    Verified callback waiting to be processed.
+    """
+
+    __slots__ = ("txn_id", "status", "payload", "received_at", "attempts")
+
+    def __init__(self, payload: _Dict[str, _Any], received_at: _Optional[float] = None):
+        """
+        Initialize event.
+
+        Args:
+            payload (dict): Verified payload.
+            received_at (float): Unix time the callback was received at, now by default.
+        """
+
+        self.txn_id = str(payload.get("txn_id", ""))
+        self.status = str(payload.get("status", ""))
+        self.payload = payload
+        self.received_at = _time() if received_at is None else received_at
+        self.attempts = 0
+
+    @property
+    def key(self) -> _Tuple[str, str]:
+        """
+        Deduplication key.
+
+        Returns:
+            tuple: `(txn_id, status)`.
+        """
+
+        return self.txn_id, self.status
+
+    def __repr__(self) -> str:
+        """
+        Representation.
+
+        Returns:
+            str: Representation.
+        """
+
+        return f"<{self.__class__.__name__} txn_id={self.txn_id!r} status={self.status!r}>"
+
+
+class WebhookIngestor:
+    """
+    Callback receiver acknowledging fast and processing asynchronously.
+
+    Every callback is verified and deduplicated by `txn_id` and `status`, then put on a bounded queue and
+    acknowledged. When the queue is full the callback is answered `503` so Plisio delivers it again later,
+    instead of piling up memory. Consumers drain the queue in batches.
+
+    Plisio does not deliver an acknowledged callback again, so the ingestor owns it from then on. A `(txn_id,
+    status)` pair is remembered as seen only once its batch was processed. While it is queued, being processed or
+    waiting for a retry, copies are acknowledged without being queued again. The events of a failing batch are
+    queued again after an exponential backoff, up to `max_retries` times, then handed to `dead_letter`.
+
+    The ingestor is an ASGI application, `aiohttp_handler` serves it from aiohttp. Metrics counters:
+    `accepted`, `duplicates`, `rejected`, `overloaded`, `processed`, `handler_errors`, `retried`, `dead_lettered`
+    and `dead_letter_errors`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        verifier: _Union[WebhookVerifier, _t.Text],
+        maxsize: int = 10000,
+        dedup: _Optional[_TTLCache] = None,
+        max_body: int = 64 * 1024,
+        metrics: _t.OptionalMetrics = None,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        dead_letter: _Optional[BatchHandler] = None,
+    ):
+        """
+        Initialize ingestor.
+
+        Args:
+            verifier (WebhookVerifier): Verifier, or the API key to build one from.
+            maxsize (int): Capacity of the queue, callbacks beyond it are answered `503`.
+            dedup (TTLCache): Cache of the processed `(txn_id, status)` pairs, may be shared between ingestors.
+                Defaults to the last 100000 pairs of the last 24 hours.
+            max_body (int): Maximum body size in bytes, larger callbacks are answered `413`.
+            metrics (Metrics): Metrics sink. A new one is created by default.
+            max_retries (int): Number of times the events of a failing batch are queued again.
+            retry_backoff (float): Seconds before the first retry, doubled on every following one.
+            dead_letter (Callable): Coroutine function called with the events that exhausted their retries. By
+                default they are kept in `dead_letters`, up to `maxsize` of them.
+        """
+
+        self.verifier = WebhookVerifier(verifier) if isinstance(verifier, str) else verifier
+        self.maxsize = maxsize
+        self.dedup = _TTLCache(maxsize=100000, ttl=86400.0) if dedup is None else dedup
+        self.max_body = max_body
+        self.metrics = _Metrics() if metrics is None else metrics
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.dead_letter = dead_letter
+        self.dead_letters: _Deque[WebhookEvent] = _deque(maxlen=maxsize)
+        self._retries: "_Set[_asyncio.Future[None]]" = set()
+        self._queue: "_Optional[_asyncio.Queue[WebhookEvent]]" = None
+        self._in_flight: _Set[_Tuple[str, str]] = set()
+
+    @property
+    def queue(self) -> "_asyncio.Queue[WebhookEvent]":
+        """
+        Queue of verified events, created on first use inside the running event loop.
+
+        Returns:
+            asyncio.Queue: Queue.
+        """
+
+        if self._queue is None:
+            self._queue = _asyncio.Queue(self.maxsize)
+
+        return self._queue
+
+    def submit(self, body: _Body, content_type: _t.OptionalText = None) -> int:
+        """
+        Verify a callback and queue it.
+
+        Args:
+            body (bytes): Request body.
+            content_type (str): `Content-Type` header.
+
+        Returns:
+            int: HTTP status to answer: `200` when queued, already queued or already processed, `400` when
+                invalid, `503` when the queue is full.
+        """
+
+        try:
+            event = WebhookEvent(self.verifier.parse(body, content_type))
+        except _e.PlisioWebhookException:
+            self.metrics.incr("rejected")
+            return 400
+
+        if event.key in self._in_flight or self.dedup.get(event.key) is not _MISSING:
+            self.metrics.incr("duplicates")
+            return 200
+
+        try:
+            self.queue.put_nowait(event)
+        except _asyncio.QueueFull:
+            self.metrics.incr("overloaded")
+            return 503
+
+        self._in_flight.add(event.key)
+        self.metrics.incr("accepted")
+        return 200
+
+    async def get_batch(self, max_batch: int = 100, max_wait: float = 0.05) -> _List[WebhookEvent]:
+        """
+        Wait for events and take up to `max_batch` of them.
+
+        Args:
+            max_batch (int): Maximum batch size.
+            max_wait (float): Seconds to wait for more events after the first one.
+
+        Returns:
+            list: Events, at least one. Pass them to `complete` once handled.
+        """
+
+        queue = self.queue
+        batch = [await queue.get()]
+
+        loop = _asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+
+        while len(batch) < max_batch:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            try:
+                batch.append(await _asyncio.wait_for(queue.get(), remaining))
+            except _asyncio.TimeoutError:
+                break
+
+        return batch
+
+    def complete(self, batch: _List[WebhookEvent], processed: bool = True) -> None:
+        """
+        Mark a batch taken with `get_batch` as handled.
+
+        Args:
+            batch (list): Events.
+            processed (bool): Whether the batch was processed. Processed events are remembered as seen, the others
+                are retried or handed to `dead_letter`. `queue.join()` waits for them.
+        """
+
+        if not processed:
+            retry = _asyncio.ensure_future(self._retry(batch))
+            self._retries.add(retry)
+            retry.add_done_callback(self._retries.discard)
+            return
+
+        queue = self.queue
+        for event in batch:
+            self._in_flight.discard(event.key)
+            self.dedup.set(event.key, True)
+            queue.task_done()
+
+    async def _retry(self, batch: _List[WebhookEvent]) -> None:
+        """
+        Queue the events of a failed batch again after a backoff, or hand them to `dead_letter`.
+
+        Args:
+            batch (list): Events.
+        """
+
+        queue = self.queue
+        retry: _List[WebhookEvent] = []
+        dead: _List[WebhookEvent] = []
+        for event in batch:
+            event.attempts += 1
+            (retry if event.attempts <= self.max_retries else dead).append(event)
+
+        try:
+            if dead:
+                await self._dead_letter(dead)
+
+            if retry:
+                await _asyncio.sleep(self.retry_backoff * 2 ** (max(event.attempts for event in retry) - 1))
+
+            while retry:
+                await queue.put(retry[0])
+                retry.pop(0)
+                self.metrics.incr("retried")
+                queue.task_done()
+        finally:
+            for event in dead + retry:
+                self._in_flight.discard(event.key)
+                queue.task_done()
+
+    async def _dead_letter(self, events: _List[WebhookEvent]) -> None:
+        """
+        Hand events that exhausted their retries to `dead_letter`, or keep them in `dead_letters`.
+
+        Args:
+            events (list): Events.
+        """
+
+        self.metrics.incr("dead_lettered", len(events))
+        if self.dead_letter is None:
+            self.dead_letters.extend(events)
+            return
+
+        try:
+            await self.dead_letter(events)
+        except Exception:  # pylint: disable=broad-except
+            self.metrics.incr("dead_letter_errors")
+            self.dead_letters.extend(events)
+
+    async def consume(self, handler: BatchHandler, max_batch: int = 100, max_wait: float = 0.05) -> None:
+        """
+        Process events in batches until cancelled.
+
+        A failing batch is counted in `handler_errors`, its events are retried or handed to `dead_letter`.
+
+        Args:
+            handler (Callable): Coroutine function called with each batch.
+            max_batch (int): Maximum batch size.
+            max_wait (float): Seconds to wait for more events after the first one of a batch.
+        """
+
+        while True:
+            batch = await self.get_batch(max_batch, max_wait)
+            processed = False
+            try:
+                await handler(batch)
+            except Exception:  # pylint: disable=broad-except
+                self.metrics.incr("handler_errors")
+            else:
+                processed = True
+                self.metrics.incr("processed", len(batch))
+            finally:
+                self.complete(batch, processed)
+
+    def start(
+        self, handler: BatchHandler, workers: int = 1, max_batch: int = 100, max_wait: float = 0.05
+    ) -> _List["_asyncio.Task[None]"]:
+        """
+        Start consumer tasks.
+
+        Args:
+            handler (Callable): Coroutine function called with each batch.
+            workers (int): Number of consumers.
+            max_batch (int): Maximum batch size.
+            max_wait (float): Seconds to wait for more events after the first one of a batch.
+
+        Returns:
+            list: Consumer tasks, cancel them to stop after `queue.join()`.
+        """
+
+        return [_asyncio.ensure_future(self.consume(handler, max_batch, max_wait)) for _ in range(workers)]
+
+    async def __call__(self, scope: _Dict[str, _Any], receive: ASGIReceive, send: ASGISend) -> None:
+        """
+        Serve callbacks as an ASGI application.
+
+        Args:
+            scope (dict): Connection scope.
+            receive (Callable): Receive channel.
+            send (Callable): Send channel.
+        """
+
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            await self._send_status(send, 405)
+            return
+
+        content_type = None
+        for name, value in scope.get("headers", ()):
+            if name == b"content-type":
+                content_type = value.decode("latin-1")
+                break
+
+        chunks: _List[bytes] = []
+        size = 0
+        more = True
+        while more:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body:
+                self.metrics.incr("rejected")
+                await self._send_status(send, 413)
+                return
+
+            chunks.append(chunk)
+            more = message.get("more_body", False)
+
+        await self._send_status(send, self.submit(b"".join(chunks), content_type))
+
+    @staticmethod
+    async def _send_status(send: ASGISend, status: int) -> None:
+        """
+        Send an ASGI response made of a status and its reason phrase.
+
+        Args:
+            send (Callable): Send channel.
+            status (int): HTTP status.
+        """
+
+        await send({"type": "http.response.start", "status": status, "headers": _HEADERS})
+        await send({"type": "http.response.body", "body": _REASONS[status]})
+
+    async def aiohttp_handler(self, request: _Any) -> _Any:
+        """
+        Serve a callback from aiohttp, e.g. `app.router.add_post("/plisio", ingestor.aiohttp_handler)`.
+
+        Args:
+            request (aiohttp.web.Request): Request.
+
+        Returns:
+            aiohttp.web.Response: Response.
+        """
+
+        from aiohttp import web  # pylint: disable=import-outside-toplevel
+
+        if request.content_length is not None and request.content_length > self.max_body:
+            self.metrics.incr("rejected")
+            return web.Response(status=413, text=_REASONS[413].decode())
+
+        body = bytearray()
+        async for chunk in request.content.iter_chunked(self.max_body):
+            body += chunk
+            if len(body) > self.max_body:
+                self.metrics.incr("rejected")
+                return web.Response(status=413, text=_REASONS[413].decode())
+
+        status = self.submit(bytes(body), request.headers.get("Content-Type"))
+        return web.Response(status=status, text=_REASONS[status].decode())
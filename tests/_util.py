@@ -0,0 +1,41 @@
+"""
+Helpers shared by the tests.
+"""
+
+import os as _os
+import subprocess as _subprocess
+import sys as _sys
+from typing import List as _List
+
+SRC = _os.path.join(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))), "src")
+"""Source directory, put first on `PYTHONPATH` so the tree is tested without installing it."""
+
+
+def run_python(code: str) -> str:
+    """
+    Run code in a fresh interpreter importing plisio from the source tree.
+
+    Args:
+        code (str): Code.
+
+    Returns:
+        str: Standard output.
+    """
+
+    env = {**_os.environ, "PYTHONPATH": _os.pathsep.join(filter(None, [SRC, _os.environ.get("PYTHONPATH")]))}
+    return _subprocess.run([_sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+
+
+def imported_modules(statement: str) -> _List[str]:
+    """
+    Get the top-level modules loaded by an import statement in a fresh interpreter.
+
+    Args:
+        statement (str): Import statement.
+
+    Returns:
+        list: Top-level module names.
+    """
+
+    output = run_python(f"{statement}\nimport sys\nprint('\\n'.join(sorted({{m.split('.')[0] for m in sys.modules}})))")
+    return output.split()
@@ -0,0 +1,10 @@
+"""
+Test configuration: import plisio from the source tree.
+"""
+
+import sys as _sys
+
+from _util import SRC as _SRC
+
+if _SRC not in _sys.path:
+    _sys.path.insert(0, _SRC)
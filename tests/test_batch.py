@@ -0,0 +1,105 @@
+"""
+Packing of payouts into mass withdrawals and mapping of the outcomes back to the payouts.
+"""
+
+import asyncio
+
+import pytest
+
+from plisio import AsyncClient, Client
+from plisio.clients._batch import chunk_payouts
+from plisio.utils import encode_query
+
+OVERHEAD = 100
+
+
+def _length(chunk):
+    _, addresses, amounts = chunk
+    return OVERHEAD + len(encode_query({"to": addresses, "amount": amounts})) - len("to=&amount=")
+
+
+def test_max_payouts_boundary():
+    payouts = [(f"address{index}", index) for index in range(5)]
+
+    chunks = chunk_payouts(payouts, OVERHEAD, max_payouts=2, max_length=10000)
+
+    assert [indexes for indexes, _, _ in chunks] == [[0, 1], [2, 3], [4]]
+    assert chunks[0][1:] == (["address0", "address1"], [0, 1])
+
+
+def test_max_length_boundary():
+    payouts = [("a b", "0.5"), ("c", 1), ("d/e", "2.25")]
+    exact = _length(chunk_payouts(payouts, OVERHEAD, max_payouts=10, max_length=10000)[0])
+
+    [chunk] = chunk_payouts(payouts, OVERHEAD, max_payouts=10, max_length=exact)
+    assert _length(chunk) == exact
+
+    chunks = chunk_payouts(payouts, OVERHEAD, max_payouts=10, max_length=exact - 1)
+    assert [indexes for indexes, _, _ in chunks] == [[0, 1], [2]]
+    assert all(_length(chunk) <= exact - 1 for chunk in chunks)
+
+
+def test_payout_longer_than_max_length_is_sent_alone():
+    payouts = [("a", 1), ("x" * 500, 2), ("b", 3)]
+
+    chunks = chunk_payouts(payouts, OVERHEAD, max_payouts=10, max_length=200)
+
+    assert [indexes for indexes, _, _ in chunks] == [[0], [1], [2]]
+
+
+def test_max_payouts_must_be_positive():
+    with pytest.raises(ValueError):
+        chunk_payouts([("a", 1)], OVERHEAD, max_payouts=0, max_length=200)
+
+
+PAYOUTS = [(f"address{index}", index) for index in range(5)]
+
+
+class _BatchClient(Client):
+    """
+    Withdraw by echoing the chunk, failing the chunk holding `address2`.
+    """
+
+    def _withdraw_chunk(self, currency, type, to, amount, fee_plan, estimate_fee):
+        if "address2" in to:
+            raise ConnectionError("network down")
+        return {"fee": None, "withdraw": {"to": to}}
+
+
+class _AsyncBatchClient(AsyncClient):
+    """
+    Async variant of `_BatchClient`.
+    """
+
+    async def _withdraw_chunk(self, currency, type, to, amount, fee_plan, estimate_fee):
+        await asyncio.sleep(0.01 if "address0" in to else 0)
+        return _BatchClient._withdraw_chunk(self, currency, type, to, amount, fee_plan, estimate_fee)
+
+
+def _check_results(results):
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.kwargs for result in results] == [{"to": to, "amount": amount} for to, amount in PAYOUTS]
+    assert [result.chunk for result in results] == [0, 0, 1, 1, 2]
+    assert [result.ok for result in results] == [True, True, False, False, True]
+    assert isinstance(results[2].exception, ConnectionError)
+    assert results[3].result is None
+    assert results[4].result == {"to": ["address4"]}
+
+
+def test_withdraw_batch_maps_results_to_input_order():
+    client = _BatchClient("key")
+    results = client.withdraw_batch(PAYOUTS, "BTC", max_payouts=2)
+    client.close()
+
+    _check_results(results)
+
+
+def test_async_withdraw_batch_maps_results_to_input_order():
+    async def main():
+        client = _AsyncBatchClient("key")
+        try:
+            return await client.withdraw_batch(PAYOUTS, "BTC", max_payouts=2)
+        finally:
+            await client.aclose()
+
+    _check_results(asyncio.run(main()))
@@ -0,0 +1,54 @@
+"""
+Every codec reports invalid JSON as `ValueError`, so clients raise their own exceptions for it.
+"""
+
+import pytest
+
+from plisio import Client, exceptions
+from plisio.codecs import _raising_value_error, get_codec
+from plisio.transports import TransportResponse
+
+HTML = b"<html><body><h1>502 Bad Gateway</h1></body></html>"
+
+
+def _get_codec(name):
+    try:
+        return get_codec(name)
+    except ImportError:
+        return pytest.skip(f"{name} is not installed")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "ujson"])
+def test_loads_raises_value_error(name):
+    codec = _get_codec(name)
+
+    for body in (HTML, HTML.decode(), b"\xff\xfe"):
+        with pytest.raises(ValueError):
+            codec.loads(body)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "ujson"])
+@pytest.mark.parametrize(
+    "status, exception", [(200, exceptions.PlisioRequestException), (502, exceptions.PlisioAPIException)]
+)
+def test_client_wraps_invalid_json(name, status, exception):
+    client = Client("key", codec=_get_codec(name))
+    try:
+        with pytest.raises(exception):
+            client._handle_response(TransportResponse(status, {}, HTML))  # pylint: disable=protected-access
+    finally:
+        client.close()
+
+
+def test_foreign_decode_error_becomes_value_error():
+    class DecodeError(Exception):
+        pass
+
+    def loads(data):
+        raise DecodeError("bad")
+
+    with pytest.raises(ValueError) as info:
+        _raising_value_error(loads, DecodeError)(b"{")
+
+    assert isinstance(info.value.__cause__, DecodeError)
+    assert _raising_value_error(loads, ValueError) is loads
@@ -0,0 +1,115 @@
+"""
+Idempotent invoice creation across processes, and blocking stores kept off the event loop.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from plisio import AsyncClient, Client
+from plisio.idempotency import MemoryStore, SQLiteStore
+
+
+class _InvoiceHandler(BaseHTTPRequestHandler):
+    """
+    Create a numbered invoice per request, slowly.
+    """
+
+    created = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        with self.lock:
+            type(self).created += 1
+            number = self.created
+        time.sleep(0.3)
+
+        body = json.dumps({"status": "success", "data": {"txn_id": f"txn-{number}"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # type: ignore[no-untyped-def]
+        pass
+
+
+@pytest.fixture()
+def base_url():
+    _InvoiceHandler.created = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _InvoiceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/api"
+    server.shutdown()
+    server.server_close()
+
+
+def _create_invoice(base_url, path):
+    client = type("LocalClient", (Client,), {"BASE_URL": base_url})("key", idempotency=SQLiteStore(path))
+    try:
+        return client.invoice(order_name="test", order_number="order-42", amount=1, currency="BTC")["data"]
+    finally:
+        client.close()
+
+
+def test_processes_share_one_invoice(base_url, tmp_path):
+    path = str(tmp_path / "idempotency.db")
+    SQLiteStore(path).close()
+
+    with ProcessPoolExecutor(4) as executor:
+        results = list(executor.map(_create_invoice, [base_url] * 4, [path] * 4))
+
+    assert _InvoiceHandler.created == 1
+    assert results == [{"txn_id": "txn-1"}] * 4
+
+
+def test_failed_call_releases_reservation():
+    store = MemoryStore()
+
+    assert store.reserve("key")
+    assert not store.reserve("key")
+    assert store.get("key") is None
+
+    store.release("key")
+    assert store.reserve("key")
+
+    store.set("key", {"data": 1})
+    store.release("key")
+    assert store.get("key") == {"data": 1}
+    assert not store.reserve("key")
+
+
+def test_async_client_runs_blocking_store_in_thread(base_url, tmp_path):
+    store = SQLiteStore(str(tmp_path / "idempotency.db"))
+    threads = []
+    get = store.get
+
+    def recording_get(key):
+        threads.append(threading.current_thread())
+        return get(key)
+
+    store.get = recording_get  # type: ignore[method-assign]
+
+    async def main():
+        client = type("LocalClient", (AsyncClient,), {"BASE_URL": base_url})("key", idempotency=store)
+        try:
+            return await asyncio.gather(
+                *(
+                    client.invoice(order_name="test", order_number="order-42", amount=1, currency="BTC")
+                    for _ in range(3)
+                )
+            )
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(main())
+
+    assert _InvoiceHandler.created == 1
+    assert all(result == results[0] for result in results)
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,28 @@
+"""
+Import-time guards: `import plisio` stays light, and each client only imports its own HTTP library.
+"""
+
+import pytest
+
+from _util import imported_modules
+
+HTTP_LIBRARIES = {"aiohttp", "httpx", "requests"}
+
+
+@pytest.mark.parametrize(
+    "statement, allowed",
+    [
+        ("import plisio", set()),
+        ("import plisio.webhooks", set()),
+        ("import plisio.idempotency", set()),
+        ("import plisio.ledger", set()),
+        ("import plisio.watcher", set()),
+        ("from plisio import Client", {"requests"}),
+        ("from plisio import AsyncClient", {"aiohttp"}),
+    ],
+)
+def test_lazy_imports(statement, allowed):
+    modules = set(imported_modules(statement))
+
+    assert modules & HTTP_LIBRARIES <= allowed
+    assert "pydantic" not in modules
@@ -0,0 +1,139 @@
+"""
+Ledger filters and incremental sync.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from plisio.clients._base import BaseClient
+from plisio.enums import Currencies, TransactionStatus
+from plisio.ledger import Ledger
+
+OPERATIONS = [
+    {"id": "1", "status": "completed", "currency": "BTC", "type": "invoice", "shop_id": 5, "created_at_utc": 10},
+    {"id": "2", "status": "new", "currency": "ETH", "type": "invoice", "shop_id": 6, "created_at_utc": 20},
+]
+
+
+def test_enum_filters_match_api_codes():
+    ledger = Ledger()
+    ledger.upsert(OPERATIONS)
+
+    assert [operation["id"] for operation in ledger.query(currency=Currencies.BTC)] == ["1"]
+    assert ledger.count(currency=[Currencies.BTC, Currencies.ETH]) == 2
+    assert ledger.count(status=TransactionStatus.COMPLETED, shop_id=5) == 1
+
+
+class _FakeClient:
+    """
+    Serve stored operations newest first, two per page, optionally failing on one page.
+    """
+
+    _get_operations = staticmethod(BaseClient._get_operations)
+    _get_next_page = staticmethod(BaseClient._get_next_page)
+
+    def __init__(self, operations, fail_on=None):
+        self.operations = sorted(operations, key=lambda operation: -operation["created_at_utc"])
+        self.fail_on = fail_on
+        self.pages = []
+
+    def transactions(self, page, limit, shop_id=None):
+        self.pages.append(page)
+        if page == self.fail_on:
+            raise ConnectionError("network down")
+
+        operations = [operation for operation in self.operations if shop_id in (None, operation["shop_id"])]
+        count = max(1, -(-len(operations) // 2))
+        start = (page - 1) * 2
+        data = {"operations": operations[start:][:2], "_meta": {"currentPage": page, "pageCount": count}}
+        return {"status": "success", "data": data}
+
+
+def _operations(shop_id, times):
+    return [
+        {
+            "id": f"{shop_id}-{time}",
+            "status": "completed",
+            "type": "invoice",
+            "shop_id": shop_id,
+            "created_at_utc": time,
+        }
+        for time in times
+    ]
+
+
+def test_interrupted_sync_is_started_over():
+    ledger = Ledger(overlap=0)
+    client = _FakeClient(_operations(1, range(1000, 7000, 1000)), fail_on=2)
+
+    with pytest.raises(ConnectionError):
+        ledger.sync(client, limit=2)
+    assert ledger.count() == 2
+    assert ledger.get_sync_mark() is None
+
+    client.fail_on = None
+    client.pages = []
+    ledger.sync(client, limit=2)
+
+    assert client.pages == [1, 2, 3]
+    assert ledger.count() == 6
+    assert ledger.get_sync_mark() == 6000
+
+
+def test_sync_mark_is_kept_per_filter_set():
+    ledger = Ledger(overlap=0)
+    client = _FakeClient(_operations(1, range(5000, 10000, 1000)) + _operations(2, range(1000, 5000, 1000)))
+
+    ledger.sync(client, limit=2, shop_id=1)
+    client.pages = []
+    ledger.sync(client, limit=2, shop_id=2)
+
+    assert client.pages == [1, 2]
+    assert ledger.count(shop_id=2) == 4
+    assert ledger.get_sync_mark(shop_id=1) == 9000
+    assert ledger.get_sync_mark(shop_id=2) == 4000
+
+    ledger.sync(client, limit=2)
+    assert ledger.get_sync_mark(shop_id=2) == 9000
+
+
+class _FakeAsyncClient(_FakeClient):
+    """
+    Async variant of `_FakeClient`.
+    """
+
+    async def transactions(self, page, limit, shop_id=None):  # type: ignore[override]
+        return super().transactions(page, limit, shop_id)
+
+
+def test_async_sync_keeps_loop_responsive():
+    ledger = Ledger()
+    upsert = ledger.upsert
+
+    def slow_upsert(operations):
+        time.sleep(0.2)
+        return upsert(operations)
+
+    ledger.upsert = slow_upsert  # type: ignore[method-assign]
+
+    async def main():
+        gaps = []
+
+        async def tick():
+            while True:
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                gaps.append(time.perf_counter() - started)
+
+        ticker = asyncio.ensure_future(tick())
+        written = await ledger.async_sync(_FakeAsyncClient(_operations(1, range(1000, 5000, 1000))), limit=2)
+        ticker.cancel()
+        return written, gaps
+
+    written, gaps = asyncio.run(main())
+
+    assert written == 4
+    assert len(gaps) > 20
+    assert max(gaps) < 0.1
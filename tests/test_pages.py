@@ -0,0 +1,99 @@
+"""
+Paginated transactions: prefetched pages keep the caller's timeout, parallel requests are cancelled when
+iteration stops.
+"""
+
+import asyncio
+
+import pytest
+
+from plisio import AsyncClient, Client
+
+
+class _TimeoutClient(Client):
+    """
+    Serve three pages, recording the read timeout each one was fetched with.
+    """
+
+    def __init__(self):
+        super().__init__("key")
+        self.timeouts = {}
+
+    def transactions(self, page=None, **params):
+        self.timeouts[page] = self._get_timeout("operations").read
+        data = {"operations": [{"id": str(page)}], "_meta": {"currentPage": page, "pageCount": 3}}
+        return {"status": "success", "data": data}
+
+
+def test_prefetched_pages_keep_timeout_override():
+    client = _TimeoutClient()
+    with client.use_timeout(1.5):
+        operations = list(client.iter_transactions(prefetch=True))
+    client.close()
+
+    assert [operation["id"] for operation in operations] == ["1", "2", "3"]
+    assert client.timeouts == {1: 1.5, 2: 1.5, 3: 1.5}
+
+
+def test_mapped_calls_keep_timeout_override():
+    client = _TimeoutClient()
+    with client.use_timeout(2.5):
+        results = list(client.map("transactions", [{"page": page} for page in range(1, 4)], max_workers=2))
+    client.close()
+
+    assert len(results) == 3
+    assert client.timeouts == {1: 2.5, 2: 2.5, 3: 2.5}
+
+
+class _PagesClient(AsyncClient):
+    """
+    Serve ten pages, page 3 failing if asked to and pages after it hanging.
+    """
+
+    def __init__(self, fail=False):
+        super().__init__("key")
+        self.fail = fail
+        self.cancelled = []
+
+    async def transactions(self, page=None, **params):
+        try:
+            await asyncio.sleep(0 if page <= 3 else 10)
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+
+        if page == 3 and self.fail:
+            raise ConnectionError("network down")
+
+        data = {"operations": [{"id": str(page)}], "_meta": {"currentPage": page, "pageCount": 10}}
+        return {"status": "success", "data": data}
+
+
+def test_closing_pages_cancels_requests():
+    async def main():
+        client = _PagesClient()
+        pages = client.aiter_transaction_pages(concurrency=4)
+        received = [await pages.__anext__() for _ in range(3)]
+        await pages.aclose()
+        await client.aclose()
+        return received, client.cancelled
+
+    received, cancelled = asyncio.run(main())
+
+    assert received == [[{"id": "1"}], [{"id": "2"}], [{"id": "3"}]]
+    assert sorted(cancelled) == [4, 5]
+
+
+def test_failed_export_cancels_requests():
+    async def main():
+        client = _PagesClient(fail=True)
+        exported = []
+        with pytest.raises(ConnectionError):
+            await client.export_transactions(exported.extend, concurrency=4)
+        await client.aclose()
+        return exported, client.cancelled
+
+    exported, cancelled = asyncio.run(main())
+
+    assert exported == [{"id": "1"}, {"id": "2"}]
+    assert sorted(cancelled) == [4, 5]
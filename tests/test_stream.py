@@ -0,0 +1,78 @@
+"""
+Incremental parsing of the `operations` array by `ArrayStream`, whatever the chunk boundaries.
+"""
+
+import json
+
+import pytest
+
+from plisio._stream import ArrayStream
+from plisio.exceptions import PlisioRequestException
+
+OPERATIONS = [
+    {"id": "1", "comment": 'quote " backslash \\ slash / brackets }]{[', "tags": []},
+    {"id": "2", "comment": "café € \U0001d11e 日本", "nested": {"a": [1, {"b": "}"}]}},
+    {"id": "3", "comment": "\\u escapes \\n", "control": "\t\n", "operations": [{"id": "inner"}]},
+]
+
+
+def _document(operations, **extra):
+    return {"status": "success", "data": {"operations": operations, "_meta": {"pageCount": 1}, **extra}}
+
+
+def _encode(document, ensure_ascii):
+    return json.dumps(document, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def _parse(chunks):
+    stream = ArrayStream("operations", json.loads)
+    items = []
+    for chunk in chunks:
+        items += stream.feed(chunk)
+    return items, stream.close()
+
+
+def _splits(body):
+    yield [body]
+    yield [body[index : index + 1] for index in range(len(body))]  # noqa: E203
+    for cut in range(1, len(body)):
+        yield [body[:cut], body[cut:]]
+
+
+@pytest.mark.parametrize("ensure_ascii", [False, True])
+def test_chunk_boundaries_inside_escapes_and_multibyte_characters(ensure_ascii):
+    body = _encode(_document(OPERATIONS), ensure_ascii)
+
+    for chunks in _splits(body):
+        items, rest = _parse(chunks)
+        assert items == OPERATIONS
+        assert rest == _document([])
+
+
+def test_empty_operations():
+    body = _encode(_document([]), False)
+
+    for chunks in _splits(body):
+        items, rest = _parse(chunks)
+        assert items == []
+        assert rest == _document([])
+
+
+def test_only_first_operations_array_is_streamed():
+    later = {"summary": {"operations": [{"id": "later"}]}}
+    body = _encode(_document(OPERATIONS, **later), False)
+
+    for chunks in _splits(body):
+        items, rest = _parse(chunks)
+        assert items == OPERATIONS
+        assert rest == _document([], **later)
+
+
+@pytest.mark.parametrize("cut", [1, 2, 10, 40, 120, 200])
+def test_truncated_input_raises_on_close(cut):
+    body = _encode(_document(OPERATIONS), False)
+    stream = ArrayStream("operations", json.loads)
+    stream.feed(body[:-cut])
+
+    with pytest.raises(PlisioRequestException):
+        stream.close()
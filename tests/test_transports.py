@@ -0,0 +1,87 @@
+"""
+Every transport delivers query parameters exactly as passed, encoded once.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from plisio import AsyncClient, Client
+
+PARAMS = {
+    "order_name": "My order & co +1",
+    "order_number": "1",
+    "currency": "BTC",
+    "amount": "0.1",
+    "callback_url": "https://shop.example/cb?json=true",
+    "email": "a@b.co",
+    "description": "ünïcode 100%",
+}
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """
+    Answer every GET with the decoded query parameters it received.
+    """
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        query = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        body = json.dumps({"status": "success", "data": query}).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # type: ignore[no-untyped-def]
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/api"
+    server.shutdown()
+    server.server_close()
+
+
+def _get_transport(name):
+    if "httpx" in name.lower():
+        pytest.importorskip("httpx")
+
+    from plisio import transports  # pylint: disable=import-outside-toplevel
+
+    return getattr(transports, name)()
+
+
+def _check(result):
+    received = result["data"]
+    assert {key: received.get(key) for key in PARAMS} == PARAMS
+
+
+@pytest.mark.parametrize("transport", ["RequestsTransport", "HttpxTransport"])
+def test_sync_transport_encodes_once(base_url, transport):
+    client = type("EchoClient", (Client,), {"BASE_URL": base_url})("key", transport=_get_transport(transport))
+    try:
+        _check(client.invoice(**PARAMS))
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize("transport", ["AiohttpTransport", "AsyncHttpxTransport"])
+def test_async_transport_encodes_once(base_url, transport):
+    async def main():
+        client = type("EchoClient", (AsyncClient,), {"BASE_URL": base_url})("key", transport=_get_transport(transport))
+        try:
+            _check(await client.invoice(**PARAMS))
+        finally:
+            await client.aclose()
+
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Scheduling of `InvoiceWatcher`: deadline order, concurrency budget and removal at terminal statuses.
+"""
+
+import asyncio
+
+from plisio.metrics import Metrics
+from plisio.watcher import InvoiceWatcher
+
+
+class _FakeClient:
+    """
+    Answer `transaction_details` with scripted statuses, recording the polls and the polls in flight.
+    """
+
+    def __init__(self, statuses, delay=0.0):
+        self.statuses = {txn_id: list(script) for txn_id, script in statuses.items()}
+        self.delay = delay
+        self.metrics = Metrics()
+        self.polls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def transaction_details(self, txn_id):
+        self.polls.append(txn_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        script = self.statuses[txn_id]
+        status = script.pop(0) if len(script) > 1 else script[0]
+        return {"status": "success", "data": {"txn_id": txn_id, "status": status}}
+
+
+INTERVALS = {"new": (0.01, 0.01), "pending": (0.03, 0.03), "mismatch": (0.05, 0.05)}
+
+
+def test_polls_run_in_deadline_order():
+    async def main():
+        client = _FakeClient({"a": ["completed"], "b": ["completed"], "c": ["completed"]})
+        watcher = InvoiceWatcher(client, intervals=INTERVALS, jitter=0, concurrency=1)
+        futures = [watcher.watch("a", "mismatch"), watcher.watch("b", "new"), watcher.watch("c", "pending")]
+
+        async with watcher:
+            await asyncio.wait_for(asyncio.gather(*futures), 1)
+
+        return client.polls
+
+    assert asyncio.run(main()) == ["b", "c", "a"]
+
+
+def test_concurrency_stays_within_budget():
+    async def main():
+        statuses = {f"txn{index}": ["new", "pending", "completed"] for index in range(20)}
+        client = _FakeClient(statuses, delay=0.01)
+        watcher = InvoiceWatcher(client, intervals=INTERVALS, jitter=0, concurrency=3)
+        futures = [watcher.watch(txn_id) for txn_id in statuses]
+
+        async with watcher:
+            await asyncio.wait_for(asyncio.gather(*futures), 5)
+
+        return client
+
+    client = asyncio.run(main())
+
+    assert len(client.polls) == 60
+    assert client.max_in_flight == 3
+
+
+def test_terminal_status_leaves_the_heap():
+    async def main():
+        changes = []
+        client = _FakeClient({"a": ["new", "new", "pending", "completed"], "b": ["new"]})
+        watcher = InvoiceWatcher(client, on_change=changes.append, intervals=INTERVALS, jitter=0)
+        future = watcher.watch("a", "new")
+        watcher.watch("b", "new")
+
+        async with watcher:
+            result = await asyncio.wait_for(future, 1)
+            polls = client.polls.count("a")
+            await asyncio.sleep(0.1)
+
+            assert "a" not in watcher
+            assert "b" in watcher
+            assert all(txn_id != "a" for _, _, txn_id in watcher._heap)
+            assert client.polls.count("a") == polls
+
+        return result, changes, polls, client.metrics.snapshot()["counters"]
+
+    result, changes, polls, counters = asyncio.run(main())
+
+    assert result["data"]["status"] == "completed"
+    assert [(change.previous, change.status) for change in changes] == [("new", "pending"), ("pending", "completed")]
+    assert changes[-1].terminal
+    assert polls == 4
+    assert counters["watch_changes"] == 2
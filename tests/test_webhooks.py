@@ -0,0 +1,80 @@
+"""
+Deduplication and retries of `WebhookIngestor`: acknowledged callbacks are processed once, or dead-lettered.
+"""
+
+import asyncio
+import json
+
+from plisio.webhooks import WebhookIngestor, WebhookVerifier
+
+API_KEY = "key"
+
+
+def _body(status="completed"):
+    payload = {"txn_id": "abc", "status": status, "amount": "1"}
+    payload["verify_hash"] = WebhookVerifier(API_KEY).sign_json(payload)
+    return json.dumps(payload).encode()
+
+
+def test_failed_batch_is_retried_once_processed():
+    async def main():
+        ingestor = WebhookIngestor(API_KEY, retry_backoff=0.05)
+        calls = []
+
+        async def handler(batch):
+            calls.append([event.txn_id for event in batch])
+            if len(calls) == 1:
+                raise RuntimeError("database down")
+
+        assert ingestor.submit(_body()) == 200
+        assert ingestor.submit(_body()) == 200
+        assert ingestor.queue.qsize() == 1
+
+        [consumer] = ingestor.start(handler, max_wait=0)
+        while not calls:
+            await asyncio.sleep(0)
+
+        assert ingestor.submit(_body()) == 200
+        await ingestor.queue.join()
+
+        assert ingestor.submit(_body()) == 200
+        assert ingestor.queue.qsize() == 0
+
+        consumer.cancel()
+        return calls, ingestor.metrics.snapshot()["counters"]
+
+    calls, counters = asyncio.run(main())
+
+    assert calls == [["abc"], ["abc"]]
+    assert counters["accepted"] == 1
+    assert counters["duplicates"] == 3
+    assert counters["handler_errors"] == 1
+    assert counters["retried"] == 1
+    assert counters["processed"] == 1
+
+
+def test_exhausted_retries_go_to_dead_letter():
+    async def main():
+        dead = []
+
+        async def dead_letter(events):
+            dead.extend(event.txn_id for event in events)
+
+        async def handler(batch):
+            raise RuntimeError("database down")
+
+        ingestor = WebhookIngestor(API_KEY, max_retries=2, retry_backoff=0, dead_letter=dead_letter)
+        assert ingestor.submit(_body()) == 200
+
+        [consumer] = ingestor.start(handler, max_wait=0)
+        await ingestor.queue.join()
+        consumer.cancel()
+        return dead, ingestor.metrics.snapshot()["counters"]
+
+    dead, counters = asyncio.run(main())
+
+    assert dead == ["abc"]
+    assert counters["handler_errors"] == 3
+    assert counters["retried"] == 2
+    assert counters["dead_lettered"] == 1
+    assert "processed" not in counters